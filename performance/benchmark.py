@@ -60,6 +60,10 @@ class QuoteSchema(Schema):
         return data
 
 
+class DedupedQuoteSchema(QuoteSchema):
+    author = fields.Nested(AuthorSchema, validate=must_not_be_blank, dedupe='share')
+
+
 class Author(object):
     def __init__(self, id, first, last, book_count, age, address):
         self.id = id
@@ -85,8 +89,9 @@ class Quote(object):
         self.col_number = col_number
 
 
-def run_timeit(quotes, iterations, repeat, profile=False):
-    quotes_schema = QuoteSchema(many=True)
+def run_timeit(quotes, iterations, repeat, profile=False, dedupe_nested=False):
+    schema_class = DedupedQuoteSchema if dedupe_nested else QuoteSchema
+    quotes_schema = schema_class(many=True)
     if profile:
         profile = cProfile.Profile()
         profile.enable()
@@ -121,24 +126,40 @@ def main():
         '--object-count', type=int, default=20,
         help='Number of objects to dump.',
     )
+    parser.add_argument(
+        '--author-count', type=int, default=None,
+        help='Number of distinct authors shared by the objects. Defaults to one '
+             'author per object.',
+    )
+    parser.add_argument(
+        '--dedupe-nested', action='store_true',
+        help='Whether or not to serialize each distinct author only once per dump.',
+    )
     parser.add_argument(
         '--profile', action='store_true',
         help='Whether or not to profile Marshmallow while running the benchmark.',
     )
     args = parser.parse_args()
 
+    authors = [
+        Author(i, 'Foo', 'Bar', 42, 66, '123 Fake St')
+        for i in range(args.author_count or args.object_count)
+    ]
     quotes = []
 
     for i in range(args.object_count):
         quotes.append(
             Quote(
-                i, Author(i, 'Foo', 'Bar', 42, 66, '123 Fake St'),
+                i, authors[i % len(authors)],
                 'Hello World', time.time(), 'The World', 34, 3, 70,
             ),
         )
 
     print('Benchmark Result: {0:.2f} usec/dump'.format(
-        run_timeit(quotes, args.iterations, args.repeat, profile=args.profile),
+        run_timeit(
+            quotes, args.iterations, args.repeat, profile=args.profile,
+            dedupe_nested=args.dedupe_nested,
+        ),
     ))
 
 
@@ -0,0 +1,100 @@
+"""Benchmark for datetime parsing and formatting.
+
+Compares marshmallow's native ISO8601 parser against the parsing strategies
+it replaces (``dateutil.parser.isoparse`` and regex + ``strptime``), and
+compiled custom formats against ``strptime``/``strftime``.
+"""
+
+from __future__ import print_function, unicode_literals, division
+
+import argparse
+import datetime as dt
+import gc
+import timeit
+
+from marshmallow import fields, utils
+
+try:
+    from dateutil import parser as dateutil_parser
+except ImportError:
+    dateutil_parser = None
+
+
+SAMPLES = [
+    '2013-11-10T01:23:45',
+    '2013-11-10T01:23:45.123456',
+    '2013-11-10T01:23:45Z',
+    '2013-11-10T01:23:45.123456+00:00',
+    '2013-11-10T01:23:45-06:00',
+    '2013-11-10 01:23:45.12+0530',
+]
+
+
+def regex_strptime(value):
+    if not utils._iso8601_datetime_re.match(value):
+        raise ValueError('Not a valid ISO8601-formatted datetime string')
+    return dt.datetime.strptime(value[:19], '%Y-%m-%dT%H:%M:%S')
+
+
+def run_timeit(func, values, iterations, repeat):
+    gc.collect()
+    best = min(timeit.repeat(
+        lambda: [func(value) for value in values],
+        'gc.enable()',
+        number=iterations,
+        repeat=repeat,
+    ))
+    return best * 1e6 / (iterations * len(values))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks ISO8601 parsing.')
+    parser.add_argument(
+        '--iterations', type=int, default=10000,
+        help='Number of iterations to run per test.',
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=5,
+        help='Number of times to repeat the performance test.  The minimum will '
+             'be used.',
+    )
+    args = parser.parse_args()
+
+    field = fields.DateTime()
+    candidates = [
+        ('utils.from_iso_datetime', utils.from_iso_datetime),
+        ('fields.DateTime.deserialize', field.deserialize),
+    ]
+    if dateutil_parser is not None:
+        candidates.append(('dateutil.parser.isoparse', dateutil_parser.isoparse))
+    # The strptime fallback only understands the 'T' separator
+    candidates.append((
+        'regex + strptime (lossy)',
+        lambda value: regex_strptime(value.replace(' ', 'T')),
+    ))
+
+    for name, func in candidates:
+        usec = run_timeit(func, SAMPLES, args.iterations, args.repeat)
+        print('{0:<30} {1:.2f} usec/parse'.format(name, usec))
+
+    custom_format = '%Y%m%d%H%M%S'
+    value = dt.datetime(2013, 11, 10, 1, 23, 45)
+    formatted = [value.strftime(custom_format)]
+    compiled = [
+        ('datetime.strptime', lambda s: dt.datetime.strptime(s, custom_format)),
+        ('utils.compile_strptime', utils.compile_strptime(custom_format)),
+    ]
+    for name, func in compiled:
+        usec = run_timeit(func, formatted, args.iterations, args.repeat)
+        print('{0:<30} {1:.2f} usec/parse'.format(name, usec))
+    compiled = [
+        ('datetime.strftime', lambda d: d.strftime(custom_format)),
+        ('utils.compile_strftime', utils.compile_strftime(custom_format)),
+    ]
+    for name, func in compiled:
+        usec = run_timeit(func, [value], args.iterations, args.repeat)
+        print('{0:<30} {1:.2f} usec/format'.format(name, usec))
+
+
+if __name__ == '__main__':
+    main()
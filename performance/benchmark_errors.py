@@ -0,0 +1,137 @@
+"""Benchmark for loading data in which a share of the rows is invalid.
+
+Every invalid row fails in a different way (a missing required field, a
+failing validator, a bad list item, an invalid nested object, ...) so that the
+cost of reporting errors dominates the run.
+"""
+
+from __future__ import print_function, unicode_literals, division
+
+import argparse
+import cProfile
+import gc
+import timeit
+
+from marshmallow import Schema, fields, validate, ValidationError
+
+
+class AddressSchema(Schema):
+    street = fields.Str(required=True)
+    city = fields.Str(required=True, validate=validate.Length(min=1, max=40))
+    zip_code = fields.Str(validate=validate.Regexp(r'^\d{5}$'))
+
+
+class UserSchema(Schema):
+    name = fields.Str(required=True, validate=validate.Length(min=1, max=50))
+    email = fields.Email(required=True)
+    age = fields.Int(validate=validate.Range(min=0, max=150))
+    role = fields.Str(validate=validate.OneOf(['admin', 'staff', 'guest']))
+    scores = fields.List(fields.Int(validate=validate.Range(min=0, max=100)))
+    address = fields.Nested(AddressSchema)
+
+
+VALID_ROW = {
+    'name': 'Monty',
+    'email': 'monty@python.org',
+    'age': 42,
+    'role': 'staff',
+    'scores': [1, 2, 3],
+    'address': {'street': '1 Main St', 'city': 'Springfield', 'zip_code': '12345'},
+}
+
+INVALID_CHANGES = [
+    {'name': None},
+    {'email': 'not-an-email'},
+    {'age': -1},
+    {'age': 'abc'},
+    {'role': 'owner'},
+    {'scores': [1, 200, 'x']},
+    {'address': {'city': ''}},
+]
+
+
+def make_rows(count, invalid_ratio):
+    rows = []
+    invalid_every = int(round(1 / invalid_ratio)) if invalid_ratio else 0
+    for i in range(count):
+        row = dict(VALID_ROW)
+        if invalid_every and i % invalid_every == 0:
+            row.update(INVALID_CHANGES[(i // invalid_every) % len(INVALID_CHANGES)])
+            if i % 2:
+                del row['name']
+        rows.append(row)
+    return rows
+
+
+def load(schema, rows):
+    try:
+        schema.load(rows)
+    except ValidationError as error:
+        return error.messages
+
+
+def validate(schema, rows):
+    return schema.validate(rows)
+
+
+def run_timeit(rows, iterations, repeat, profile=False, validate_only=False):
+    schema = UserSchema(many=True)
+    func = validate if validate_only else load
+    if profile:
+        profile = cProfile.Profile()
+        profile.enable()
+
+    gc.collect()
+    best = min(timeit.repeat(
+        lambda: func(schema, rows),
+        'gc.enable()',
+        number=iterations,
+        repeat=repeat,
+    ))
+    if profile:
+        profile.disable()
+        profile.dump_stats('marshmallow.pprof')
+
+    return best * 1e6 / (iterations * len(rows))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks loading invalid data.')
+    parser.add_argument(
+        '--iterations', type=int, default=20,
+        help='Number of iterations to run per test.',
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=5,
+        help='Number of times to repeat the performance test.  The minimum will '
+             'be used.',
+    )
+    parser.add_argument(
+        '--object-count', type=int, default=1000,
+        help='Number of rows to load.',
+    )
+    parser.add_argument(
+        '--invalid-ratio', type=float, default=0.3,
+        help='Share of rows that fail validation.',
+    )
+    parser.add_argument(
+        '--validate', action='store_true',
+        help='Whether or not to only validate the rows with Schema.validate.',
+    )
+    parser.add_argument(
+        '--profile', action='store_true',
+        help='Whether or not to profile Marshmallow while running the benchmark.',
+    )
+    args = parser.parse_args()
+
+    rows = make_rows(args.object_count, args.invalid_ratio)
+    print('Benchmark Result: {0:.2f} usec/row'.format(
+        run_timeit(
+            rows, args.iterations, args.repeat, profile=args.profile,
+            validate_only=args.validate,
+        ),
+    ))
+
+
+if __name__ == '__main__':
+    main()
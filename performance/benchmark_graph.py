@@ -0,0 +1,137 @@
+"""Benchmark for dumping and loading objects that share nested objects.
+
+Many orders reference a few vendors. Compares serializing every occurrence of
+a vendor in full, deduplicating them (``Nested(dedupe=...)``) and emitting
+references to them (``Nested(reference=...)``).
+"""
+
+from __future__ import print_function, unicode_literals, division
+
+import argparse
+import cProfile
+import gc
+import json
+import timeit
+
+from marshmallow import Schema, fields
+
+
+class AddressSchema(Schema):
+    street = fields.Str()
+    city = fields.Str()
+    zip_code = fields.Str()
+    country = fields.Str()
+
+
+class VendorSchema(Schema):
+    id = fields.Int()
+    name = fields.Str()
+    email = fields.Email()
+    website = fields.URL()
+    rating = fields.Float()
+    tags = fields.List(fields.Str())
+    address = fields.Nested(AddressSchema)
+
+
+class OrderSchema(Schema):
+    id = fields.Int()
+    quantity = fields.Int()
+    total = fields.Float()
+    vendor = fields.Nested(VendorSchema)
+
+
+class DedupedOrderSchema(OrderSchema):
+    vendor = fields.Nested(VendorSchema, dedupe='share')
+
+
+class ReferencedOrderSchema(OrderSchema):
+    vendor = fields.Nested(VendorSchema, reference='id')
+
+
+SCHEMAS = [
+    ('full', OrderSchema),
+    ('dedupe', DedupedOrderSchema),
+    ('reference', ReferencedOrderSchema),
+]
+
+
+def make_orders(order_count, vendor_count):
+    vendors = [
+        {
+            'id': i,
+            'name': 'Vendor {0}'.format(i),
+            'email': 'sales@vendor{0}.example.com'.format(i),
+            'website': 'https://vendor{0}.example.com/'.format(i),
+            'rating': 4.5,
+            'tags': ['wholesale', 'hardware', 'tools'],
+            'address': {
+                'street': '{0} Main St'.format(i),
+                'city': 'Springfield',
+                'zip_code': '12345',
+                'country': 'US',
+            },
+        }
+        for i in range(vendor_count)
+    ]
+    return [
+        {'id': i, 'quantity': 3, 'total': 19.99, 'vendor': vendors[i % vendor_count]}
+        for i in range(order_count)
+    ]
+
+
+def best_time(func, iterations, repeat):
+    gc.collect()
+    best = min(timeit.repeat(func, 'gc.enable()', number=iterations, repeat=repeat))
+    return best * 1e6 / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks dumping shared nested objects.')
+    parser.add_argument(
+        '--iterations', type=int, default=20,
+        help='Number of iterations to run per test.',
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=5,
+        help='Number of times to repeat the performance test.  The minimum will '
+             'be used.',
+    )
+    parser.add_argument(
+        '--object-count', type=int, default=1000,
+        help='Number of orders to dump.',
+    )
+    parser.add_argument(
+        '--vendor-count', type=int, default=10,
+        help='Number of distinct vendors shared by the orders.',
+    )
+    parser.add_argument(
+        '--profile', action='store_true',
+        help='Whether or not to profile Marshmallow while running the benchmark.',
+    )
+    args = parser.parse_args()
+
+    orders = make_orders(args.object_count, args.vendor_count)
+    if args.profile:
+        profile = cProfile.Profile()
+        profile.enable()
+    for name, schema_class in SCHEMAS:
+        schema = schema_class(many=True)
+        data = schema.dump(orders)
+        encoded = json.dumps(data)
+        print('{0} dump: {1:.2f} usec/dump'.format(
+            name, best_time(lambda: schema.dump(orders), args.iterations, args.repeat),
+        ))
+        print('{0} encode: {1:.2f} usec/dump'.format(
+            name, best_time(lambda: json.dumps(data), args.iterations, args.repeat),
+        ))
+        print('{0} load: {1:.2f} usec/load'.format(
+            name, best_time(lambda: schema.load(data), args.iterations, args.repeat),
+        ))
+        print('{0} size: {1} bytes'.format(name, len(encoded)))
+    if args.profile:
+        profile.disable()
+        profile.dump_stats('marshmallow.pprof')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""Benchmark for the URL and Email validators.
+
+Measures throughput on typical values and the time taken by adversarial
+values that make the regexes scan and backtrack over long inputs.
+"""
+
+from __future__ import print_function, unicode_literals, division
+
+import argparse
+import cProfile
+import gc
+import timeit
+
+from marshmallow import validate, ValidationError
+
+
+URLS = [
+    'http://example.org',
+    'https://www.example.com/path/to/page?query=1&other=2',
+    'ftp://files.example.net:2121/pub/',
+    'https://sub.domain.example.co.uk/',
+    'http://127.0.0.1:8000/admin',
+    'https://localhost/',
+    'example.org',
+    'http://exa mple.org',
+]
+
+EMAILS = [
+    'monty@python.org',
+    'first.last+tag@mail.example.com',
+    'user_name@sub.example.co.uk',
+    '"quoted name"@example.org',
+    'user@localhost',
+    'user@[127.0.0.1]',
+    'not-an-email',
+    'user@invalid_domain',
+]
+
+
+def worst_case_urls(length):
+    return [
+        'http://' + 'a.' * (length // 2) + '!',
+        'http://' + ('a' * 61 + '.') * (length // 62) + '!',
+        'http://' + 'a' * length + ':' + 'b' * length + ' ',
+        'http://' + '1.' * (length // 2) + '!',
+    ]
+
+
+def worst_case_emails(length):
+    return [
+        'a@' + 'a.' * (length // 2) + '!',
+        'a@' + ('a' * 61 + '.') * (length // 62) + '!',
+        'a.' * (length // 2) + '@example.org',
+        '"' + '\\a' * (length // 2) + '@example.org',
+    ]
+
+
+def validate_all(validator, values):
+    for value in values:
+        try:
+            validator(value)
+        except ValidationError:
+            pass
+
+
+def run_timeit(validator, values, iterations, repeat, profile=False):
+    if profile:
+        profile = cProfile.Profile()
+        profile.enable()
+
+    gc.collect()
+    best = min(timeit.repeat(
+        lambda: validate_all(validator, values),
+        'gc.enable()',
+        number=iterations,
+        repeat=repeat,
+    ))
+    if profile:
+        profile.disable()
+        profile.dump_stats('marshmallow.pprof')
+
+    return best * 1e6 / (iterations * len(values))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks URL and Email validation.')
+    parser.add_argument(
+        '--iterations', type=int, default=2000,
+        help='Number of iterations to run per test.',
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=5,
+        help='Number of times to repeat the performance test.  The minimum will '
+             'be used.',
+    )
+    parser.add_argument(
+        '--length', type=int, default=10000,
+        help='Length of the adversarial values.',
+    )
+    parser.add_argument(
+        '--profile', action='store_true',
+        help='Whether or not to profile Marshmallow while running the benchmark.',
+    )
+    args = parser.parse_args()
+
+    worst_iterations = max(args.iterations // 100, 1)
+    cases = [
+        ('URL', validate.URL(), URLS, args.iterations),
+        ('Email', validate.Email(), EMAILS, args.iterations),
+        ('URL worst case', validate.URL(), worst_case_urls(args.length), worst_iterations),
+        ('Email worst case', validate.Email(), worst_case_emails(args.length), worst_iterations),
+    ]
+    for name, validator, values, iterations in cases:
+        print('{0}: {1:.2f} usec/value'.format(
+            name, run_timeit(validator, values, iterations, args.repeat, profile=args.profile),
+        ))
+
+
+if __name__ == '__main__':
+    main()
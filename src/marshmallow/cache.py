@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Bounded caches used to memoize pure (de)serialization work.
+
+.. warning::
+
+    This module is treated as private API.
+    Users should not need to use this module directly.
+"""
+from __future__ import unicode_literals, division
+
+import threading
+from collections import namedtuple, OrderedDict
+
+from marshmallow.utils import missing
+
+
+class CacheInfo(namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])):
+    """Statistics for a `LRUCache`, similar to `functools.lru_cache`'s ``cache_info()``."""
+    __slots__ = ()
+
+    @property
+    def hit_rate(self):
+        """Ratio of lookups that were hits, between 0 and 1."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache(object):
+    """Thread-safe mapping that keeps at most ``maxsize`` entries, discarding
+    the least recently used entry first.
+
+    :param int maxsize: Maximum number of entries.
+    """
+
+    def __init__(self, maxsize=128):
+        if maxsize is None or maxsize < 1:
+            raise ValueError('maxsize must be a positive integer.')
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = self.misses = self.evictions = 0
+
+    def __repr__(self):
+        return '<LRUCache(maxsize={0!r}, currsize={1!r})>'.format(self.maxsize, len(self))
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=missing):
+        """Return the value for ``key`` and mark it as recently used, or
+        ``default`` if ``key`` is not cached.
+        """
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data[key] = value
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """Store ``value`` under ``key``, evicting the least recently used
+        entry if the cache is full.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all entries and reset statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def cache_info(self):
+        """Return a `CacheInfo` with the current statistics."""
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, self.evictions, self.maxsize, len(self._data),
+            )
@@ -74,6 +74,7 @@ def validates_schema(
     pass_many=False,
     pass_original=False,
     skip_on_field_errors=True,
+    fields=None,
 ):
     """Register a schema-level validator.
 
@@ -87,14 +88,21 @@ def validates_schema(
     If ``skip_on_field_errors=True``, this validation method will be skipped whenever
     validation errors have been detected when validating fields.
 
+    ``fields`` may list the names of the fields this validation method depends
+    on. `Schema.load_patch <marshmallow.Schema.load_patch>` skips it when none of
+    them is patched. If `None`, the method depends on every field.
+
     .. versionchanged:: 3.0.0b1
         ``skip_on_field_errors`` defaults to `True`.
+    .. versionchanged:: 3.0.0
+        Add ``fields`` parameter.
     """
     return set_hook(
         fn,
         (VALIDATES_SCHEMA, pass_many),
         pass_original=pass_original,
         skip_on_field_errors=skip_on_field_errors,
+        fields=fields,
     )
 
 
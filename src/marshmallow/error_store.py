@@ -32,6 +32,19 @@ class ErrorStore(object):
         self.errors = merge_errors(self.errors, messages)
 
 
+class Failure(object):
+    """Returned in place of a value by the internal (de)serialization methods
+    of fields when ``error`` would otherwise be raised, so that callers can
+    store errors without raising and catching exceptions.
+
+    :param ValidationError error: The error to store.
+    """
+    __slots__ = ('error',)
+
+    def __init__(self, error):
+        self.error = error
+
+
 def merge_errors(errors1, errors2):
     """Deeply merge two error messages.
 
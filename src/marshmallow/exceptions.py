@@ -1,12 +1,25 @@
 # -*- coding: utf-8 -*-
 """Exception classes for marshmallow-related errors."""
 
-from marshmallow.compat import basestring
+import datetime as dt
+import decimal
+import uuid
+from itertools import chain
+
+from marshmallow.compat import basestring, itervalues, text_type, binary_type
 
 
 # Key used for schema-level validation errors
 SCHEMA = '_schema'
 
+# Types of the values that messages can be rendered from after the error is
+# raised, since they cannot change in the meantime
+_IMMUTABLE_TYPES = frozenset((
+    text_type, binary_type, str, int, float, complex, bool, type(None),
+    decimal.Decimal, dt.datetime, dt.date, dt.time, dt.timedelta, uuid.UUID,
+    type(2 ** 64),  # long on Python 2
+))
+
 
 class MarshmallowError(Exception):
     """Base class for all marshmallow-related errors."""
@@ -24,7 +37,14 @@ class ValidationError(MarshmallowError):
     :param list fields: `Field` objects to which the error applies.
     :param dict data: Raw input data.
     :param dict valid_data: Valid (de)serialized data.
+
+    .. versionchanged:: 3.0.0
+        Errors raised by marshmallow's fields and validators render their
+        message when `messages` (or the exception's ``args``) is first read.
     """
+    # (function, args, kwargs) that render a message that is not rendered yet
+    _template = None
+
     def __init__(self, message, field_name=SCHEMA, data=None, valid_data=None, **kwargs):
         self.messages = [message] if isinstance(message, basestring) else message
         self.field_name = field_name
@@ -33,6 +53,72 @@ class ValidationError(MarshmallowError):
         self.kwargs = kwargs
         MarshmallowError.__init__(self, message)
 
+    @classmethod
+    def _from_template(cls, template, format_kwargs, **kwargs):
+        """Create an error whose message is rendered from a format string and
+        its arguments only when it is read, so that errors which are caught
+        and discarded never format anything.
+
+        :param str template: Error message format string.
+        :param dict format_kwargs: Arguments to format ``template`` with.
+        :param kwargs: Same as for `ValidationError`.
+        """
+        return cls._deferred(template.format, (), format_kwargs, **kwargs)
+
+    @classmethod
+    def _deferred(cls, render, args, render_kwargs, **kwargs):
+        """Create an error whose message is ``render(*args, **render_kwargs)``,
+        called only when the message is read. If any argument may be mutated
+        after the error is raised, the message is rendered right away instead.
+
+        :param callable render: Function returning the error message.
+        :param tuple args: Positional arguments of ``render``.
+        :param dict render_kwargs: Keyword arguments of ``render``.
+        :param kwargs: Same as for `ValidationError`.
+        """
+        for arg in chain(args, itervalues(render_kwargs)):
+            if type(arg) not in _IMMUTABLE_TYPES:
+                return cls(render(*args, **render_kwargs), **kwargs)
+        error = cls('', **kwargs)
+        error._template = (render, args, render_kwargs)
+        return error
+
+    def _render(self):
+        if self._template is not None:
+            render, args, render_kwargs = self._template
+            self._template = None
+            message = render(*args, **render_kwargs)
+            self._messages = [message]
+            MarshmallowError.args.__set__(self, (message,))
+
+    @property
+    def messages(self):
+        self._render()
+        return self._messages
+
+    @messages.setter
+    def messages(self, messages):
+        self._template = None
+        self._messages = messages
+
+    @property
+    def args(self):
+        self._render()
+        return MarshmallowError.args.__get__(self)
+
+    @args.setter
+    def args(self, args):
+        self._template = None
+        MarshmallowError.args.__set__(self, args)
+
+    def __str__(self):
+        self._render()
+        return MarshmallowError.__str__(self)
+
+    def __repr__(self):
+        self._render()
+        return MarshmallowError.__repr__(self)
+
     def normalized_messages(self):
         if self.field_name == SCHEMA and isinstance(self.messages, dict):
             return self.messages
@@ -9,10 +9,15 @@ import datetime as dt
 import numbers
 import uuid
 import decimal
+import inspect
 import math
+import weakref
 
 from marshmallow import validate, utils, class_registry
 from marshmallow.base import FieldABC, SchemaABC
+from marshmallow.cache import LRUCache
+from marshmallow.decorators import PRE_DUMP, POST_DUMP
+from marshmallow.error_store import Failure
 from marshmallow.utils import is_collection, missing as missing_, resolve_field_instance
 from marshmallow.compat import basestring, text_type, Mapping as _Mapping, iteritems
 from marshmallow.exceptions import (
@@ -58,6 +63,154 @@ MISSING_ERROR_MESSAGE = (
 )
 
 
+def _defining_class(cls, name):
+    """Return the class of the MRO of ``cls`` that defines attribute ``name``."""
+    return next(klass for klass in inspect.getmro(cls) if name in klass.__dict__)
+
+
+def _inherits(cls, base, names):
+    """Whether ``cls`` uses the same implementation as ``base`` for each of
+    the methods ``names``.
+    """
+    return all(issubclass(base, _defining_class(cls, name)) for name in names)
+
+
+_result_support = weakref.WeakKeyDictionary()
+
+
+def _get_result_support(cls):
+    """Return whether fields of type ``cls`` may be deserialized without raising
+    exceptions, and whether their ``_try_deserialize`` may stand in for
+    ``_deserialize``. Subclasses overriding the methods these reproduce are
+    called through their public, raising methods instead.
+    """
+    try:
+        return _result_support[cls]
+    except KeyError:
+        owner = _defining_class(cls, '_try_deserialize')
+        support = _result_support[cls] = (
+            _inherits(cls, Field, ('deserialize', '_validate', '_validate_missing', 'fail')),
+            owner is Field or _inherits(cls, owner, owner._RESULT_REPLACES),
+        )
+        return support
+
+
+def _unwrap(result):
+    """Return ``result``, raising its error if it is a `Failure`."""
+    if isinstance(result, Failure):
+        raise result.error
+    return result
+
+
+def _takes_call_state(field):
+    """Whether ``field`` takes the state of the schema's call to ``dump`` or
+    ``load`` in progress, such as the memo of nested objects, as keyword
+    arguments: `Nested` fields and the containers that hold them.
+    """
+    if isinstance(field, Nested):
+        return True
+    if isinstance(field, List):
+        return _takes_call_state(field.container)
+    if isinstance(field, Tuple):
+        return any(_takes_call_state(each) for each in field.tuple_fields)
+    if isinstance(field, Mapping):
+        return any(
+            each is not None and _takes_call_state(each)
+            for each in (field.key_container, field.value_container)
+        )
+    return False
+
+
+# Looked up for every validator call, so a plain dict rather than a
+# WeakKeyDictionary (validator classes are not expected to be short-lived)
+_error_returning_validators = {}
+
+
+def _returns_errors(validator):
+    """Whether ``validator`` is a `Validator` that returns its errors from
+    ``_check`` rather than raising them from an overridden ``__call__``.
+    """
+    cls = type(validator)
+    try:
+        return _error_returning_validators[cls]
+    except KeyError:
+        result = _error_returning_validators[cls] = (
+            issubclass(cls, Validator) and _defining_class(cls, '__call__') is Validator
+        )
+        return result
+
+
+def _fuse_checks(checks):
+    """Fuse the compiled checks of consecutive built-in validators into one
+    function of a field and a value, returning the list of errors of the
+    checks that fail or `None`.
+    """
+    if len(checks) == 1:
+        check, = checks
+
+        def fused(field, value):
+            error = check(value)
+            return None if error is None else [error]
+    elif len(checks) == 2:
+        first, second = checks
+
+        def fused(field, value):
+            error1 = first(value)
+            error2 = second(value)
+            if error1 is None:
+                return None if error2 is None else [error2]
+            return [error1] if error2 is None else [error1, error2]
+    else:
+        def fused(field, value):
+            errors = [error for error in [check(value) for check in checks] if error is not None]
+            return errors or None
+    return fused
+
+
+def _call_validator(validator):
+    """Wrap a validator that raises its errors like `_fuse_checks` does."""
+    is_validator = isinstance(validator, Validator)
+
+    def call(field, value):
+        try:
+            r = validator(value)
+            if not is_validator and r is False:
+                field.fail('validator_failed')
+        except ValidationError as error:
+            return [error]
+        return None
+    return call
+
+
+def _fuse_validators(validators):
+    """Compile ``validators`` into one function of a field and a value that
+    returns the errors of the validators that fail, in order, or `None`.
+
+    Consecutive built-in validators are fused into a single check; other
+    callables are called in turn.
+    """
+    steps = []
+    for validator in validators:
+        if not _returns_errors(validator):
+            steps.append(_call_validator(validator))
+        elif steps and isinstance(steps[-1], list):
+            steps[-1].append(validator._compile_check())
+        else:
+            steps.append([validator._compile_check()])
+    steps = [_fuse_checks(step) if isinstance(step, list) else step for step in steps]
+    if len(steps) == 1:
+        return steps[0]
+
+    def check_all(field, value):
+        errors = None
+        for step in steps:
+            failed = step(field, value)
+            if failed is not None:
+                errors = failed if errors is None else errors + failed
+        return errors
+    return check_all
+
+
 class Field(FieldABC):
     """Basic field from which other fields should extend. It applies no
     formatting by default, and should only be used in cases where
@@ -118,6 +271,17 @@ class Field(FieldABC):
     #  for those fields
     _CHECK_ATTRIBUTE = True
     _creation_index = 0  # Used for sorting
+    # Key and function set by `_bind_to_schema` to pull values from objects
+    _accessor_key = missing_
+    _accessor = None
+    # Set on first use by `_deserialize_result`
+    _result_support = None
+    # Copy of `validators` and the check compiled from them when the field is bound
+    _compiled_validators = None
+    # Methods reimplemented by `_try_deserialize` when a subclass overrides it
+    _RESULT_REPLACES = ('_deserialize',)
+    # Whether `_deserialize` takes the ``validate`` flag of the load in progress
+    _TAKES_VALIDATE = False
 
     #: Default error messages for various kinds of errors. The keys in this dictionary
     #: are passed to `Field.fail`. The values are error messages passed to
@@ -197,34 +361,69 @@ class Field(FieldABC):
         # NOTE: Use getattr instead of direct attribute access here so that
         # subclasses aren't required to define `attribute` member
         attribute = getattr(self, 'attribute', None)
-        accessor_func = accessor or utils.get_value
         check_key = attr if attribute is None else attribute
-        return accessor_func(obj, check_key, default)
+        if accessor is None or accessor is utils.get_value:
+            # Use the accessor compiled in `_bind_to_schema` if it matches
+            if check_key == self._accessor_key:
+                return self._accessor(obj, default)
+            accessor = utils.get_value
+        return accessor(obj, check_key, default)
 
     def _validate(self, value):
         """Perform validation on ``value``. Raise a :exc:`ValidationError` if validation
         does not succeed.
         """
+        error = self._validation_error(value)
+        if error is not None:
+            raise error
+
+    def _validation_error(self, value):
+        """Same as `_validate`, but return the :exc:`ValidationError` rather than
+        raising it, or `None` if validation succeeds.
+        """
+        compiled = self._compiled_validators
+        if compiled is not None and compiled[0] != self.validators:
+            # The validators were changed after binding, e.g. by `on_bind_field`
+            compiled = self._compile_validators()
+        check = None if compiled is None else compiled[1]
+        if check is not None:
+            failed = check(self, value)
+            if failed is None:
+                return None
+        else:
+            failed = []
+            for validator in self.validators:
+                if _returns_errors(validator):
+                    err = validator._check(value)
+                    if err is not None:
+                        failed.append(err)
+                    continue
+                try:
+                    r = validator(value)
+                    if not isinstance(validator, Validator) and r is False:
+                        self.fail('validator_failed')
+                except ValidationError as error:
+                    failed.append(error)
         errors = []
         kwargs = {}
-        for validator in self.validators:
-            try:
-                r = validator(value)
-                if not isinstance(validator, Validator) and r is False:
-                    self.fail('validator_failed')
-            except ValidationError as err:
-                kwargs.update(err.kwargs)
-                if isinstance(err.messages, dict):
-                    errors.append(err.messages)
-                else:
-                    errors.extend(err.messages)
+        for err in failed:
+            kwargs.update(err.kwargs)
+            if isinstance(err.messages, dict):
+                errors.append(err.messages)
+            else:
+                errors.extend(err.messages)
         if errors:
-            raise ValidationError(errors, **kwargs)
+            return ValidationError(errors, **kwargs)
+        return None
 
     # Hat tip to django-rest-framework.
     def fail(self, key, **kwargs):
         """A helper method that simply raises a `ValidationError`.
         """
+        raise self._make_error(key, **kwargs)
+
+    def _make_error(self, key, **kwargs):
+        """Return the `ValidationError` raised by `fail`."""
         try:
             msg = self.error_messages[key]
         except KeyError:
@@ -232,8 +431,9 @@ class Field(FieldABC):
             msg = MISSING_ERROR_MESSAGE.format(class_name=class_name, key=key)
             raise AssertionError(msg)
         if isinstance(msg, basestring):
-            msg = msg.format(**kwargs)
-        raise ValidationError(msg)
+            # Rendered when the error's messages are read
+            return ValidationError._from_template(msg, kwargs)
+        return ValidationError(msg)
 
     def _validate_missing(self, value):
         """Validate missing values. Raise a :exc:`ValidationError` if
@@ -246,6 +446,18 @@ class Field(FieldABC):
             if hasattr(self, 'allow_none') and self.allow_none is not True:
                 self.fail('null')
 
+    def _missing_error(self, value):
+        """Same as `_validate_missing`, but return the :exc:`ValidationError`
+        rather than raising it.
+        """
+        if value is missing_:
+            if hasattr(self, 'required') and self.required:
+                return self._make_error('required')
+        if value is None:
+            if hasattr(self, 'allow_none') and self.allow_none is not True:
+                return self._make_error('null')
+        return None
+
     def serialize(self, attr, obj, accessor=None, **kwargs):
         """Pulls the value for the given key from the object, applies the
         field's formatting and returns the result.
@@ -257,16 +469,33 @@ class Field(FieldABC):
         :raise ValidationError: In case of formatting problem
         """
         if self._CHECK_ATTRIBUTE:
-            value = self.get_value(obj, attr, accessor=accessor)
-            if value is missing_ and hasattr(self, 'default'):
-                default = self.default
-                value = default() if callable(default) else default
-            if value is missing_:
-                return value
-        else:
-            value = None
+            return self._serialize_value(
+                self.get_value(obj, attr, accessor=accessor), attr, obj, **kwargs
+            )
+        return self._serialize(None, attr, obj, **kwargs)
+
+    def _serialize_value(self, value, attr, obj, **kwargs):
+        """Serialize a value already pulled from ``obj``, applying ``default``
+        if it is missing.
+        """
+        if value is missing_ and hasattr(self, 'default'):
+            default = self.default
+            value = default() if callable(default) else default
+        if value is missing_:
+            return value
         return self._serialize(value, attr, obj, **kwargs)
 
+    def _get_fetch_key(self):
+        """Return the key a source adapter may fetch from objects on behalf of
+        this field, or `None` if the value must be pulled with `get_value`.
+        """
+        key = self._accessor_key
+        if not self._CHECK_ATTRIBUTE or not isinstance(key, basestring) or '.' in key:
+            return None
+        if not _inherits(type(self), Field, ('serialize', 'get_value')):
+            return None
+        return key
+
     def deserialize(self, value, attr=None, data=None, **kwargs):
         """Deserialize ``value``.
 
@@ -289,6 +518,58 @@ class Field(FieldABC):
         self._validate(output)
         return output
 
+    def _deserialize_result(self, value, attr=None, data=None, validate=True, **kwargs):
+        """Same as `deserialize`, but return a `Failure` wrapping the
+        :exc:`ValidationError` rather than raising it.
+
+        :param bool validate: Whether to run the validators of the field and of
+            the fields and schemas it holds. Fields overriding the raising
+            methods, such as `deserialize`, run their own validators regardless.
+        """
+        support = self._result_support
+        if support is None:
+            support = self._result_support = _get_result_support(type(self))
+        supported, try_deserialize = support
+        if not supported:
+            if self._TAKES_VALIDATE:
+                kwargs['validate'] = validate
+            try:
+                return self.deserialize(value, attr, data, **kwargs)
+            except ValidationError as error:
+                return Failure(error)
+        error = self._missing_error(value)
+        if error is not None:
+            return Failure(error)
+        if value is missing_:
+            _miss = self.missing
+            return _miss() if callable(_miss) else _miss
+        if getattr(self, 'allow_none', False) is True and value is None:
+            return None
+        if try_deserialize:
+            output = self._try_deserialize(value, attr, data, validate=validate, **kwargs)
+        else:
+            output = Field._try_deserialize(self, value, attr, data, validate=validate, **kwargs)
+        if isinstance(output, Failure) or not self.validators or not validate:
+            return output
+        error = self._validation_error(output)
+        if error is not None:
+            return Failure(error)
+        return output
+
+    def _try_deserialize(self, value, attr, data, validate=True, **kwargs):
+        """Same as `_deserialize`, but return a `Failure` wrapping the
+        :exc:`ValidationError` rather than raising it. Containers override
+        this to collect the errors of their items without raising.
+
+        :param bool validate: Whether containers validate the values they hold.
+        """
+        if self._TAKES_VALIDATE:
+            kwargs['validate'] = validate
+        try:
+            return self._deserialize(value, attr, data, **kwargs)
+        except ValidationError as error:
+            return Failure(error)
+
     # Methods for concrete classes to override.
 
     def _bind_to_schema(self, field_name, schema):
@@ -300,6 +581,22 @@ class Field(FieldABC):
         """
         self.parent = self.parent or schema
         self.name = self.name or field_name
+        key = getattr(self, 'attribute', None) or field_name
+        if key is not None:
+            self._accessor_key = key
+            self._accessor = utils.compile_accessor(key)
+        self._compile_validators()
+
+    def _compile_validators(self):
+        """Fuse `validators` into the single check run by `_validate`. Called
+        when the field is bound, and again if `validators` changes; unbound
+        fields call their validators in turn.
+        """
+        validators = list(self.validators)
+        self._compiled_validators = (
+            validators, _fuse_validators(validators) if validators else None,
+        )
+        return self._compiled_validators
 
     def _serialize(self, value, attr, obj, **kwargs):
         """Serializes ``value`` to a basic Python datatype. Noop by default.
@@ -398,25 +695,59 @@ class Nested(Field):
     :param bool many: Whether the field is a collection of objects.
     :param unknown: Whether to exclude, include, or raise an error for unknown
         fields in the data. Use `EXCLUDE`, `INCLUDE` or `RAISE`.
+    :param str dedupe: Serialize each distinct nested object (or collection,
+        if ``many=True``) only once per call to `Schema.dump`, and reuse the
+        result wherever the same object appears again, including under the
+        other `Nested` fields that nest the same schema class with the same
+        ``many``, ``only``, ``exclude`` and ``load_only`` options. Objects are
+        compared by identity. Use ``'share'`` to reuse the same result, or
+        ``'copy'`` to give each occurrence a shallow copy of it. By default,
+        nested objects are serialized every time they appear.
+    :param str reference: Name of a field of the nested schema that identifies
+        nested objects, such as ``'id'``. Within a call to `Schema.dump`, an
+        object is serialized in full where it first appears and as the value of
+        that field wherever it appears again. Within a call to `Schema.load`,
+        these values resolve to the object that was loaded in full. Objects are
+        shared with the other `Nested` fields of the call that nest the same
+        schema class with the same ``reference``, ``only``, ``exclude`` and
+        ``load_only`` options. Collections are (de)serialized one object at a
+        time in this mode.
     :param kwargs: The same keyword arguments that :class:`Field` receives.
+
+    .. versionchanged:: 3.0.0
+        Add ``dedupe`` and ``reference`` parameters.
     """
 
     default_error_messages = {
         'type': 'Invalid type.',
+        'reference': 'Unknown reference.',
     }
 
-    def __init__(self, nested, default=missing_, exclude=tuple(), only=None, **kwargs):
+    _RESULT_REPLACES = ('_deserialize', '_test_collection', '_load')
+    _TAKES_VALIDATE = True
+
+    def __init__(
+        self, nested, default=missing_, exclude=tuple(), only=None, dedupe=None,
+        reference=None, **kwargs
+    ):
         # Raise error if only or exclude is passed as string, not list of strings
         if only is not None and not is_collection(only):
             raise StringNotCollectionError('"only" should be a list of strings.')
         if exclude is not None and not is_collection(exclude):
             raise StringNotCollectionError('"exclude" should be a list of strings.')
+        if dedupe not in (None, 'share', 'copy'):
+            raise ValueError('"dedupe" must be one of None, "share" or "copy".')
+        if dedupe and reference is not None:
+            raise ValueError('"dedupe" and "reference" cannot be used together.')
         self.nested = nested
         self.only = only
         self.exclude = exclude
+        self.dedupe = dedupe
+        self.reference = reference
         self.many = kwargs.get('many', False)
         self.unknown = kwargs.get('unknown')
         self.__schema = None  # Cached Schema instance
+        self.__memo_scope = None
         super(Nested, self).__init__(default=default, **kwargs)
 
     @property
@@ -459,42 +790,184 @@ class Nested(Field):
                 for field in getattr(self.root, option_name, set())
                 if field.startswith(nested_field)]
 
-    def _serialize(self, nested_obj, attr, obj, **kwargs):
+    def _serialize(self, nested_obj, attr, obj, memo=None, **kwargs):
+        """Same as :meth:`Field._serialize` with additional ``memo`` argument.
+
+        :param dict memo: Results of the top-level dump in progress, keyed on
+            object identity, for ``dedupe`` and ``reference``.
+        """
         # Load up the schema first. This allows a RegistryError to be raised
         # if an invalid schema name was passed
         schema = self.schema
         if nested_obj is None:
             return None
-        try:
-            return schema.dump(nested_obj, many=self.many)
-        except ValidationError as exc:
-            raise ValidationError(exc.messages, valid_data=exc.valid_data)
+        if self.reference is not None and memo is not None:
+            if not self.many:
+                return self._serialize_reference(schema, nested_obj, memo)
+            ret, errors = [], {}
+            for idx, each in enumerate(nested_obj):
+                try:
+                    ret.append(self._serialize_reference(schema, each, memo))
+                except ValidationError as error:
+                    errors[idx] = error.messages
+                    ret.append(error.valid_data)
+            if errors:
+                raise ValidationError(errors, valid_data=ret)
+            return ret
+        if self.dedupe and memo is not None:
+            key = (self._get_memo_scope(schema), self.many, id(nested_obj))
+            entry = memo.get(key)
+            if entry is None:
+                result = self._dump_nested(schema, nested_obj, memo)
+                # Keep a reference to the object so that its id is not reused
+                memo[key] = (nested_obj, result)
+                return result
+            result = entry[1]
+            if self.dedupe == 'copy':
+                if self.many:
+                    return [copy.copy(each) for each in result]
+                return copy.copy(result)
+            return result
+        return self._dump_nested(schema, nested_obj, memo)
+
+    def _dump_nested(self, schema, nested_obj, memo, many=None):
+        many = self.many if many is None else many
+        if schema._custom_dump:
+            try:
+                return schema.dump(nested_obj, many=many)
+            except ValidationError as exc:
+                raise ValidationError(exc.messages, valid_data=exc.valid_data)
+        result, errors = schema._dump_result(nested_obj, many=many, memo=memo)
+        if errors:
+            raise ValidationError(errors, valid_data=result)
+        return result
+
+    def _get_memo_scope(self, schema):
+        """Return the part of the keys of the memo of a dump or load shared
+        by the `Nested` fields whose schemas serialize objects the same way.
+        """
+        scope = self.__memo_scope
+        if scope is None or scope[0] is not schema:
+            scope = self.__memo_scope = (schema, (
+                type(schema), self.reference,
+                None if schema.only is None else frozenset(schema.only),
+                frozenset(schema.exclude), frozenset(schema.load_only),
+            ))
+        return scope[1]
+
+    def _get_reference_key(self, schema):
+        field = schema.fields.get(self.reference)
+        return field.data_key or self.reference if field else self.reference
+
+    def _serialize_reference(self, schema, nested_obj, memo):
+        key = (self._get_memo_scope(schema), id(nested_obj))
+        entry = memo.get(key)
+        if entry is not None:
+            return entry[1]
+        result = self._dump_nested(schema, nested_obj, memo, many=False)
+        if isinstance(result, _Mapping):
+            reference = result.get(self._get_reference_key(schema))
+            if reference is not None:
+                # Keep a reference to the object so that its id is not reused
+                memo[key] = (nested_obj, reference)
+        return result
 
     def _test_collection(self, value):
         if self.many and not utils.is_collection(value):
             self.fail('type', input=value, type=value.__class__.__name__)
 
-    def _load(self, value, data, partial=None):
-        try:
-            valid_data = self.schema.load(
-                value, unknown=self.unknown,
-                partial=partial,
-            )
-        except ValidationError as exc:
-            raise ValidationError(exc.messages, valid_data=exc.valid_data)
-        return valid_data
+    def _load(self, value, data, partial=None, memo=None, validate=True, validate_only=False):
+        return _unwrap(self._load_result(
+            value, partial=partial, memo=memo, validate=validate, validate_only=validate_only,
+        ))
 
-    def _deserialize(self, value, attr, data, partial=None, **kwargs):
+    def _load_result(self, value, partial=None, memo=None, validate=True, validate_only=False):
+        schema = self.schema
+        options = (partial, memo, validate, validate_only)
+        if self.reference is not None and memo is not None:
+            if not self.many:
+                return self._load_reference(schema, value, options)
+            ret, errors = [], {}
+            for idx, each in enumerate(value):
+                result = self._load_reference(schema, each, options)
+                if isinstance(result, Failure):
+                    errors[idx] = result.error.messages
+                    result = result.error.valid_data
+                ret.append(result)
+            if errors:
+                return Failure(ValidationError(errors, valid_data=ret))
+            return ret
+        return self._load_nested(schema, value, options)
+
+    def _load_nested(self, schema, value, options, many=None):
+        partial, memo, validate, validate_only = options
+        if schema._custom_load:
+            try:
+                return schema.load(value, many=many, unknown=self.unknown, partial=partial)
+            except ValidationError as exc:
+                return Failure(ValidationError(exc.messages, valid_data=exc.valid_data))
+        result, errors = schema._load_result(
+            value, many=many, unknown=self.unknown, partial=partial, memo=memo,
+            validate=validate,
+            # The nested data is only validated if the parent schema discards it
+            validate_only=validate_only and not self.validators,
+        )
+        if errors:
+            return Failure(ValidationError(errors, valid_data=result))
+        return result
+
+    def _load_reference(self, schema, value, options):
+        memo = options[1]
+        if not isinstance(value, _Mapping):
+            try:
+                return memo[(self._get_memo_scope(schema), value)]
+            except (KeyError, TypeError):
+                return Failure(self._make_error('reference', input=value))
+        result = self._load_nested(schema, value, options, many=False)
+        if not isinstance(result, Failure):
+            reference = value.get(self._get_reference_key(schema))
+            try:
+                if reference is not None:
+                    memo[(self._get_memo_scope(schema), reference)] = result
+            except TypeError:
+                pass
+        return result
+
+    def _deserialize(
+        self, value, attr, data, partial=None, memo=None, validate=True,
+        validate_only=False, **kwargs
+    ):
         """Same as :meth:`Field._deserialize` with additional ``partial`` argument.
 
         :param bool|tuple partial: For nested schemas, the ``partial``
             parameter passed to `Schema.load`.
+        :param dict memo: Objects loaded by the top-level load in progress,
+            keyed on reference.
+        :param bool validate: Whether to validate the nested data.
+        :param bool validate_only: Whether the parent schema discards the
+            nested data, only validating it.
 
         .. versionchanged:: 3.0.0
-            Add ``partial`` parameter
+            Add ``partial``, ``memo``, ``validate`` and ``validate_only`` parameters
         """
         self._test_collection(value)
-        return self._load(value, data, partial=partial)
+        if not _inherits(type(self), Nested, ('_load',)):
+            # Overrides of `_load` only take the ``partial`` argument
+            return self._load(value, data, partial=partial)
+        return self._load(
+            value, data, partial=partial, memo=memo, validate=validate,
+            validate_only=validate_only,
+        )
+
+    def _try_deserialize(
+        self, value, attr, data, partial=None, memo=None, validate=True,
+        validate_only=False, **kwargs
+    ):
+        if self.many and not utils.is_collection(value):
+            return Failure(self._make_error('type', input=value, type=value.__class__.__name__))
+        return self._load_result(
+            value, partial=partial, memo=memo, validate=validate, validate_only=validate_only,
+        )
 
 
 class Pluck(Nested):
@@ -514,19 +987,58 @@ class Pluck(Nested):
     def __init__(self, nested, field_name, **kwargs):
         super(Pluck, self).__init__(nested, only=(field_name,), **kwargs)
         self.field_name = field_name
+        # (schema, field, data key) of the plucked field, resolved once
+        self._plucked = None
+
+    def _get_plucked(self):
+        schema = self.schema
+        if self._plucked is None or self._plucked[0] is not schema:
+            only_field = schema.fields[self.field_name]
+            self._plucked = (schema, only_field, only_field.data_key or self.field_name)
+        return self._plucked
 
     @property
     def _field_data_key(self):
-        only_field = self.schema.fields[self.field_name]
-        return only_field.data_key or self.field_name
+        return self._get_plucked()[2]
 
     def _serialize(self, nested_obj, attr, obj, **kwargs):
-        ret = super(Pluck, self)._serialize(nested_obj, attr, obj, **kwargs)
-        if ret is None:
+        schema, only_field, data_key = self._get_plucked()
+        if nested_obj is None:
             return None
-        if self.many:
-            return utils.pluck(ret, key=self._field_data_key)
-        return ret[self._field_data_key]
+        many = self.many or schema.many
+        if many and not isinstance(nested_obj, (list, tuple)):
+            # Both paths below may iterate the collection, e.g. a generator
+            nested_obj = list(nested_obj)
+        # Without dump hooks, only the plucked field needs to be serialized.
+        # Fall back to a full dump to report errors and missing values.
+        if not (
+            only_field.load_only or
+            schema._has_processors(PRE_DUMP) or
+            schema._has_processors(POST_DUMP)
+        ):
+            accessor = schema._get_accessor()
+            try:
+                if many:
+                    ret = [
+                        only_field.serialize(self.field_name, each, accessor=accessor)
+                        for each in nested_obj
+                    ]
+                    if not any(each is missing_ for each in ret):
+                        return ret
+                else:
+                    ret = only_field.serialize(self.field_name, nested_obj, accessor=accessor)
+                    if ret is not missing_:
+                        return ret
+            except ValidationError:
+                pass
+        if many and not self.many:
+            # The nested schema instance was created with ``many=True``
+            ret = self._dump_nested(schema, nested_obj, kwargs.get('memo'), many=True)
+        else:
+            ret = super(Pluck, self)._serialize(nested_obj, attr, obj, **kwargs)
+        if many:
+            return utils.pluck(ret, key=data_key)
+        return ret[data_key]
 
     def _deserialize(self, value, attr, data, partial=None, **kwargs):
         self._test_collection(value)
@@ -534,7 +1046,42 @@ class Pluck(Nested):
             value = [{self._field_data_key: v} for v in value]
         else:
             value = {self._field_data_key: value}
-        return self._load(value, data, partial=partial)
+        return super(Pluck, self)._deserialize(value, attr, data, partial=partial, **kwargs)
+
+
+def _compile_primitives_check(field):
+    """Return a function that checks whether all values of a sequence are
+    primitives that ``field`` serializes and deserializes unchanged, or
+    `None` if ``field`` is not a plain `String`, `Integer` or `Float`.
+
+    Containers use it to skip (de)serializing their elements one by one.
+    """
+    if field.validators or getattr(field, 'as_string', False):
+        return None
+    field_class = type(field)
+    if field_class is String:
+        primitive_types = {text_type}
+    elif field_class is Integer:
+        primitive_types = {int}
+    elif field_class is Float:
+        primitive_types = {float}
+    else:
+        return None
+    # A finite sum implies that there are no nan or infinite values
+    check_finite = field_class is Float and not field.allow_nan
+
+    def check(values):
+        if not set(map(type, values)) <= primitive_types:
+            return False
+        if check_finite:
+            total = sum(values)
+            return total - total == 0
+        return True
+    return check
+
+
+def _all_values(values):
+    return True
 
 
 class List(Field):
@@ -566,6 +1113,7 @@ class List(Field):
                 'The list elements must be a subclass or instance of '
                 'marshmallow.base.FieldABC.',
             )
+        self._primitives_check = None
 
     def get_value(self, obj, attr, accessor=None):
         """Return the value for a given key from an object."""
@@ -584,29 +1132,50 @@ class List(Field):
         self.container = copy.deepcopy(self.container)
         self.container.parent = self
         self.container.name = field_name
+        self.container._compile_validators()
+        self._primitives_check = _compile_primitives_check(self.container)
+
+    def _has_primitives(self, value):
+        """Whether ``value`` only contains primitives that the container
+        (de)serializes unchanged.
+        """
+        check = self._primitives_check
+        return check is not None and isinstance(value, (list, tuple)) and check(value)
 
     def _serialize(self, value, attr, obj, **kwargs):
         if value is None:
             return None
         if utils.is_collection(value):
+            if self._has_primitives(value):
+                return list(value)
             return [self.container._serialize(each, attr, obj, **kwargs) for each in value]
         return [self.container._serialize(value, attr, obj, **kwargs)]
 
     def _deserialize(self, value, attr, data, **kwargs):
         if not utils.is_collection(value):
             self.fail('invalid')
+        return _unwrap(self._try_deserialize(value, attr, data, **kwargs))
+
+    def _try_deserialize(self, value, attr, data, validate=True, **kwargs):
+        if not utils.is_collection(value):
+            return Failure(self._make_error('invalid'))
+        if self._has_primitives(value):
+            return list(value)
 
+        container = self.container
         result = []
         errors = {}
         for idx, each in enumerate(value):
-            try:
-                result.append(self.container.deserialize(each))
-            except ValidationError as error:
+            output = container._deserialize_result(each, validate=validate, **kwargs)
+            if isinstance(output, Failure):
+                error = output.error
                 if error.valid_data is not None:
                     result.append(error.valid_data)
                 errors.update({idx: error.messages})
+            else:
+                result.append(output)
         if errors:
-            raise ValidationError(errors, valid_data=result)
+            return Failure(ValidationError(errors, valid_data=result))
         return result
 
 
@@ -654,6 +1223,7 @@ class Tuple(Field):
             )
 
         self.validate_length = Length(equal=len(self.tuple_fields))
+        self._primitives_checks = None
 
     def _bind_to_schema(self, field_name, schema):
         super(Tuple, self)._bind_to_schema(field_name, schema)
@@ -662,8 +1232,23 @@ class Tuple(Field):
             new_container = copy.deepcopy(container)
             new_container.parent = self
             new_container.name = field_name
+            new_container._compile_validators()
             new_tuple_fields.append(new_container)
         self.tuple_fields = new_tuple_fields
+        checks = [_compile_primitives_check(container) for container in self.tuple_fields]
+        self._primitives_checks = None if None in checks else checks
+
+    def _has_primitives(self, value):
+        """Whether ``value`` only contains primitives that the containers
+        (de)serialize unchanged.
+        """
+        checks = self._primitives_checks
+        return (
+            checks is not None and
+            isinstance(value, (list, tuple)) and
+            len(value) == len(checks) and
+            all(check((each,)) for check, each in zip(checks, value))
+        )
 
     def get_value(self, obj, attr, accessor=None):
         """Return the value for a given key from an object."""
@@ -685,30 +1270,48 @@ class Tuple(Field):
     def _serialize(self, value, attr, obj, **kwargs):
         if value is None:
             return None
+        if self._has_primitives(value):
+            return tuple(value)
 
         return tuple(
-            container._serialize(each, attr, obj, **kwargs)
+            container._serialize(
+                each, attr, obj, **(kwargs if _takes_call_state(container) else {})
+            )
             for container, each in zip(self.tuple_fields, value)
         )
 
     def _deserialize(self, value, attr, data, **kwargs):
         if not utils.is_collection(value):
             self.fail('invalid')
+        return _unwrap(self._try_deserialize(value, attr, data, **kwargs))
+
+    def _try_deserialize(self, value, attr, data, validate=True, **kwargs):
+        if not utils.is_collection(value):
+            return Failure(self._make_error('invalid'))
 
-        self.validate_length(value)
+        error = self.validate_length._check(value)
+        if error is not None:
+            return Failure(error)
+        if self._has_primitives(value):
+            return tuple(value)
 
         result = []
         errors = {}
 
         for idx, (container, each) in enumerate(zip(self.tuple_fields, value)):
-            try:
-                result.append(container.deserialize(each))
-            except ValidationError as error:
+            output = container._deserialize_result(
+                each, validate=validate,
+                **(kwargs if _takes_call_state(container) else {})
+            )
+            if isinstance(output, Failure):
+                error = output.error
                 if error.valid_data is not None:
                     result.append(error.valid_data)
                 errors.update({idx: error.messages})
+            else:
+                result.append(output)
         if errors:
-            raise ValidationError(errors, valid_data=result)
+            return Failure(ValidationError(errors, valid_data=result))
 
         return tuple(result)
 
@@ -737,6 +1340,14 @@ class String(Field):
         except UnicodeDecodeError:
             self.fail('invalid_utf8')
 
+    def _try_deserialize(self, value, attr, data, **kwargs):
+        if not isinstance(value, basestring):
+            return Failure(self._make_error('invalid'))
+        try:
+            return utils.ensure_text_type(value)
+        except UnicodeDecodeError:
+            return Failure(self._make_error('invalid_utf8'))
+
 
 class UUID(String):
     """A UUID field."""
@@ -777,6 +1388,7 @@ class Number(Field):
     default_error_messages = {
         'invalid': 'Not a valid number.',
     }
+    _RESULT_REPLACES = ('_deserialize', '_validated')
 
     def __init__(self, as_string=False, **kwargs):
         self.as_string = as_string
@@ -809,6 +1421,16 @@ class Number(Field):
     def _deserialize(self, value, attr, data, **kwargs):
         return self._validated(value)
 
+    def _try_deserialize(self, value, attr, data, **kwargs):
+        if value is None:
+            return None
+        try:
+            return self._format_num(value)
+        except (TypeError, ValueError):
+            return Failure(self._make_error('invalid', input=value))
+        except ValidationError as error:
+            return Failure(error)
+
 
 class Integer(Number):
     """An integer field.
@@ -1037,6 +1659,24 @@ class FormattedString(Field):
             self.fail('format')
 
 
+def _temporal_cache_key(value, data_format):
+    """Return a cache key for a date, datetime or time ``value``, or `None`
+    if ``value`` should not be cached.
+
+    Aware values compare equal across timezones when they represent the same
+    instant, so the wall-clock value, UTC offset and zone name are used
+    rather than ``value`` itself.
+    """
+    if not isinstance(value, (dt.date, dt.time)):
+        return None
+    if getattr(value, 'tzinfo', None) is None:
+        return (data_format, type(value), value)
+    return (
+        data_format, type(value), value.replace(tzinfo=None),
+        value.utcoffset(), value.tzname(),
+    )
+
+
 class DateTime(Field):
     """A formatted datetime string in UTC.
 
@@ -1049,8 +1689,14 @@ class DateTime(Field):
 
     :param str format: Either ``"rfc"`` (for RFC822), ``"iso"`` (for ISO8601),
         or a date format string. If `None`, defaults to "iso".
+    :param int cache_size: If set, memoize up to this many parsed and formatted
+        values in a least-recently-used cache. Useful when the same values are
+        (de)serialized repeatedly. If `None`, uses the ``datetime_cache_size``
+        class Meta option of the parent schema.
     :param kwargs: The same keyword arguments that :class:`Field` receives.
 
+    .. versionchanged:: 3.0.0
+        Add ``cache_size`` parameter.
     """
 
     SERIALIZATION_FUNCS = {
@@ -1079,12 +1725,14 @@ class DateTime(Field):
         'format': '"{input}" cannot be formatted as a {obj_type}.',
     }
 
-    def __init__(self, format=None, **kwargs):
+    def __init__(self, format=None, cache_size=None, **kwargs):
         super(DateTime, self).__init__(**kwargs)
         # Allow this to be None. It may be set later in the ``_serialize``
         # or ``_deserialize`` methods This allows a Schema to dynamically set the
         # format, e.g. from a Meta option
         self.format = format
+        self._cache = LRUCache(cache_size) if cache_size else None
+        self._compile_format(format)
 
     def _bind_to_schema(self, field_name, schema):
         super(DateTime, self)._bind_to_schema(field_name, schema)
@@ -1093,11 +1741,43 @@ class DateTime(Field):
             getattr(schema.opts, self.SCHEMA_OPTS_VAR_NAME) or
             self.DEFAULT_FORMAT
         )
+        self._compile_format(self.format)
+        if self._cache is None and schema.opts.datetime_cache_size:
+            self._cache = LRUCache(schema.opts.datetime_cache_size)
+
+    def _compile_format(self, data_format):
+        """Precompile a custom ``data_format`` into specialized formatting and
+        parsing functions. Either function is `None` if the format is not
+        supported by `utils.compile_strftime` or `utils.compile_strptime`.
+        """
+        self._compiled_format = data_format
+        if data_format is None or data_format in self.SERIALIZATION_FUNCS:
+            self._strftime = self._strptime = None
+        else:
+            self._strftime = utils.compile_strftime(data_format)
+            self._strptime = utils.compile_strptime(data_format)
+
+    def cache_info(self):
+        """Return a `CacheInfo <marshmallow.cache.CacheInfo>` with the hits, misses
+        and size of the value cache, or `None` if caching is disabled.
+        """
+        return self._cache.cache_info() if self._cache is not None else None
 
     def _serialize(self, value, attr, obj, **kwargs):
         if value is None:
             return None
         data_format = self.format or self.DEFAULT_FORMAT
+        if self._cache is not None:
+            key = _temporal_cache_key(value, data_format)
+            if key is not None:
+                ret = self._cache.get(key)
+                if ret is missing_:
+                    ret = self._format(value, data_format)
+                    self._cache.set(key, ret)
+                return ret
+        return self._format(value, data_format)
+
+    def _format(self, value, data_format):
         format_func = self.SERIALIZATION_FUNCS.get(data_format)
         if format_func:
             try:
@@ -1105,12 +1785,26 @@ class DateTime(Field):
             except (TypeError, AttributeError, ValueError):
                 self.fail('format', input=value, obj_type=self.OBJ_TYPE)
         else:
+            if data_format != self._compiled_format:
+                self._compile_format(data_format)
+            if self._strftime is not None:
+                return self._strftime(value)
             return value.strftime(data_format)
 
     def _deserialize(self, value, attr, data, **kwargs):
         if not value:  # Falsy values, e.g. '', None, [] are not valid
             raise self.fail('invalid', input=value, obj_type=self.OBJ_TYPE)
         data_format = self.format or self.DEFAULT_FORMAT
+        if self._cache is not None and isinstance(value, basestring):
+            key = (data_format, value)
+            ret = self._cache.get(key)
+            if ret is missing_:
+                ret = self._parse(value, data_format)
+                self._cache.set(key, ret)
+            return ret
+        return self._parse(value, data_format)
+
+    def _parse(self, value, data_format):
         func = self.DESERIALIZATION_FUNCS.get(data_format)
         if func:
             try:
@@ -1118,7 +1812,11 @@ class DateTime(Field):
             except (TypeError, AttributeError, ValueError):
                 raise self.fail('invalid', input=value, obj_type=self.OBJ_TYPE)
         else:
+            if data_format != self._compiled_format:
+                self._compile_format(data_format)
             try:
+                if self._strptime is not None:
+                    return self._from_datetime(self._strptime(value))
                 return self._make_object_from_format(value, data_format)
             except (TypeError, AttributeError, ValueError):
                 raise self.fail('invalid', input=value, obj_type=self.OBJ_TYPE)
@@ -1127,6 +1825,10 @@ class DateTime(Field):
     def _make_object_from_format(value, data_format):
         return dt.datetime.strptime(value, data_format)
 
+    @staticmethod
+    def _from_datetime(value):
+        return value
+
 
 class LocalDateTime(DateTime):
     """A formatted datetime string in localized time, relative to UTC.
@@ -1141,16 +1843,48 @@ class LocalDateTime(DateTime):
 class Time(Field):
     """ISO8601-formatted time string.
 
+    :param int cache_size: If set, memoize up to this many parsed and formatted
+        values in a least-recently-used cache. If `None`, uses the
+        ``datetime_cache_size`` class Meta option of the parent schema.
     :param kwargs: The same keyword arguments that :class:`Field` receives.
+
+    .. versionchanged:: 3.0.0
+        Add ``cache_size`` parameter.
     """
     default_error_messages = {
         'invalid': 'Not a valid time.',
         'format': '"{input}" cannot be formatted as a time.',
     }
 
+    def __init__(self, cache_size=None, **kwargs):
+        super(Time, self).__init__(**kwargs)
+        self._cache = LRUCache(cache_size) if cache_size else None
+
+    def _bind_to_schema(self, field_name, schema):
+        super(Time, self)._bind_to_schema(field_name, schema)
+        if self._cache is None and schema.opts.datetime_cache_size:
+            self._cache = LRUCache(schema.opts.datetime_cache_size)
+
+    def cache_info(self):
+        """Return a `CacheInfo <marshmallow.cache.CacheInfo>` with the hits, misses
+        and size of the value cache, or `None` if caching is disabled.
+        """
+        return self._cache.cache_info() if self._cache is not None else None
+
     def _serialize(self, value, attr, obj, **kwargs):
         if value is None:
             return None
+        if self._cache is not None:
+            key = _temporal_cache_key(value, None)
+            if key is not None:
+                ret = self._cache.get(key)
+                if ret is missing_:
+                    ret = self._format(value)
+                    self._cache.set(key, ret)
+                return ret
+        return self._format(value)
+
+    def _format(self, value):
         try:
             ret = value.isoformat()
         except AttributeError:
@@ -1163,6 +1897,15 @@ class Time(Field):
         """Deserialize an ISO8601-formatted time to a :class:`datetime.time` object."""
         if not value:   # falsy values are invalid
             self.fail('invalid')
+        if self._cache is not None and isinstance(value, basestring):
+            ret = self._cache.get(value)
+            if ret is missing_:
+                ret = self._parse(value)
+                self._cache.set(value, ret)
+            return ret
+        return self._parse(value)
+
+    def _parse(self, value):
         try:
             return utils.from_iso_time(value)
         except (AttributeError, TypeError, ValueError):
@@ -1174,6 +1917,7 @@ class Date(DateTime):
 
     :param format: Either ``"iso"`` (for ISO8601) or a date format string.
         If `None`, defaults to "iso".
+    :param int cache_size: Same as :class:`DateTime`.
     :param kwargs: The same keyword arguments that :class:`Field` receives.
     """
     default_error_messages = {
@@ -1201,6 +1945,10 @@ class Date(DateTime):
     def _make_object_from_format(value, data_format):
         return dt.datetime.strptime(value, data_format).date()
 
+    @staticmethod
+    def _from_datetime(value):
+        return value.date()
+
 
 class TimeDelta(Field):
     """A field that (de)serializes a :class:`datetime.timedelta` object to an
@@ -1312,6 +2060,7 @@ class Mapping(Field):
                     '"values" must be a subclass or instance of '
                     'marshmallow.base.FieldABC.',
                 )
+        self._primitives_checks = None
 
     def _bind_to_schema(self, field_name, schema):
         super(Mapping, self)._bind_to_schema(field_name, schema)
@@ -1319,79 +2068,107 @@ class Mapping(Field):
             self.value_container = copy.deepcopy(self.value_container)
             self.value_container.parent = self
             self.value_container.name = field_name
+            self.value_container._compile_validators()
         if self.key_container:
             self.key_container = copy.deepcopy(self.key_container)
             self.key_container.parent = self
             self.key_container.name = field_name
+            self.key_container._compile_validators()
+        checks = [
+            _compile_primitives_check(container) if container else _all_values
+            for container in (self.key_container, self.value_container)
+        ]
+        self._primitives_checks = None if None in checks else checks
+
+    def _has_primitives(self, value):
+        """Whether the keys and values of ``value`` only contain primitives
+        that the containers (de)serialize unchanged.
+        """
+        checks = self._primitives_checks
+        if checks is None:
+            return False
+        check_keys, check_values = checks
+        return check_keys(value.keys()) and check_values(value.values())
 
     def _serialize(self, value, attr, obj, **kwargs):
         if value is None:
             return None
-        if not self.value_container and not self.key_container:
+        key_container, value_container = self.key_container, self.value_container
+        if not value_container and not key_container:
             return value
         if not isinstance(value, _Mapping):
             self.fail('invalid')
+        if self._has_primitives(value):
+            return self.mapping_type(value)
 
-        # Serialize keys
-        if self.key_container is None:
-            keys = {k: k for k in value.keys()}
-        else:
-            keys = {
-                k: self.key_container._serialize(k, None, None, **kwargs)
-                for k in value.keys()
-            }
-
-        # Serialize values
+        key_kwargs, value_kwargs = self._containers_kwargs(kwargs)
         result = self.mapping_type()
-        if self.value_container is None:
-            for k, v in iteritems(value):
-                if k in keys:
-                    result[keys[k]] = v
+        if key_container is None:
+            for key, val in iteritems(value):
+                result[key] = value_container._serialize(val, None, None, **value_kwargs)
+        elif value_container is None:
+            for key, val in iteritems(value):
+                result[key_container._serialize(key, None, None, **key_kwargs)] = val
         else:
-            for k, v in iteritems(value):
-                result[keys[k]] = self.value_container._serialize(v, None, None, **kwargs)
-
+            for key, val in iteritems(value):
+                result[key_container._serialize(key, None, None, **key_kwargs)] = (
+                    value_container._serialize(val, None, None, **value_kwargs)
+                )
         return result
 
     def _deserialize(self, value, attr, data, **kwargs):
         if not isinstance(value, _Mapping):
             self.fail('invalid')
-        if not self.value_container and not self.key_container:
-            return value
+        return _unwrap(self._try_deserialize(value, attr, data, **kwargs))
 
-        errors = collections.defaultdict(dict)
+    def _containers_kwargs(self, kwargs):
+        """Return the keyword arguments of the key and value containers, which
+        only receive the call state if they take it.
+        """
+        return tuple(
+            kwargs if container is not None and _takes_call_state(container) else {}
+            for container in (self.key_container, self.value_container)
+        )
 
-        # Deserialize keys
-        if self.key_container is None:
-            keys = {k: k for k in value.keys()}
-        else:
-            keys = {}
-            for key in value.keys():
-                try:
-                    keys[key] = self.key_container.deserialize(key)
-                except ValidationError as error:
-                    errors[key]['key'] = error.messages
+    def _try_deserialize(self, value, attr, data, validate=True, **kwargs):
+        if not isinstance(value, _Mapping):
+            return Failure(self._make_error('invalid'))
+        key_container, value_container = self.key_container, self.value_container
+        if not value_container and not key_container:
+            return value
+        if self._has_primitives(value):
+            return self.mapping_type(value)
 
-        # Deserialize values
+        key_kwargs, value_kwargs = self._containers_kwargs(kwargs)
         result = self.mapping_type()
-        if self.value_container is None:
-            for k, v in iteritems(value):
-                if k in keys:
-                    result[keys[k]] = v
-        else:
-            for key, val in iteritems(value):
-                try:
-                    deser_val = self.value_container.deserialize(val)
-                except ValidationError as error:
+        errors = None
+        for key, val in iteritems(value):
+            deser_key = key
+            if key_container is not None:
+                deser_key = key_container._deserialize_result(
+                    key, validate=validate, **key_kwargs
+                )
+                if isinstance(deser_key, Failure):
+                    errors = errors or collections.defaultdict(dict)
+                    errors[key]['key'] = deser_key.error.messages
+                    deser_key = missing_
+            deser_val = val
+            if value_container is not None:
+                deser_val = value_container._deserialize_result(
+                    val, validate=validate, **value_kwargs
+                )
+                if isinstance(deser_val, Failure):
+                    error = deser_val.error
+                    errors = errors or collections.defaultdict(dict)
                     errors[key]['value'] = error.messages
-                    if error.valid_data is not None and key in keys:
-                        result[keys[key]] = error.valid_data
-                else:
-                    if key in keys:
-                        result[keys[key]] = deser_val
+                    deser_val = error.valid_data
+                    if deser_val is None:
+                        continue
+            if deser_key is not missing_:
+                result[deser_key] = deser_val
 
         if errors:
-            raise ValidationError(errors, valid_data=result)
+            return Failure(ValidationError(errors, valid_data=result))
 
         return result
 
@@ -1490,6 +2267,9 @@ class Method(Field):
         ``serialize`` to not be passed at all.
     .. versionchanged:: 3.0.0
         Removed ``method_name`` parameter.
+    .. versionchanged:: 3.0.0
+        Methods are resolved when the field is bound to a schema. A `ValueError`
+        is raised at that point if a method is missing or not callable.
     """
     _CHECK_ATTRIBUTE = False
 
@@ -1500,21 +2280,40 @@ class Method(Field):
         super(Method, self).__init__(**kwargs)
         self.serialize_method_name = serialize
         self.deserialize_method_name = deserialize
+        # Parent the methods below were resolved from
+        self._methods_parent = None
+        self._serialize_method = None
+        self._deserialize_method = None
+
+    def _bind_to_schema(self, field_name, schema):
+        super(Method, self)._bind_to_schema(field_name, schema)
+        # Resolve the methods once, so that missing methods are reported
+        # when the schema is created
+        self._serialize_method = self._get_method(self.serialize_method_name)
+        self._deserialize_method = self._get_method(self.deserialize_method_name)
+        self._methods_parent = self.parent
+
+    def _get_method(self, method_name):
+        if not method_name:
+            return None
+        return utils.callable_or_raise(getattr(self.parent, method_name, None))
 
     def _serialize(self, value, attr, obj, **kwargs):
         if not self.serialize_method_name:
             return missing_
 
-        method = utils.callable_or_raise(
-            getattr(self.parent, self.serialize_method_name, None),
-        )
+        if self._methods_parent is self.parent:
+            method = self._serialize_method
+        else:
+            method = self._get_method(self.serialize_method_name)
         return method(obj)
 
     def _deserialize(self, value, attr, data, **kwargs):
         if self.deserialize_method_name:
-            method = utils.callable_or_raise(
-                getattr(self.parent, self.deserialize_method_name, None),
-            )
+            if self._methods_parent is self.parent:
+                method = self._deserialize_method
+            else:
+                method = self._get_method(self.deserialize_method_name)
             return method(value)
         return value
 
@@ -1549,17 +2348,33 @@ class Function(Field):
         super(Function, self).__init__(**kwargs)
         self.serialize_func = serialize and utils.callable_or_raise(serialize)
         self.deserialize_func = deserialize and utils.callable_or_raise(deserialize)
+        # Whether the functions take a context argument, resolved once
+        self._serialize_takes_context = bool(serialize) and self._takes_context(serialize)
+        self._deserialize_takes_context = (
+            bool(deserialize) and self._takes_context(deserialize)
+        )
 
     def _serialize(self, value, attr, obj, **kwargs):
-        return self._call_or_raise(self.serialize_func, obj, attr)
+        return self._call_or_raise(
+            self.serialize_func, obj, attr, takes_context=self._serialize_takes_context,
+        )
 
     def _deserialize(self, value, attr, data, **kwargs):
         if self.deserialize_func:
-            return self._call_or_raise(self.deserialize_func, value, attr)
+            return self._call_or_raise(
+                self.deserialize_func, value, attr,
+                takes_context=self._deserialize_takes_context,
+            )
         return value
 
-    def _call_or_raise(self, func, value, attr):
-        if len(utils.get_func_args(func)) > 1:
+    @staticmethod
+    def _takes_context(func):
+        return len(utils.get_func_args(func)) > 1
+
+    def _call_or_raise(self, func, value, attr, takes_context=None):
+        if takes_context is None:
+            takes_context = self._takes_context(func)
+        if takes_context:
             if self.parent.context is None:
                 msg = 'No context available for Function field {0!r}'.format(attr)
                 raise ValidationError(msg)
@@ -7,14 +7,17 @@ import datetime as dt
 import uuid
 import decimal
 import functools
+from itertools import chain
 import copy
 import inspect
 import json
+import numbers
 import warnings
 
 from marshmallow import base, fields as ma_fields, class_registry
-from marshmallow.error_store import ErrorStore
-from marshmallow.fields import Nested
+from marshmallow.cache import LRUCache
+from marshmallow.error_store import ErrorStore, Failure
+from marshmallow.fields import Field, Nested, _inherits, _takes_call_state
 from marshmallow.compat import iteritems, iterkeys, with_metaclass, text_type, binary_type, Mapping
 from marshmallow.exceptions import ValidationError, StringNotCollectionError
 from marshmallow.orderedset import OrderedSet
@@ -27,11 +30,101 @@ from marshmallow.decorators import (
     VALIDATES_SCHEMA,
 )
 from marshmallow.utils import (
-    RAISE, EXCLUDE, INCLUDE, missing, set_value, get_value,
-    is_collection, is_instance_or_subclass, is_iterable_but_not_string,
+    RAISE, EXCLUDE, INCLUDE, missing, set_value, get_value, get_source_fetcher,
+    compile_setter, is_collection, is_instance_or_subclass, is_iterable_but_not_string,
 )
 
 
+# Values that `Schema.snapshot` keeps as they are rather than serialized
+_IMMUTABLE_TYPES = (
+    text_type, binary_type, numbers.Number, dt.date, dt.time, dt.timedelta,
+    uuid.UUID, type(None),
+)
+
+
+class _Snapshot(object):
+    """State of an object captured by `Schema.snapshot`.
+
+    :param dict values: Unserialized values of fields, by field name.
+    :param dict serialized: Serialized values of fields whose values are not
+        kept as they are, by field name.
+    :param dict nested: Snapshots of the objects of `Nested` fields (a list of
+        snapshots if ``many=True``), by field name.
+    """
+    __slots__ = ('values', 'serialized', 'nested')
+
+    def __init__(self, values, serialized, nested):
+        self.values = values
+        self.serialized = serialized
+        self.nested = nested
+
+
+_snapshot_kinds = {}
+
+
+def _snapshot_kind(field_obj):
+    """Return how `Schema.snapshot` captures the values of ``field_obj``:
+    ``'nested'`` for objects of `Nested` fields, ``'value'`` for values pulled
+    from the object or ``'serialized'`` if the field may not use them.
+    """
+    cls = type(field_obj)
+    try:
+        return _snapshot_kinds[cls]
+    except KeyError:
+        pass
+    if not cls._CHECK_ATTRIBUTE or not _inherits(cls, Field, ('serialize',)):
+        kind = 'serialized'
+    elif issubclass(cls, Nested):
+        kind = 'nested' if _inherits(cls, Nested, ('_serialize',)) else 'serialized'
+    else:
+        kind = 'value'
+    _snapshot_kinds[cls] = kind
+    return kind
+
+
+def _same_value(value, old):
+    """Whether ``value``, a value kept by `Schema.snapshot`, serializes like
+    ``old``. Values that compare equal may still differ in their serialized
+    form, e.g. datetimes in different time zones or decimals of different
+    precisions.
+    """
+    if type(value) is not type(old) or value != old:
+        return False
+    if isinstance(value, (dt.datetime, dt.time)):
+        return value.utcoffset() == old.utcoffset()
+    if isinstance(value, decimal.Decimal):
+        return value.as_tuple() == old.as_tuple()
+    return True
+
+
+def _patches_nested(field_obj, value, base_value):
+    """Whether `Schema.load_patch` applies ``value`` to ``base_value``, the
+    loaded value of ``field_obj``, rather than loading it in full.
+    """
+    return (
+        isinstance(field_obj, Nested) and not field_obj.many and
+        field_obj.reference is None and
+        isinstance(value, Mapping) and isinstance(base_value, Mapping) and
+        _inherits(
+            type(field_obj), Nested, ('deserialize', '_deserialize', '_deserialize_result'),
+        ) and
+        not field_obj.schema._custom_load
+    )
+
+
+def _set_copied_value(dct, key, value):
+    """Same as `set_value`, but copy the dicts along a dot-delimited ``key``
+    rather than modifying them.
+    """
+    head, sep, rest = key.partition('.')
+    if sep:
+        target = dct.get(head)
+        target = dict(target) if isinstance(target, Mapping) else {}
+        _set_copied_value(target, rest, value)
+        value = target
+    dct[head] = value
+
+
 def _get_fields(attrs, field_class, pop=False, ordered=False):
     """Get fields from a class. If ordered=True, fields will sorted by creation index.
 
@@ -140,6 +233,21 @@ class SchemaMeta(type):
         if name and self.opts.register:
             class_registry.register(name, self)
         self._hooks = self.resolve_hooks()
+        mro = inspect.getmro(self)
+
+        def overridden(*names):
+            return any(
+                next(klass for klass in mro if name in klass.__dict__) is not BaseSchema
+                for name in names
+            )
+        self._custom_get_attribute = overridden('get_attribute')
+        # Nested fields use the non-raising `_dump_result` and `_load_result`
+        # unless the methods that raise their errors are overridden
+        self._custom_dump = overridden('dump', 'handle_error')
+        self._custom_load = overridden('load', '_do_load', 'handle_error')
+        # Serialized objects shared by all the instances of the class
+        dump_cache_size = self.opts.dump_cache_size
+        self._dump_cache = LRUCache(dump_cache_size) if dump_cache_size else None
 
     def resolve_hooks(self):
         """Add in the decorated processors
@@ -201,6 +309,9 @@ class SchemaOpts(object):
             raise ValueError('`exclude` must be a list or tuple.')
         self.dateformat = getattr(meta, 'dateformat', None)
         self.datetimeformat = getattr(meta, 'datetimeformat', None)
+        self.datetime_cache_size = getattr(meta, 'datetime_cache_size', None)
+        self.dump_cache_size = getattr(meta, 'dump_cache_size', None)
+        self.projection_cache_size = getattr(meta, 'projection_cache_size', 32)
         if hasattr(meta, 'json_module'):
             warnings.warn(
                 'The json_module class Meta option is deprecated. Use render_module instead.',
@@ -327,6 +438,24 @@ class BaseSchema(base.SchemaABC):
             Nested fields can be represented with dot delimiters.
         - ``dateformat``: Date format for all DateTime fields that do not have their
             date format explicitly specified.
+        - ``datetime_cache_size``: If set, `DateTime`, `Date` and `Time` fields
+            that do not set ``cache_size`` memoize up to this many parsed and
+            formatted values each.
+        - ``dump_cache_size``: If set, `Schema.dump` memoizes the serialized
+            form of up to this many objects across calls and instances of the
+            schema, keyed on `get_dump_cache_key`. Each dump returns a shallow
+            copy of the cached result, whose nested values are shared and must
+            not be modified. Objects are not cached when the schema
+            has a ``context``, when a collection is passed to pass_many
+            dump methods, or when the schema is dumped by a `Nested` field.
+        - ``projection_cache_size``: Number of projections of a schema instance,
+            as selected by the ``only`` and ``exclude`` arguments of `Schema.dump`
+            and `Schema.load`, to keep ready for use. Defaults to 32. Projections
+            are built from the fields declared on the class and the ``only`` and
+            ``exclude`` options passed to the constructor. Changes made to the
+            instance afterwards, such as to its ``fields`` or ``declared_fields``,
+            are not carried over to them. Projections share the ``context`` of
+            the schema.
         - ``render_module``: Module to use for `loads` and `dumps`. Defaults to
             `json` from the standard library.
         - ``ordered``: If `True`, order serialization output according to the
@@ -356,6 +485,9 @@ class BaseSchema(base.SchemaABC):
             raise StringNotCollectionError('"exclude" should be a list of strings')
         # copy declared fields from metaclass
         self.declared_fields = copy.deepcopy(self._declared_fields)
+        # Options as passed, to which per-call projections are applied
+        self._projection_base = (only, exclude)
+        self._projections = None
         self.many = many
         self.only = only
         self.exclude = exclude
@@ -365,9 +497,18 @@ class BaseSchema(base.SchemaABC):
         self.partial = partial
         self.unknown = unknown or self.opts.unknown
         self.context = context or {}
+        if self._dump_cache is not None:
+            # Cache keys are specific to the fields that are dumped
+            self._dump_cache_config = (
+                None if only is None else frozenset(only),
+                frozenset(exclude or ()), frozenset(self.load_only),
+            )
         self._normalize_nested_options()
         #: Dictionary mapping field_names -> :class:`Field` objects
         self.fields = self._init_fields()
+        self._bound_hooks = self._bind_hooks()
+        # Mapping of source type -> (fetch function, field keys) or None
+        self._source_plans = {}
         messages = {}
         messages.update(self._default_error_messages)
         for cls in reversed(self.__class__.__mro__):
@@ -410,6 +551,44 @@ class BaseSchema(base.SchemaABC):
         """
         return get_value(obj, attr, default)
 
+    def get_dump_cache_key(self, obj):
+        """Return a hashable key that identifies the serialized form of ``obj``
+        when the ``dump_cache_size`` class Meta option is set, or `None` to
+        serialize ``obj`` without caching. By default, no object is cached.
+
+        The key must change whenever the serialized form of ``obj`` changes,
+        for instance: ::
+
+            def get_dump_cache_key(self, obj):
+                return (type(obj), obj.id, obj.version)
+
+        It does not need to account for ``only``, ``exclude`` and ``load_only``.
+        The cache is not used for schemas with a ``context``, for collections
+        dumped with pass_many `pre_dump` or `post_dump` methods, or for schemas
+        dumped by `Nested` fields.
+
+        .. versionadded:: 3.0.0
+        """
+        return None
+
+    def dump_cache_info(self):
+        """Return the statistics of the dump cache, or `None` if the
+        ``dump_cache_size`` class Meta option is not set.
+
+        .. versionadded:: 3.0.0
+        """
+        if self._dump_cache is None:
+            return None
+        return self._dump_cache.cache_info()
+
+    def clear_dump_cache(self):
+        """Remove all the serialized objects from the dump cache.
+
+        .. versionadded:: 3.0.0
+        """
+        if self._dump_cache is not None:
+            self._dump_cache.clear()
+
     ##### Serialization/Deserialization API #####
 
     @staticmethod
@@ -432,10 +611,20 @@ class BaseSchema(base.SchemaABC):
             return err.valid_data or missing
         return value
 
+    def _get_accessor(self):
+        """Return the function fields use to pull values from objects:
+        `get_attribute` if it is overridden, on the class or on this instance,
+        or `marshmallow.utils.get_value`, for which fields use the accessors
+        compiled when they are bound.
+        """
+        if self._custom_get_attribute or 'get_attribute' in self.__dict__:
+            return self.get_attribute
+        return get_value
+
     def _serialize(
         self, obj, fields_dict, error_store, many=False,
         accessor=None, dict_class=dict, index_errors=True,
-        index=None,
+        index=None, memo=None,
     ):
         """Takes raw data (a dict, list, or other object) and a dict of
         fields to output and serializes the data based on those fields.
@@ -451,6 +640,8 @@ class BaseSchema(base.SchemaABC):
             ``self.errors`` when ``many=True``.
         :param int index: Index of the item being serialized (for storing errors) if
             serializing a collection, otherwise `None`.
+        :param dict memo: Results of deduplicated or referenced nested objects,
+            shared by all the schemas taking part in a top-level dump.
         :return: A dictionary of the marshalled data
 
         .. versionchanged:: 1.0.0
@@ -463,18 +654,36 @@ class BaseSchema(base.SchemaABC):
                 self._serialize(
                     d, fields_dict, error_store, many=False,
                     dict_class=dict_class, accessor=accessor,
-                    index=idx, index_errors=index_errors,
+                    index=idx, index_errors=index_errors, memo=memo,
                 )
                 for idx, d in enumerate(obj)
             ]
             self._pending = False
             return ret
         items = []
+        # Values of plain attribute fields, fetched in one step by a source adapter
+        fetched = (
+            self._fetch_values(obj)
+            if accessor in (None, get_value) and fields_dict is self.fields else None
+        )
+        field_keys, values = fetched or ({}, None)
+        state_fields = self._call_state_fields if fields_dict is self.fields else None
         for attr_name, field_obj in iteritems(fields_dict):
             if getattr(field_obj, 'load_only', False):
                 continue
             key = field_obj.data_key or attr_name
-            getter = lambda d: field_obj.serialize(attr_name, d, accessor=accessor)
+            if attr_name in field_keys:
+                value = values[field_keys[attr_name]]
+                getter = lambda d: field_obj._serialize_value(value, attr_name, d)
+            elif (
+                attr_name in state_fields if state_fields is not None
+                else _takes_call_state(field_obj)
+            ):
+                getter = lambda d: field_obj.serialize(
+                    attr_name, d, accessor=accessor, memo=memo,
+                )
+            else:
+                getter = lambda d: field_obj.serialize(attr_name, d, accessor=accessor)
             value = self._call_and_store(
                 getter_func=getter,
                 data=obj,
@@ -488,13 +697,60 @@ class BaseSchema(base.SchemaABC):
         ret = dict_class(items)
         return ret
 
-    def dump(self, obj, many=None):
+    def _fetch_values(self, obj):
+        """Fetch the values of all plain attribute fields from ``obj`` using
+        the source adapter for its type. Return a ``(field_keys, values)`` pair,
+        where ``field_keys`` maps field names to fetched keys and ``values``
+        maps keys to values, or `None` if there is no adapter for the type.
+        """
+        cls = type(obj)
+        # On errors, e.g. raised by a property, fields pull their values one
+        # by one, so that errors are stored under the key of the field
+        try:
+            plan = self._source_plans[cls]
+        except KeyError:
+            try:
+                plan = self._make_source_plan(obj)
+            except Exception:
+                return None
+            self._source_plans[cls] = plan
+        if plan is None:
+            return None
+        fetch, field_keys = plan
+        try:
+            values = fetch(obj)
+        except Exception:
+            return None
+        return field_keys, values
+
+    def _make_source_plan(self, obj):
+        field_keys = {}
+        for attr_name, field_obj in iteritems(self.fields):
+            # Fields taking the state of the dump fetch their own values
+            if getattr(field_obj, 'load_only', False) or attr_name in self._call_state_fields:
+                continue
+            key = field_obj._get_fetch_key()
+            if key is not None:
+                field_keys[attr_name] = key
+        if not field_keys:
+            return None
+        fetch = get_source_fetcher(obj, list(OrderedSet(field_keys.values())))
+        if fetch is None:
+            return None
+        return fetch, field_keys
+
+    def dump(self, obj, many=None, only=None, exclude=None):
         """Serialize an object to native Python data types according to this
         Schema's fields.
 
         :param obj: The object to serialize.
         :param bool many: Whether to serialize `obj` as a collection. If `None`, the value
             for `self.many` is used.
+        :param tuple|list only: Whitelist of the fields to serialize in this call,
+            among the fields of the schema. Nested fields can be represented with
+            dot delimiters.
+        :param tuple|list exclude: Blacklist of the fields to leave out of this
+            call. Nested fields can be represented with dot delimiters.
         :return: A dict of serialized data
         :rtype: dict
 
@@ -503,7 +759,83 @@ class BaseSchema(base.SchemaABC):
             This method returns the serialized data rather than a ``(data, errors)`` duple.
             A :exc:`ValidationError <marshmallow.exceptions.ValidationError>` is raised
             if ``obj`` is invalid.
+        .. versionchanged:: 3.0.0
+            Serialized objects are cached if the ``dump_cache_size`` class Meta
+            option is set. Collections are then serialized one object at a time.
+        .. versionchanged:: 3.0.0
+            Add ``only`` and ``exclude`` parameters.
+        """
+        if only is not None or exclude:
+            return self._get_projection(only, exclude).dump(
+                obj, many=self.many if many is None else many,
+            )
+        if self._dump_cache is not None:
+            result, errors = self._dump_cached(obj, many)
+        else:
+            result, errors = self._dump_result(obj, many)
+        if errors:
+            exc = ValidationError(
+                errors,
+                data=obj,
+                valid_data=result,
+            )
+            # User-defined error handler
+            self.handle_error(exc, obj)
+            raise exc
+
+        return result
+
+    def _dump_cached(self, obj, many=None):
+        """Same as `_dump_result`, but reuse the serialized form of objects
+        found in the dump cache.
         """
+        if self.context:
+            # The serialized form may depend on the context, which keys do not cover
+            return self._dump_result(obj, many)
+        many = self.many if many is None else bool(many)
+        if not many:
+            return self._dump_one_cached(obj)
+        if (
+            not is_iterable_but_not_string(obj) or
+            # These process the whole collection, which is dumped at once
+            self._bound_hooks[(PRE_DUMP, True)] or self._bound_hooks[(POST_DUMP, True)]
+        ):
+            return self._dump_result(obj, many)
+        error_store = ErrorStore()
+        index_errors = self.opts.index_errors
+        result = []
+        for idx, each in enumerate(obj):
+            data, errors = self._dump_one_cached(each)
+            if errors:
+                error_store.store_error(errors, index=idx if index_errors else None)
+            result.append(data)
+        return result, error_store.errors
+
+    def _dump_one_cached(self, obj):
+        key = self.get_dump_cache_key(obj)
+        if key is None:
+            return self._dump_result(obj, many=False)
+        key = (self._dump_cache_config, self.ordered, key)
+        result = self._dump_cache.get(key)
+        if result is missing:
+            result, errors = self._dump_result(obj, many=False)
+            if errors:
+                return result, errors
+            self._dump_cache.set(key, result)
+        # Callers may change the returned data, e.g. to add an envelope
+        return copy.copy(result), {}
+
+    def _dump_result(self, obj, many=None, memo=None):
+        """Same as `dump`, but return the serialized data and the error messages
+        rather than raising a :exc:`ValidationError`.
+
+        :param dict memo: Results of deduplicated or referenced nested objects,
+            shared by all the schemas taking part in a top-level dump.
+        :return: A ``(result, errors)`` duple.
+        """
+        return self._dump_data(obj, many, {} if memo is None else memo)
+
+    def _dump_data(self, obj, many, memo):
         error_store = ErrorStore()
         errors = {}
         many = self.many if many is None else bool(many)
@@ -530,9 +862,10 @@ class BaseSchema(base.SchemaABC):
                 self.fields,
                 error_store,
                 many=many,
-                accessor=self.get_attribute,
+                accessor=self._get_accessor(),
                 dict_class=self.dict_class,
                 index_errors=self.opts.index_errors,
+                memo=memo,
             )
             errors = error_store.errors
 
@@ -546,17 +879,7 @@ class BaseSchema(base.SchemaABC):
                 )
             except ValidationError as error:
                 errors = error.normalized_messages()
-        if errors:
-            exc = ValidationError(
-                errors,
-                data=obj,
-                valid_data=result,
-            )
-            # User-defined error handler
-            self.handle_error(exc, obj)
-            raise exc
-
-        return result
+        return result, errors
 
     def dumps(self, obj, many=None, *args, **kwargs):
         """Same as :meth:`dump`, except return a JSON-encoded string.
@@ -576,9 +899,183 @@ class BaseSchema(base.SchemaABC):
         serialized = self.dump(obj, many=many)
         return self.opts.render_module.dumps(serialized, *args, **kwargs)
 
+    def snapshot(self, obj):
+        """Capture the state of ``obj``, to pass to `dump_delta` once ``obj`` is
+        modified.
+
+        Immutable values, such as strings, numbers and dates, are kept as they
+        are. The objects of `Nested <marshmallow.fields.Nested>` fields are
+        captured recursively. Other values are serialized.
+
+        :param obj: The object to capture.
+        :return: An opaque snapshot of ``obj``.
+
+        .. versionadded:: 3.0.0
+        """
+        snapshot, errors = self._snapshot_result(obj)
+        if errors:
+            raise ValidationError(errors, data=obj)
+        return snapshot
+
+    def _snapshot_result(self, obj):
+        error_store = ErrorStore()
+        accessor = self._get_accessor()
+        values, serialized, nested = {}, {}, {}
+        for attr_name, field_obj in iteritems(self.fields):
+            if field_obj.load_only:
+                continue
+            key = field_obj.data_key or attr_name
+            kind = _snapshot_kind(field_obj)
+            if kind == 'serialized':
+                serialized[attr_name] = self._call_and_store(
+                    getter_func=lambda d: field_obj.serialize(attr_name, d, accessor=accessor),
+                    data=obj,
+                    field_name=key,
+                    error_store=error_store,
+                )
+                continue
+            value = field_obj.get_value(obj, attr_name, accessor=accessor)
+            if kind == 'nested':
+                nested[attr_name] = self._call_and_store(
+                    getter_func=lambda value: self._snapshot_nested(field_obj, value),
+                    data=value,
+                    field_name=key,
+                    error_store=error_store,
+                )
+            elif value is missing or isinstance(value, _IMMUTABLE_TYPES):
+                values[attr_name] = value
+            else:
+                serialized[attr_name] = self._call_and_store(
+                    getter_func=lambda d: field_obj._serialize_value(value, attr_name, d),
+                    data=obj,
+                    field_name=key,
+                    error_store=error_store,
+                )
+        return _Snapshot(values, serialized, nested), error_store.errors
+
+    @staticmethod
+    def _snapshot_nested(field_obj, value):
+        if value is None or value is missing:
+            return value
+        schema = field_obj.schema
+        if not field_obj.many:
+            snapshot, errors = schema._snapshot_result(value)
+            if errors:
+                raise ValidationError(errors)
+            return snapshot
+        snapshots, errors = [], {}
+        for idx, each in enumerate(value):
+            snapshot, each_errors = (None, None) if each is None else schema._snapshot_result(each)
+            if each_errors:
+                errors[idx] = each_errors
+            snapshots.append(snapshot)
+        if errors:
+            raise ValidationError(errors)
+        return snapshots
+
+    def dump_delta(self, obj, previous):
+        """Serialize the fields of ``obj`` that changed since ``previous``.
+
+        :param obj: The object to serialize.
+        :param previous: A snapshot of ``obj`` returned by `snapshot`, or the
+            result of an earlier call to `dump` for ``obj``. With a snapshot,
+            fields whose values did not change are not serialized at all.
+        :return: A dict of the serialized values of the fields that changed.
+            `Nested <marshmallow.fields.Nested>` fields of single objects hold
+            the delta of the nested object. Fields that became missing are not
+            included and dump processors are not invoked.
+        :rtype: dict
+
+        .. versionadded:: 3.0.0
+        """
+        delta, errors = self._dump_delta_result(obj, previous)
+        if errors:
+            exc = ValidationError(errors, data=obj, valid_data=delta)
+            self.handle_error(exc, obj)
+            raise exc
+        return delta
+
+    def _dump_delta_result(self, obj, previous):
+        error_store = ErrorStore()
+        accessor = self._get_accessor()
+        items = []
+        for attr_name, field_obj in iteritems(self.fields):
+            if field_obj.load_only:
+                continue
+            key = field_obj.data_key or attr_name
+            value = self._call_and_store(
+                getter_func=lambda d: self._dump_field_delta(
+                    field_obj, attr_name, key, d, previous, accessor,
+                ),
+                data=obj,
+                field_name=key,
+                error_store=error_store,
+            )
+            if value is not missing:
+                items.append((key, value))
+        return self.dict_class(items), error_store.errors
+
+    def _dump_field_delta(self, field_obj, attr_name, key, obj, previous, accessor):
+        """Return the serialized value of a field of ``obj`` if it changed since
+        ``previous``, or `missing`.
+        """
+        if isinstance(previous, _Snapshot):
+            if attr_name in previous.values:
+                value = field_obj.get_value(obj, attr_name, accessor=accessor)
+                old = previous.values[attr_name]
+                if _same_value(value, old):
+                    return missing
+                # Values that differ may still serialize the same way, e.g.
+                # ``1`` and ``1.0`` for a `Float` field
+                value = field_obj._serialize_value(value, attr_name, obj)
+                old = field_obj._serialize_value(old, attr_name, obj)
+                return missing if value == old else value
+            if attr_name in previous.nested:
+                value = field_obj.get_value(obj, attr_name, accessor=accessor)
+                return self._dump_nested_delta(
+                    field_obj, attr_name, obj, value, previous.nested[attr_name],
+                )
+            old = previous.serialized.get(attr_name, missing)
+        else:
+            old = previous.get(key, missing)
+            if (
+                isinstance(old, Mapping) and not field_obj.many and
+                _snapshot_kind(field_obj) == 'nested'
+            ):
+                value = field_obj.get_value(obj, attr_name, accessor=accessor)
+                if value is not None and value is not missing:
+                    return self._dump_nested_delta(field_obj, attr_name, obj, value, old)
+        value = field_obj.serialize(attr_name, obj, accessor=accessor)
+        return missing if value == old else value
+
+    @staticmethod
+    def _dump_nested_delta(field_obj, attr_name, obj, value, old):
+        schema = field_obj.schema
+        if value is None or value is missing or old is None or old is missing:
+            if value is old:
+                return missing
+        elif not field_obj.many:
+            delta, errors = schema._dump_delta_result(value, old)
+            if errors:
+                raise ValidationError(errors, valid_data=delta)
+            return delta or missing
+        elif is_collection(value) and len(value) == len(old):
+            for each, each_old in zip(value, old):
+                if each is None or each_old is None:
+                    if each is not each_old:
+                        break
+                    continue
+                delta, errors = schema._dump_delta_result(each, each_old)
+                if errors or delta:
+                    break
+            else:
+                return missing
+        return field_obj._serialize_value(value, attr_name, obj)
+
     def _deserialize(
         self, data, fields_dict, error_store, many=False, partial=False,
         unknown=RAISE, dict_class=dict, index_errors=True, index=None,
+        validate_only=False, validate=True, memo=None,
     ):
         """Deserialize ``data`` based on the schema defined by ``fields_dict``.
 
@@ -598,6 +1095,11 @@ class BaseSchema(base.SchemaABC):
             ``self.errors`` when ``many=True``.
         :param int index: Index of the item being serialized (for storing errors) if
             serializing a collection, otherwise `None`.
+        :param bool validate_only: Whether to only validate ``data`` and leave the
+            dictionaries returned empty.
+        :param bool validate: Whether to run the validators of the fields.
+        :param dict memo: Loaded objects that nested references resolve to,
+            shared by all the schemas taking part in a top-level load.
         :return: A dictionary of the deserialized data.
         """
         index = index if index_errors else None
@@ -612,7 +1114,8 @@ class BaseSchema(base.SchemaABC):
                         d, fields_dict, error_store, many=False,
                         partial=partial, unknown=unknown,
                         dict_class=dict_class, index=idx,
-                        index_errors=index_errors,
+                        index_errors=index_errors, validate_only=validate_only,
+                        validate=validate, memo=memo,
                     )
                     for idx, d in enumerate(data)
                 ]
@@ -623,7 +1126,14 @@ class BaseSchema(base.SchemaABC):
         if not isinstance(data, Mapping):
             error_store.store_error([self.error_messages['type']], index=index)
         else:
-            partial_is_collection = is_collection(partial)
+            # `partial` is usually a boolean, which spares the collection check
+            partial_is_collection = (
+                partial not in (None, False, True) and is_collection(partial)
+            )
+            if fields_dict is self.fields:
+                setters, state_fields = self._load_setters, self._call_state_fields
+            else:
+                setters, state_fields = {}, None
             for attr_name, field_obj in iteritems(fields_dict):
                 if field_obj.dump_only:
                     continue
@@ -639,6 +1149,11 @@ class BaseSchema(base.SchemaABC):
                     ):
                         continue
                 d_kwargs = {}
+                if (
+                    attr_name in state_fields if state_fields is not None
+                    else _takes_call_state(field_obj)
+                ):
+                    d_kwargs['memo'] = memo
                 if isinstance(field_obj, Nested):
                     # Allow partial loading of nested schemas.
                     if partial_is_collection:
@@ -649,30 +1164,38 @@ class BaseSchema(base.SchemaABC):
                     else:
                         sub_partial = partial
                     d_kwargs['partial'] = sub_partial
-                getter = lambda val: field_obj.deserialize(
-                    val, field_name,
-                    data, **d_kwargs
+                    d_kwargs['validate_only'] = validate_only
+                # Fields return their errors rather than raising them
+                value = field_obj._deserialize_result(
+                    raw_value, field_name,
+                    data, validate=validate, **d_kwargs
                 )
-                value = self._call_and_store(
-                    getter_func=getter,
-                    data=raw_value,
-                    field_name=field_name,
-                    error_store=error_store,
-                    index=index,
-                )
-                if value is not missing:
-                    key = fields_dict[attr_name].attribute or attr_name
-                    set_value(ret, key, value)
+                if isinstance(value, Failure):
+                    error = value.error
+                    error_store.store_error(error.messages, field_name, index=index)
+                    # When a Nested field fails validation, the marshalled data is stored
+                    # on the ValidationError's valid_data attribute
+                    value = error.valid_data or missing
+                if value is not missing and not validate_only:
+                    if attr_name in setters:
+                        setters[attr_name](ret, value)
+                    else:
+                        key = fields_dict[attr_name].attribute or attr_name
+                        set_value(ret, key, value)
             if unknown != EXCLUDE:
-                fields = {
-                    field_obj.data_key or field_name
-                    for field_name, field_obj in fields_dict.items()
-                    if not field_obj.dump_only
-                }
+                if fields_dict is self.fields:
+                    fields = self._load_keys
+                else:
+                    fields = {
+                        field_obj.data_key or field_name
+                        for field_name, field_obj in fields_dict.items()
+                        if not field_obj.dump_only
+                    }
                 for key in set(data) - fields:
                     value = data[key]
                     if unknown == INCLUDE:
-                        set_value(ret, key, value)
+                        if not validate_only:
+                            set_value(ret, key, value)
                     elif unknown == RAISE:
                         error_store.store_error(
                             [self.error_messages['unknown']],
@@ -681,7 +1204,10 @@ class BaseSchema(base.SchemaABC):
                         )
         return ret
 
-    def load(self, data, many=None, partial=None, unknown=None):
+    def load(
+        self, data, many=None, partial=None, unknown=None, validate=True,
+        only=None, exclude=None,
+    ):
         """Deserialize a data structure to an object defined by this Schema's fields.
 
         :param dict data: The data to deserialize.
@@ -694,6 +1220,15 @@ class BaseSchema(base.SchemaABC):
         :param unknown: Whether to exclude, include, or raise an error for unknown
             fields in the data. Use `EXCLUDE`, `INCLUDE` or `RAISE`.
             If `None`, the value for `self.unknown` is used.
+        :param bool validate: Whether to validate the data. If `False`, the data
+            is only deserialized: the validators of fields and the validation
+            methods of schemas, including nested ones, are skipped. Required and
+            unknown fields are still checked, as set by ``partial`` and ``unknown``.
+        :param tuple|list only: Whitelist of the fields to deserialize in this
+            call, among the fields of the schema. Nested fields can be represented
+            with dot delimiters.
+        :param tuple|list exclude: Blacklist of the fields to leave out of this
+            call. Nested fields can be represented with dot delimiters.
         :return: A dict of deserialized data
         :rtype: dict
 
@@ -702,14 +1237,21 @@ class BaseSchema(base.SchemaABC):
             This method returns the deserialized data rather than a ``(data, errors)`` duple.
             A :exc:`ValidationError <marshmallow.exceptions.ValidationError>` is raised
             if invalid data are passed.
+        .. versionchanged:: 3.0.0
+            Add ``validate``, ``only`` and ``exclude`` parameters.
         """
+        if only is not None or exclude:
+            return self._get_projection(only, exclude).load(
+                data, many=self.many if many is None else many, partial=partial,
+                unknown=unknown, validate=validate,
+            )
         return self._do_load(
             data, many, partial=partial, unknown=unknown,
-            postprocess=True,
+            postprocess=True, validate=validate,
         )
 
     def loads(
-        self, json_data, many=None, partial=None, unknown=None,
+        self, json_data, many=None, partial=None, unknown=None, validate=True,
         **kwargs
     ):
         """Same as :meth:`load`, except it takes a JSON string as input.
@@ -724,6 +1266,7 @@ class BaseSchema(base.SchemaABC):
         :param unknown: Whether to exclude, include, or raise an error for unknown
             fields in the data. Use `EXCLUDE`, `INCLUDE` or `RAISE`.
             If `None`, the value for `self.unknown` is used.
+        :param bool validate: Whether to validate the data. See `load`.
         :return: A dict of deserialized data
         :rtype: dict
 
@@ -732,9 +1275,45 @@ class BaseSchema(base.SchemaABC):
             This method returns the deserialized data rather than a ``(data, errors)`` duple.
             A :exc:`ValidationError <marshmallow.exceptions.ValidationError>` is raised
             if invalid data are passed.
+        .. versionchanged:: 3.0.0
+            Add ``validate`` parameter.
         """
         data = self.opts.render_module.loads(json_data, **kwargs)
-        return self.load(data, many=many, partial=partial, unknown=unknown)
+        return self.load(data, many=many, partial=partial, unknown=unknown, validate=validate)
+
+    def load_patch(self, patch, base, unknown=None):
+        """Apply ``patch``, data for some of the fields of an object, to ``base``,
+        the data of the same object previously loaded by this schema. Only the
+        patched fields are deserialized and validated; the values of the other
+        fields are taken from ``base`` as they are. Patches to a single `Nested`
+        object loaded as a dict are applied to it in the same way.
+
+        Schema-level validators receive the merged data, and the patch as the
+        original data. Those declaring the fields they depend on with
+        ``@validates_schema(fields=...)`` are skipped unless one of these is
+        patched. Post-load methods are invoked on the merged data.
+
+        :param dict patch: The data to deserialize.
+        :param dict base: The deserialized data to apply the patch to, as
+            returned by `load` before any post-load processing. It is not modified.
+        :param unknown: Whether to exclude, include, or raise an error for unknown
+            fields in the patch. Use `EXCLUDE`, `INCLUDE` or `RAISE`.
+            If `None`, the value for `self.unknown` is used.
+        :return: A dict of deserialized data
+        :rtype: dict
+
+        .. versionadded:: 3.0.0
+        """
+        result, errors = self._load_patch_result(patch, base, unknown=unknown)
+        if errors:
+            exc = ValidationError(
+                errors,
+                data=patch,
+                valid_data=result,
+            )
+            self.handle_error(exc, patch)
+            raise exc
+        return result
 
     def _run_validator(
         self, validator_func, output,
@@ -764,9 +1343,15 @@ class BaseSchema(base.SchemaABC):
         :rtype: dict
 
         .. versionadded:: 1.1.0
+        .. versionchanged:: 3.0.0
+            The deserialized data is not assembled unless validation methods
+            need it.
         """
         try:
-            self._do_load(data, many, partial=partial, postprocess=False)
+            self._do_load(
+                data, many, partial=partial, postprocess=False,
+                validate_only=True,
+            )
         except ValidationError as exc:
             return exc.messages
         return {}
@@ -775,7 +1360,7 @@ class BaseSchema(base.SchemaABC):
 
     def _do_load(
         self, data, many=None, partial=None, unknown=None,
-        postprocess=True,
+        postprocess=True, validate_only=False, validate=True,
     ):
         """Deserialize `data`, returning the deserialized result.
 
@@ -790,9 +1375,51 @@ class BaseSchema(base.SchemaABC):
             fields in the data. Use `EXCLUDE`, `INCLUDE` or `RAISE`.
             If `None`, the value for `self.unknown` is used.
         :param bool postprocess: Whether to run post_load methods..
+        :param bool validate_only: Whether to skip assembling the deserialized
+            data where no validation method needs it.
+        :param bool validate: Whether to run validators and validation methods.
         :return: A dict of deserialized data
         :rtype: dict
         """
+        result, errors = self._load_result(
+            data, many, partial=partial, unknown=unknown,
+            postprocess=postprocess, validate_only=validate_only, validate=validate,
+        )
+        if errors:
+            exc = ValidationError(
+                errors,
+                data=data,
+                valid_data=result,
+            )
+            self.handle_error(exc, data)
+            raise exc
+
+        return result
+
+    def _load_result(
+        self, data, many=None, partial=None, unknown=None,
+        postprocess=True, memo=None, validate_only=False, validate=True,
+    ):
+        """Same as `_do_load`, but return the deserialized data and the error
+        messages rather than raising a :exc:`ValidationError`.
+
+        :param dict memo: Loaded objects that nested references resolve to,
+            shared by all the schemas taking part in a top-level load.
+        :return: A ``(result, errors)`` duple.
+        """
+        # Validation methods receive the deserialized data
+        validate_only = validate_only and not (
+            validate and
+            (self._bound_hooks[VALIDATES] or self._has_processors(VALIDATES_SCHEMA))
+        )
+        return self._load_data(
+            data, many, partial, unknown, postprocess,
+            {} if memo is None else memo, validate_only, validate,
+        )
+
+    def _load_data(
+        self, data, many, partial, unknown, postprocess, memo, validate_only, validate,
+    ):
         error_store = ErrorStore()
         errors = {}
         many = self.many if many is None else bool(many)
@@ -824,11 +1451,15 @@ class BaseSchema(base.SchemaABC):
                 unknown=unknown,
                 dict_class=self.dict_class,
                 index_errors=self.opts.index_errors,
+                validate_only=validate_only,
+                validate=validate,
+                memo=memo,
             )
             # Run field-level validation
-            self._invoke_field_validators(error_store, data=result, many=many)
+            if validate:
+                self._invoke_field_validators(error_store, data=result, many=many)
             # Run schema-level validation
-            if self._has_processors(VALIDATES_SCHEMA):
+            if self._has_processors(VALIDATES_SCHEMA) and validate:
                 field_errors = bool(error_store.errors)
                 self._invoke_schema_validators(
                     error_store,
@@ -848,7 +1479,10 @@ class BaseSchema(base.SchemaABC):
                 )
             errors = error_store.errors
             # Run post processors
-            if not errors and postprocess and self._has_processors(POST_LOAD):
+            if (
+                not errors and postprocess and not validate_only and
+                self._has_processors(POST_LOAD)
+            ):
                 try:
                     result = self._invoke_load_processors(
                         POST_LOAD,
@@ -858,16 +1492,176 @@ class BaseSchema(base.SchemaABC):
                     )
                 except ValidationError as err:
                     errors = err.normalized_messages()
-        if errors:
-            exc = ValidationError(
-                errors,
-                data=data,
-                valid_data=result,
+        return result, errors
+
+    def _load_patch_result(self, patch, base, unknown=None, memo=None):
+        """Same as `load_patch`, but return the deserialized data and the error
+        messages rather than raising a :exc:`ValidationError`.
+
+        :return: A ``(result, errors)`` duple.
+        """
+        return self._load_patch_data(patch, base, unknown, {} if memo is None else memo)
+
+    def _load_patch_data(self, patch, base, unknown, memo):
+        error_store = ErrorStore()
+        unknown = unknown or self.unknown
+        if self._has_processors(PRE_LOAD):
+            try:
+                patch_data = self._invoke_load_processors(
+                    PRE_LOAD,
+                    patch,
+                    False,
+                    original_data=patch,
+                )
+            except ValidationError as err:
+                return None, err.normalized_messages()
+        else:
+            patch_data = patch
+        if not isinstance(patch_data, Mapping):
+            error_store.store_error([self.error_messages['type']])
+            return None, error_store.errors
+        # Split the patched fields between those loaded in full and the
+        # nested objects patched in turn
+        fields_dict, nested_fields = {}, {}
+        for attr_name, field_obj in iteritems(self.fields):
+            field_name = field_obj.data_key or attr_name
+            if field_obj.dump_only or field_name not in patch_data:
+                continue
+            base_value = get_value(base, field_obj.attribute or attr_name)
+            if _patches_nested(field_obj, patch_data[field_name], base_value):
+                nested_fields[attr_name] = field_obj
+            else:
+                fields_dict[attr_name] = field_obj
+        if nested_fields:
+            nested_keys = {
+                field_obj.data_key or attr_name
+                for attr_name, field_obj in iteritems(nested_fields)
+            }
+            data = {
+                key: value for key, value in iteritems(patch_data)
+                if key not in nested_keys
+            }
+        else:
+            data = patch_data
+        patched = self._deserialize(
+            data,
+            fields_dict,
+            error_store,
+            unknown=unknown,
+            dict_class=self.dict_class,
+            memo=memo,
+        )
+        for attr_name, field_obj in iteritems(nested_fields):
+            field_name = field_obj.data_key or attr_name
+            key = field_obj.attribute or attr_name
+            value, errors = field_obj.schema._load_patch_result(
+                patch_data[field_name], get_value(base, key),
+                unknown=field_obj.unknown, memo=memo,
             )
-            self.handle_error(exc, data)
-            raise exc
+            if not errors and field_obj.validators:
+                error = field_obj._validation_error(value)
+                errors = error and error.messages
+            if errors:
+                error_store.store_error(errors, field_name)
+            if value is not None:
+                set_value(patched, key, value)
+        self._invoke_field_validators(error_store, data=patched, many=False)
+        # Merge the patched values into a copy of the base data
+        result = self.dict_class(base)
+        heads = set()
+        for attr_name, field_obj in chain(iteritems(fields_dict), iteritems(nested_fields)):
+            key = field_obj.attribute or attr_name
+            heads.add(key.partition('.')[0])
+            value = get_value(patched, key)
+            if value is not missing:
+                _set_copied_value(result, key, value)
+        for key, value in iteritems(patched):
+            # Unknown fields included in the output
+            if key not in heads:
+                result[key] = value
+        if self._has_processors(VALIDATES_SCHEMA):
+            field_errors = bool(error_store.errors)
+            patched_names = frozenset(chain(fields_dict, nested_fields))
+            for pass_many in (True, False):
+                self._invoke_schema_validators(
+                    error_store,
+                    pass_many=pass_many,
+                    data=result,
+                    original_data=patch,
+                    many=False,
+                    field_errors=field_errors,
+                    patched=patched_names,
+                )
+        errors = error_store.errors
+        if not errors and self._has_processors(POST_LOAD):
+            try:
+                result = self._invoke_load_processors(
+                    POST_LOAD,
+                    result,
+                    False,
+                    original_data=patch,
+                )
+            except ValidationError as err:
+                errors = err.normalized_messages()
+        return result, errors
 
-        return result
+    def _get_projection(self, only, exclude):
+        """Return a copy of this schema restricted to the fields selected by
+        ``only`` and ``exclude``, as passed to `dump` or `load`. Copies are kept
+        in a cache keyed on the selected fields.
+
+        Copies are built from the class's declared fields and the options passed
+        to the constructor, not from the current state of this instance. They
+        share its ``context``; ``many`` must be passed to them explicitly.
+        """
+        if only is not None and not is_collection(only):
+            raise StringNotCollectionError('"only" should be a list of strings')
+        if exclude is not None and not is_collection(exclude):
+            raise StringNotCollectionError('"exclude" should be a list of strings')
+        cache_size = self.opts.projection_cache_size
+        if not cache_size:
+            projection = self._make_projection(only, exclude)
+        else:
+            key = (None if only is None else frozenset(only), frozenset(exclude or ()))
+            if self._projections is None:
+                self._projections = LRUCache(cache_size)
+            projection = self._projections.get(key)
+            if projection is missing:
+                projection = self._make_projection(only, exclude)
+                self._projections.set(key, projection)
+        # Shared with this schema, and with callers of other projections
+        projection.context = self.context
+        return projection
+
+    def _make_projection(self, only, exclude):
+        projection = copy.copy(self)
+        projection.declared_fields = copy.deepcopy(self._declared_fields)
+        # Apply the options of this schema, then those of the call, so that
+        # the options of nested fields are combined
+        projection.only, projection.exclude = self._projection_base
+        projection._normalize_nested_options()
+        base_only, base_exclude = projection.only, projection.exclude
+        projection.only, projection.exclude = only, exclude or ()
+        projection._normalize_nested_options()
+        if base_only is not None:
+            if projection.only is None:
+                projection.only = base_only
+            else:
+                invalid_fields = projection.only - base_only
+                if invalid_fields:
+                    message = 'Invalid fields for {0}: {1}.'.format(self, invalid_fields)
+                    raise ValueError(message)
+        projection.exclude = self.set_class(base_exclude or ()) | self.set_class(projection.exclude)
+        if self._dump_cache is not None:
+            projection._dump_cache_config = (
+                self._dump_cache_config,
+                None if only is None else frozenset(only), frozenset(exclude or ()),
+            )
+        projection.fields = projection._init_fields()
+        projection._bound_hooks = projection._bind_hooks()
+        projection._source_plans = {}
+        projection._projections = None
+        return projection
 
     def _normalize_nested_options(self):
         """Apply then flatten nested schema options"""
@@ -973,6 +1767,32 @@ class BaseSchema(base.SchemaABC):
                 'Check the following field names and '
                 'attribute arguments: {}'.format(list(attributes_duplicates)),
             )
+        load_attributes = set(load_attributes)
+        attributes_conflicts = {
+            x for x in load_attributes
+            if any(x[:i] in load_attributes for i, char in enumerate(x) if char == '.')
+        }
+        if attributes_conflicts:
+            raise ValueError(
+                'The attribute argument for one or more fields is nested '
+                "within another field's name or attribute argument. "
+                'Check the following field names and '
+                'attribute arguments: {}'.format(list(attributes_conflicts)),
+            )
+        # Writers for load results, with dotted paths split once
+        self._load_setters = {
+            name: compile_setter(obj.attribute or name)
+            for name, obj in iteritems(fields_dict) if not obj.dump_only
+        }
+        # Keys of the input data that are not unknown fields
+        self._load_keys = frozenset(
+            obj.data_key or name
+            for name, obj in iteritems(fields_dict) if not obj.dump_only
+        )
+        # Fields passed the state of the dump or load in progress
+        self._call_state_fields = frozenset(
+            name for name, obj in iteritems(fields_dict) if _takes_call_state(obj)
+        )
 
         return fields_dict
 
@@ -1007,8 +1827,43 @@ class BaseSchema(base.SchemaABC):
                        .format(field_name, field_obj.__name__))
                 raise TypeError(msg)
 
+    def _bind_hooks(self):
+        """Resolve the decorated methods of this schema instance into lists of
+        ready-to-call bound methods with their hook options, keyed like
+        ``_hooks``.
+        """
+        bound_hooks = defaultdict(list)
+        for key, attr_names in iteritems(self._hooks):
+            for attr_name in attr_names:
+                # This will be a bound method.
+                method = getattr(self, attr_name)
+                hook_kwargs = method.__marshmallow_hook__[key]
+                if key == VALIDATES:
+                    field_name = hook_kwargs['field_name']
+                    try:
+                        field_obj = self.fields[field_name]
+                    except KeyError:
+                        if field_name in self.declared_fields:
+                            continue
+                        raise ValueError('"{0}" field does not exist.'.format(field_name))
+                    bound_hooks[key].append((method, field_name, field_obj))
+                elif key[0] == VALIDATES_SCHEMA:
+                    depends_on = hook_kwargs.get('fields')
+                    for field_name in depends_on or ():
+                        if field_name not in self.declared_fields:
+                            raise ValueError('"{0}" field does not exist.'.format(field_name))
+                    bound_hooks[key].append((
+                        method,
+                        hook_kwargs.get('pass_original', False),
+                        hook_kwargs['skip_on_field_errors'],
+                        None if depends_on is None else frozenset(depends_on),
+                    ))
+                else:
+                    bound_hooks[key].append((method, hook_kwargs.get('pass_original', False)))
+        return bound_hooks
+
     def _has_processors(self, tag):
-        return self._hooks[(tag, True)] or self._hooks[(tag, False)]
+        return self._bound_hooks[(tag, True)] or self._bound_hooks[(tag, False)]
 
     def _invoke_dump_processors(self, tag, data, many, original_data=None):
         # The pass_many post-dump processors may do things like add an envelope, so
@@ -1038,18 +1893,7 @@ class BaseSchema(base.SchemaABC):
         return data
 
     def _invoke_field_validators(self, error_store, data, many):
-        for attr_name in self._hooks[VALIDATES]:
-            validator = getattr(self, attr_name)
-            validator_kwargs = validator.__marshmallow_hook__[VALIDATES]
-            field_name = validator_kwargs['field_name']
-
-            try:
-                field_obj = self.fields[field_name]
-            except KeyError:
-                if field_name in self.declared_fields:
-                    continue
-                raise ValueError('"{0}" field does not exist.'.format(field_name))
-
+        for validator, field_name, field_obj in self._bound_hooks[VALIDATES]:
             if many:
                 for idx, item in enumerate(data):
                     try:
@@ -1089,13 +1933,15 @@ class BaseSchema(base.SchemaABC):
         original_data,
         many,
         field_errors=False,
+        patched=None,
     ):
-        for attr_name in self._hooks[(VALIDATES_SCHEMA, pass_many)]:
-            validator = getattr(self, attr_name)
-            validator_kwargs = validator.__marshmallow_hook__[(VALIDATES_SCHEMA, pass_many)]
-            if field_errors and validator_kwargs['skip_on_field_errors']:
+        bound_hooks = self._bound_hooks[(VALIDATES_SCHEMA, pass_many)]
+        for validator, pass_original, skip_on_field_errors, depends_on in bound_hooks:
+            if field_errors and skip_on_field_errors:
+                continue
+            # Only the patched fields may have changed since the last validation
+            if patched is not None and depends_on is not None and depends_on.isdisjoint(patched):
                 continue
-            pass_original = validator_kwargs.get('pass_original', False)
 
             if pass_many:
                 validator = functools.partial(validator, many=many)
@@ -1130,14 +1976,7 @@ class BaseSchema(base.SchemaABC):
         many,
         original_data=None,
     ):
-        key = (tag, pass_many)
-        for attr_name in self._hooks[key]:
-            # This will be a bound method.
-            processor = getattr(self, attr_name)
-
-            processor_kwargs = processor.__marshmallow_hook__[key]
-            pass_original = processor_kwargs.get('pass_original', False)
-
+        for processor, pass_original in self._bound_hooks[(tag, pass_many)]:
             if pass_many:
                 if pass_original:
                     data = processor(data, many, original_data)
@@ -7,15 +7,17 @@ import functools
 import datetime
 import inspect
 import json
+import operator
 import re
 import time
 import types
+import weakref
 from calendar import timegm
 from email.utils import formatdate, parsedate
 from pprint import pprint as py_pprint
 
 from marshmallow.base import FieldABC
-from marshmallow.compat import binary_type, text_type, Mapping, Iterable
+from marshmallow.compat import PY2, binary_type, text_type, Mapping, Iterable, iteritems
 from marshmallow.exceptions import FieldInstanceResolutionError
 
 EXCLUDE = 'exclude'
@@ -216,9 +218,69 @@ _iso8601_date_re = re.compile(
 
 _iso8601_time_re = re.compile(
     r'(?P<hour>\d{1,2}):(?P<minute>\d{1,2})'
-    r'(?::(?P<second>\d{1,2})(?:\.(?P<microsecond>\d{1,6})\d{0,6})?)?',
+    r'(?::(?P<second>\d{1,2})(?:\.(?P<microsecond>\d{1,6})\d{0,6})?)?'
+    r'(?P<tzinfo>Z|[+-]\d{2}(?::?\d{2})?)?$',
+)
+
+# Canonical forms (as produced by ``isoformat()``) that every implementation of
+# ``fromisoformat`` accepts. Inputs matching these skip the generic parser.
+_iso8601_canonical_datetime_re = re.compile(
+    r'[0-9]{4}-[0-9]{2}-[0-9]{2}[T ][0-9]{2}:[0-9]{2}'
+    r'(?::[0-9]{2}(?:\.[0-9]{3}(?:[0-9]{3})?)?)?'
+    r'(?:Z|[+-][0-9]{2}:[0-9]{2})?$',
 )
 
+_iso8601_canonical_date_re = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}$')
+
+_iso8601_canonical_time_re = re.compile(
+    r'[0-9]{2}:[0-9]{2}(?::[0-9]{2}(?:\.[0-9]{3}(?:[0-9]{3})?)?)?$',
+)
+
+# ``fromisoformat`` was added in Python 3.7
+_datetime_fromisoformat = getattr(datetime.datetime, 'fromisoformat', None)
+_date_fromisoformat = getattr(datetime.date, 'fromisoformat', None)
+_time_fromisoformat = getattr(datetime.time, 'fromisoformat', None)
+
+
+class _FixedOffset(datetime.tzinfo):
+    """Fixed offset in minutes east from UTC. Only used on Python versions
+    lacking `datetime.timezone`.
+    """
+
+    def __init__(self, offset, name):
+        self._offset = datetime.timedelta(minutes=offset)
+        self._name = name
+
+    def __getinitargs__(self):
+        return (self._offset.days * 1440 + self._offset.seconds // 60, self._name)
+
+    def utcoffset(self, dt):
+        return self._offset
+
+    def tzname(self, dt):
+        return self._name
+
+    def dst(self, dt):
+        return ZERO
+
+    def __repr__(self):
+        return '<FixedOffset {0}>'.format(self._name)
+
+
+def get_fixed_timezone(offset):
+    """Return a tzinfo instance with a fixed offset from UTC.
+
+    :param int|timedelta offset: Offset from UTC, in minutes or as a `timedelta`.
+    """
+    if isinstance(offset, datetime.timedelta):
+        offset = offset.days * 1440 + offset.seconds // 60
+    sign = '-' if offset < 0 else '+'
+    hhmm = '%02d%02d' % divmod(abs(offset), 60)
+    name = sign + hhmm
+    if hasattr(datetime, 'timezone'):
+        return datetime.timezone(datetime.timedelta(minutes=offset), name)
+    return _FixedOffset(offset, name)
+
 
 def isoformat(dt, localtime=False, *args, **kwargs):
     """Return the ISO8601-formatted UTC representation of a datetime object."""
@@ -248,43 +310,274 @@ def from_rfc(datestring, use_dateutil=True):
         return datetime.datetime.fromtimestamp(timestamp)
 
 
+def _parse_fraction(value):
+    # Not ``ljust``: on Python 2, a native string can't be padded with a
+    # unicode fill character
+    return int(value) * 10 ** (6 - len(value))
+
+
+def _parse_tzinfo(tzinfo):
+    if tzinfo == 'Z':
+        return UTC
+    offset_mins = int(tzinfo[-2:]) if len(tzinfo) > 3 else 0
+    offset = 60 * int(tzinfo[1:3]) + offset_mins
+    if tzinfo[0] == '-':
+        offset = -offset
+    return get_fixed_timezone(offset) if offset else UTC
+
+
 def from_iso_datetime(datetimestring, use_dateutil=True):
     """Parse an ISO8601-formatted datetime string and return a datetime object.
 
-    Use dateutil's parser if possible and return a timezone-aware datetime.
+    Fractional seconds are kept (up to microsecond precision). The result is
+    timezone-aware if the string has an offset (or ``Z``) and naive otherwise.
+    A zero offset is always returned as `UTC`.
+
+    .. versionchanged:: 3.0.0
+        Use a native parser instead of `dateutil`. ``use_dateutil`` is ignored
+        and only kept for backwards compatibility.
     """
-    if not _iso8601_datetime_re.match(datetimestring):
+    if (
+        _datetime_fromisoformat is not None and
+        _iso8601_canonical_datetime_re.match(datetimestring)
+    ):
+        if datetimestring[-1] == 'Z':
+            return _datetime_fromisoformat(datetimestring[:-1]).replace(tzinfo=UTC)
+        result = _datetime_fromisoformat(datetimestring)
+        if result.tzinfo is not None and not result.utcoffset():
+            result = result.replace(tzinfo=UTC)
+        return result
+    match = _iso8601_datetime_re.match(datetimestring)
+    if not match:
         raise ValueError('Not a valid ISO8601-formatted datetime string')
-    # Use dateutil's parser if possible
-    if dateutil_available and use_dateutil:
-        return parser.isoparse(datetimestring)
-    else:
-        # Strip off timezone info.
-        return datetime.datetime.strptime(datetimestring[:19], '%Y-%m-%dT%H:%M:%S')
+    kw = match.groupdict()
+    kw['microsecond'] = kw['microsecond'] and _parse_fraction(kw['microsecond'])
+    tzinfo = kw.pop('tzinfo')
+    tzinfo = _parse_tzinfo(tzinfo) if tzinfo else None
+    kw = {k: int(v) for k, v in iteritems(kw) if v is not None}
+    kw['tzinfo'] = tzinfo
+    return datetime.datetime(**kw)
 
 
 def from_iso_time(timestring, use_dateutil=True):
-    """Parse an ISO8601-formatted datetime string and return a datetime.time
-    object.
+    """Parse an ISO8601-formatted time string and return a datetime.time
+    object. The result is timezone-aware if the string has an offset (or ``Z``)
+    and naive otherwise, as with `from_iso_datetime`.
+
+    .. versionchanged:: 3.0.0
+        Use a native parser instead of `dateutil`. ``use_dateutil`` is ignored
+        and only kept for backwards compatibility.
     """
-    if not _iso8601_time_re.match(timestring):
+    if (
+        _time_fromisoformat is not None and
+        _iso8601_canonical_time_re.match(timestring)
+    ):
+        return _time_fromisoformat(timestring)
+    match = _iso8601_time_re.match(timestring)
+    if not match:
         raise ValueError('Not a valid ISO8601-formatted time string')
-    if dateutil_available and use_dateutil:
-        return parser.parse(timestring).time()
-    else:
-        if len(timestring) > 8:  # has microseconds
-            fmt = '%H:%M:%S.%f'
-        else:
-            fmt = '%H:%M:%S'
-        return datetime.datetime.strptime(timestring, fmt).time()
+    kw = match.groupdict()
+    kw['microsecond'] = kw['microsecond'] and _parse_fraction(kw['microsecond'])
+    tzinfo = kw.pop('tzinfo')
+    tzinfo = _parse_tzinfo(tzinfo) if tzinfo else None
+    kw = {k: int(v) for k, v in iteritems(kw) if v is not None}
+    kw['tzinfo'] = tzinfo
+    return datetime.time(**kw)
+
 
 def from_iso_date(datestring, use_dateutil=True):
-    if not _iso8601_date_re.match(datestring):
+    """Parse an ISO8601-formatted date string and return a datetime.date
+    object.
+
+    .. versionchanged:: 3.0.0
+        Use a native parser instead of `dateutil`. ``use_dateutil`` is ignored
+        and only kept for backwards compatibility.
+    """
+    if (
+        _date_fromisoformat is not None and
+        _iso8601_canonical_date_re.match(datestring)
+    ):
+        return _date_fromisoformat(datestring)
+    match = _iso8601_date_re.match(datestring)
+    if not match:
         raise ValueError('Not a valid ISO8601-formatted date string')
-    if dateutil_available and use_dateutil:
-        return parser.isoparse(datestring).date()
+    kw = {k: int(v) for k, v in iteritems(match.groupdict())}
+    return datetime.date(**kw)
+
+
+# Directives handled by `compile_strftime` and `compile_strptime`. The regexes
+# are the ones used by the standard library's ``_strptime`` module.
+_STRPTIME_DIRECTIVES = {
+    'Y': ('year', r'(\d\d\d\d)'),
+    'm': ('month', r'(1[0-2]|0[1-9]|[1-9])'),
+    'd': ('day', r'(3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])'),
+    'H': ('hour', r'(2[0-3]|[0-1]\d|\d)'),
+    'M': ('minute', r'([0-5]\d|\d)'),
+    'S': ('second', r'(6[0-1]|[0-5]\d|\d)'),
+    'f': ('microsecond', r'([0-9]{1,6})'),
+    'z': ('tzinfo', r'([+-]\d\d:?[0-5]\d(?::?[0-5]\d(?:\.\d{1,6})?)?|Z)'),
+}
+
+_STRFTIME_TEMPLATES = {
+    'Y': '%04d',
+    'm': '%02d',
+    'd': '%02d',
+    'H': '%02d',
+    'M': '%02d',
+    'S': '%02d',
+    'f': '%06d',
+    'z': '%s',
+}
+
+_whitespace_re = re.compile(r'\s+')
+
+
+def _tokenize_format(fmt):
+    """Split a strftime format into a list of literal strings and single-character
+    directives (as ``(directive,)`` tuples). Return `None` if ``fmt`` uses a
+    directive that is not in `_STRPTIME_DIRECTIVES`.
+    """
+    tokens = []
+    literal = []
+    chars = iter(fmt)
+    for char in chars:
+        if char != '%':
+            literal.append(char)
+            continue
+        directive = next(chars, None)
+        if directive == '%':
+            literal.append('%')
+        elif directive in _STRPTIME_DIRECTIVES:
+            if literal:
+                tokens.append(''.join(literal))
+                literal = []
+            tokens.append((directive,))
+        else:
+            return None
+    if literal:
+        tokens.append(''.join(literal))
+    return tokens
+
+
+def _format_utcoffset(value):
+    offset = value.utcoffset()
+    if offset is None:
+        return ''
+    seconds = offset.days * 86400 + offset.seconds
+    if seconds % 60 or offset.microseconds:
+        return value.strftime('%z')
+    sign = '-' if seconds < 0 else '+'
+    return '%s%02d%02d' % ((sign,) + divmod(abs(seconds) // 60, 60))
+
+
+def compile_strftime(fmt):
+    """Compile a strftime format into a function that formats a `datetime.date`
+    or `datetime.datetime` the same way as ``value.strftime(fmt)``.
+
+    Only ``%Y``, ``%m``, ``%d``, ``%H``, ``%M``, ``%S``, ``%f``, ``%z``, ``%%``
+    and literal text are supported. Return `None` for any other format.
+    """
+    tokens = _tokenize_format(fmt)
+    if tokens is None:
+        return None
+    template = []
+    getters = []
+    for token in tokens:
+        if isinstance(token, tuple):
+            directive = token[0]
+            template.append(_STRFTIME_TEMPLATES[directive])
+            if directive == 'z':
+                getters.append(_format_utcoffset)
+            else:
+                getters.append(operator.attrgetter(_STRPTIME_DIRECTIVES[directive][0]))
+        else:
+            template.append(token.replace('%', '%%'))
+    template = ''.join(template)
+    check_year = ('Y',) in tokens
+    if _format_utcoffset not in getters and len(getters) > 1:
+        # Fetch all attributes with a single call
+        get_args = operator.attrgetter(*[
+            _STRPTIME_DIRECTIVES[token[0]][0] for token in tokens if isinstance(token, tuple)
+        ])
     else:
-        return datetime.datetime.strptime(datestring[:10], '%Y-%m-%d').date()
+        get_args = lambda value: tuple([getter(value) for getter in getters])
+
+    def strftime(value):
+        # Years before 1000 are padded differently across platforms
+        if check_year and value.year < 1000:
+            return value.strftime(fmt)
+        try:
+            return template % get_args(value)
+        except AttributeError:
+            # e.g. time directives applied to a `datetime.date`
+            return value.strftime(fmt)
+
+    return strftime
+
+
+def _parse_strptime_offset(z):
+    if z == 'z':
+        # The pattern is case-insensitive but only an uppercase "Z" is allowed
+        raise ValueError('Invalid UTC offset: {0!r}'.format(z))
+    if z == 'Z':
+        return datetime.timezone.utc if hasattr(datetime, 'timezone') else UTC
+    z = z.replace(':', '')
+    seconds = int(z[1:3]) * 3600 + int(z[3:5]) * 60 + int(z[5:7] or 0)
+    microseconds = _parse_fraction(z[8:]) if len(z) > 8 else 0
+    if z[0] == '-':
+        seconds, microseconds = -seconds, -microseconds
+    offset = datetime.timedelta(seconds=seconds, microseconds=microseconds)
+    if hasattr(datetime, 'timezone'):
+        return datetime.timezone(offset)
+    return get_fixed_timezone(offset)
+
+
+_STRPTIME_CONVERTERS = {
+    'microsecond': _parse_fraction,
+    'tzinfo': _parse_strptime_offset,
+}
+
+
+def compile_strptime(fmt):
+    """Compile a strptime format into a function that parses a string the same way
+    as ``datetime.datetime.strptime(value, fmt)``.
+
+    Supports the same directives as `compile_strftime`. Return `None` for any other
+    format, if a directive is used more than once, or for ``%z`` on Python 2, where
+    `strptime` does not support it.
+    """
+    tokens = _tokenize_format(fmt)
+    if tokens is None:
+        return None
+    pattern = []
+    names = []
+    for token in tokens:
+        if isinstance(token, tuple):
+            name, regex = _STRPTIME_DIRECTIVES[token[0]]
+            if name in names or (name == 'tzinfo' and PY2):
+                return None
+            names.append(name)
+            pattern.append(regex)
+        else:
+            pattern.append(r'\s+'.join(re.escape(part) for part in _whitespace_re.split(token)))
+    regex = re.compile(''.join(pattern), re.IGNORECASE)
+    converters = tuple(
+        (name, _STRPTIME_CONVERTERS.get(name, int)) for name in names
+    )
+    mismatch = 'time data {0!r} does not match format {1!r}'
+
+    def strptime(value):
+        match = regex.match(value)
+        if match is None:
+            raise ValueError(mismatch.format(value, fmt))
+        if match.end() != len(value):
+            raise ValueError('unconverted data remains: {0}'.format(value[match.end():]))
+        kwargs = {'year': 1900, 'month': 1, 'day': 1}
+        for (name, convert), group in zip(converters, match.groups()):
+            kwargs[name] = convert(group)
+        return datetime.datetime(**kwargs)
+
+    return strptime
 
 
 def to_iso_date(date, *args, **kwargs):
@@ -344,6 +637,186 @@ def _get_value_for_key(obj, key, default):
         return getattr(obj, key, default)
 
 
+# Built-in ``__getitem__`` implementations that always raise `TypeError` for
+# non-integer keys, e.g. namedtuples and SQLAlchemy's KeyedTuples.
+_SEQUENCE_GETITEMS = (tuple.__getitem__, list.__getitem__, text_type.__getitem__)
+
+_INSTANCE_TYPE = getattr(types, 'InstanceType', None)  # PY2 old-style classes
+
+
+def _compile_key_getter(key):
+    """Return a function ``getter(obj, default)`` equivalent to
+    ``_get_value_for_key(obj, key, default)``. The lookup strategy is chosen
+    once per type of ``obj`` and cached.
+    """
+    def by_attribute(obj, default):
+        return getattr(obj, key, default)
+
+    def by_item(obj, default):
+        try:
+            return obj[key]
+        except (KeyError, IndexError, TypeError, AttributeError):
+            return getattr(obj, key, default)
+
+    def generic(obj, default):
+        return _get_value_for_key(obj, key, default)
+
+    def select_strategy(cls):
+        if cls is _INSTANCE_TYPE or isinstance(key, int):
+            return generic
+        getitem = getattr(cls, '__getitem__', None)
+        if getitem is None or getitem in _SEQUENCE_GETITEMS:
+            return by_attribute
+        return by_item
+
+    strategies = {}
+
+    def getter(obj, default=missing):
+        cls = type(obj)
+        try:
+            strategy = strategies[cls]
+        except KeyError:
+            strategy = strategies[cls] = select_strategy(cls)
+        return strategy(obj, default)
+
+    return getter
+
+
+def compile_accessor(key):
+    """Return a function ``accessor(obj, default=missing)`` that behaves like
+    ``get_value(obj, key, default)``, with the dotted path split once and the
+    lookup strategy cached by object type.
+
+    .. versionadded:: 3.0.0
+    """
+    if isinstance(key, int) or '.' not in key:
+        keys = [key]
+    else:
+        keys = key.split('.')
+    getters = [_compile_key_getter(each) for each in keys]
+    if len(getters) == 1:
+        return getters[0]
+
+    def accessor(obj, default=missing):
+        for getter in getters:
+            obj = getter(obj, default)
+        return obj
+
+    return accessor
+
+
+def attribute_fetcher(obj, keys):
+    """Source adapter factory that fetches ``keys`` as attributes with a single
+    `operator.attrgetter` call. Keys that are not attributes of ``obj`` (the
+    first instance seen) are fetched one by one.
+
+    :param obj: A sample instance.
+    :param keys: The attribute names to fetch.
+    :return: A function that takes an instance and returns a dict mapping
+        each key to its value, or `missing`.
+    """
+    keys = list(keys)
+    present = tuple(key for key in keys if hasattr(obj, key))
+    absent = tuple(key for key in keys if key not in present)
+    if not present:
+        getter = lambda obj: ()
+    elif len(present) == 1:
+        single = operator.attrgetter(present[0])
+        getter = lambda obj: (single(obj),)
+    else:
+        getter = operator.attrgetter(*present)
+
+    def fetch(obj):
+        try:
+            ret = dict(zip(present, getter(obj)))
+        except AttributeError:
+            return {key: getattr(obj, key, missing) for key in keys}
+        for key in absent:
+            ret[key] = getattr(obj, key, missing)
+        return ret
+
+    return fetch
+
+
+def item_fetcher(obj, keys):
+    """Source adapter factory that fetches ``keys`` as items with a single
+    `operator.itemgetter` call, falling back to `get_value` semantics if any
+    key is not found. Suitable for mappings.
+
+    :param obj: A sample instance.
+    :param keys: The keys to fetch.
+    :return: A function that takes an instance and returns a dict mapping
+        each key to its value, or `missing`.
+    """
+    keys = tuple(keys)
+    if len(keys) == 1:
+        single = operator.itemgetter(keys[0])
+        getter = lambda obj: (single(obj),)
+    else:
+        getter = operator.itemgetter(*keys)
+
+    def fetch(obj):
+        try:
+            return dict(zip(keys, getter(obj)))
+        except (KeyError, IndexError, TypeError, AttributeError):
+            return {key: _get_value_for_key(obj, key, missing) for key in keys}
+
+    return fetch
+
+
+# Mapping of type -> source adapter factory
+_source_adapters = {}
+
+
+def register_source_adapter(cls, factory):
+    """Register a source adapter for instances of ``cls`` and its subclasses.
+    :meth:`Schema.dump <marshmallow.Schema.dump>` uses it to fetch the values
+    of all plain attribute fields of an object in one step.
+
+    ``factory`` is called with the first instance seen and a list of keys, and
+    must return a function that takes an instance and returns a dict mapping
+    each key to its value (or `missing`). See `attribute_fetcher` and
+    `item_fetcher`. Pass `None` to disable bulk fetching for ``cls``.
+
+    .. versionadded:: 3.0.0
+    """
+    _source_adapters[cls] = factory
+
+
+def _default_source_adapter(cls):
+    getitem = getattr(cls, '__getitem__', None)
+    if getitem is not None and getitem not in _SEQUENCE_GETITEMS:
+        return None
+    if (
+        (issubclass(cls, tuple) and hasattr(cls, '_fields')) or  # keyed tuples
+        hasattr(cls, '__dataclass_fields__') or
+        any('__slots__' in klass.__dict__ for klass in inspect.getmro(cls)[:-1])
+    ):
+        return attribute_fetcher
+    return None
+
+
+def get_source_fetcher(obj, keys):
+    """Return a function that fetches ``keys`` from objects of the same type as
+    ``obj`` in one step, or `None` if there is no source adapter for the type.
+
+    Keyed tuples (e.g. namedtuples), dataclasses and classes with ``__slots__``
+    are supported by default. Use `register_source_adapter` for other types.
+
+    .. versionadded:: 3.0.0
+    """
+    cls = type(obj)
+    for klass in inspect.getmro(cls):
+        if klass in _source_adapters:
+            factory = _source_adapters[klass]
+            break
+    else:
+        factory = _default_source_adapter(cls)
+    if factory is None:
+        return None
+    return factory(obj, keys)
+
+
 def set_value(dct, key, value):
     """Set a value in a dict. If `key` contains a '.', it is assumed
     be a path (i.e. dot-delimited string) to the value's location.
@@ -368,6 +841,44 @@ def set_value(dct, key, value):
         dct[key] = value
 
 
+def compile_setter(key):
+    """Return a function that sets a value in a dict at ``key``, with the
+    same semantics as `set_value`. The dot-delimited path is split once,
+    rather than on every call.
+
+    ::
+
+        >>> set_foo_bar = compile_setter('foo.bar')
+        >>> d = {}
+        >>> set_foo_bar(d, 42)
+        >>> d
+        {'foo': {'bar': 42}}
+
+    .. versionadded:: 3.0.0
+    """
+    if '.' not in key:
+        def setter(dct, value):
+            dct[key] = value
+        return setter
+
+    path = key.split('.')
+    last = path.pop()
+    # Remaining dotted key at each level, for error messages
+    rests = ['.'.join(path[i:] + [last]) for i in range(len(path))]
+
+    def setter(dct, value):
+        target = dct
+        for head, rest in zip(path, rests):
+            target = target.setdefault(head, {})
+            if not isinstance(target, dict):
+                raise ValueError(
+                    'Cannot set {key} in {head} '
+                    'due to existing value: {target}'.format(key=rest, head=head, target=target),
+                )
+        target[last] = value
+    return setter
+
+
 def callable_or_raise(obj):
     """Check that an object is callable, else raise a :exc:`ValueError`.
     """
@@ -376,7 +887,28 @@ def callable_or_raise(obj):
     return obj
 
 
+# Argument names of functions and of their bound methods, computed once
+_func_args_cache = weakref.WeakKeyDictionary()
+_method_args_cache = weakref.WeakKeyDictionary()
+
+
 def _signature(func):
+    # Bound methods are created on every attribute access, so they are cached
+    # by their underlying function
+    if inspect.isfunction(func):
+        cache, key = _func_args_cache, func
+    elif inspect.ismethod(func) and inspect.isfunction(func.__func__):
+        cache, key = _method_args_cache, func.__func__
+    else:
+        return _inspect_signature(func)
+    try:
+        args = cache[key]
+    except KeyError:
+        args = cache[key] = tuple(_inspect_signature(func))
+    return list(args)
+
+
+def _inspect_signature(func):
     if hasattr(inspect, 'signature'):
         return list(inspect.signature(func).parameters.keys())
     if hasattr(func, '__self__'):
@@ -392,6 +924,9 @@ def get_func_args(func):
 
     .. versionchanged:: 3.0.0a1
         Do not return bound arguments, eg. ``self``.
+
+    .. versionchanged:: 3.0.0
+        Results are cached for functions and methods.
     """
     if isinstance(func, functools.partial):
         return _signature(func.func)
@@ -6,17 +6,113 @@ from __future__ import unicode_literals
 import re
 from operator import attrgetter
 
+from marshmallow.cache import LRUCache
 from marshmallow.compat import basestring, text_type, zip_longest
 from marshmallow.exceptions import ValidationError
+from marshmallow.utils import missing
+
+
+def _hash_index(values):
+    """Return a ``(values, index)`` pair, where ``index`` is a frozenset of
+    ``values`` for constant-time membership tests, or `None` if they are not
+    all hashable or can only be iterated once. The index is not updated when
+    ``values`` is changed in place.
+    """
+    try:
+        if iter(values) is values:
+            return values, None
+        return values, frozenset(values)
+    except TypeError:
+        return values, None
+
+
+class _JoinedText(object):
+    """Attribute holding the comma-separated text of the items of another
+    attribute. The text is only needed for error messages, so it is built
+    when first read, then stored on the instance.
+    """
+
+    def __init__(self, source, name):
+        self.source = source
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        text = ', '.join(text_type(each) for each in getattr(obj, self.source))
+        obj.__dict__[self.name] = text
+        return text
 
 
 class Validator(object):
     """Base abstract class for validators.
 
-    .. note::
-        This class does not provide any behavior. It is only used to
-        add a useful `__repr__` implementation for validators.
+    Subclasses implement `__call__`, raising a
+    :exc:`ValidationError <marshmallow.exceptions.ValidationError>` if the
+    value is invalid. marshmallow's own validators implement ``_check``
+    instead, which returns the error rather than raising it, so that fields
+    can collect their errors without raising exceptions.
     """
+    # Set by `_init_cache` for validators created with a ``cache_size``
+    _cache = None
+
+    def __call__(self, value):
+        error = self._check(value)
+        if error is not None:
+            raise error
+        return value
+
+    def _check(self, value):
+        """Return a `ValidationError` if ``value`` is invalid, `None` otherwise.
+        By default, call the validator and return the error it raises.
+        """
+        if type(self).__call__ == Validator.__call__:
+            # Neither `__call__` nor `_check` is implemented
+            raise NotImplementedError
+        try:
+            self(value)
+        except ValidationError as error:
+            return error
+        return None
+
+    def _compile_check(self):
+        """Return a function equivalent to `_check`, which fields call in place
+        of the validator once they are bound to a schema. Validators may
+        specialize it for their arguments.
+        """
+        return self._check
+
+    def _init_cache(self, cache_size):
+        """Memoize the results of `_check` for up to ``cache_size`` hashable
+        values, if ``cache_size`` is set. Only the messages of errors are
+        kept; each failing call gets a new `ValidationError`.
+        """
+        if not cache_size:
+            return
+        cache = self._cache = LRUCache(cache_size)
+        check = self._check
+
+        def cached_check(value):
+            # Values that compare equal but differ in type (e.g. 1 and True)
+            # may produce different messages
+            key = (type(value), value)
+            try:
+                messages = cache.get(key)
+            except TypeError:  # Unhashable value
+                return check(value)
+            if messages is missing:
+                error = check(value)
+                messages = None if error is None else tuple(error.messages)
+                cache.set(key, messages)
+                return error
+            return None if messages is None else ValidationError(list(messages))
+        self._check = cached_check
+
+    def cache_info(self):
+        """Return a `CacheInfo <marshmallow.cache.CacheInfo>` with the hits,
+        misses and size of the result cache, or `None` if caching is disabled.
+        """
+        return self._cache.cache_info() if self._cache is not None else None
 
     def __repr__(self):
         args = self._repr_args()
@@ -33,6 +129,12 @@ class Validator(object):
         """
         return ''
 
+    def _make_error(self, *args):
+        """Return a `ValidationError` whose message is rendered by
+        ``_format_error(*args)`` only when the error's messages are read.
+        """
+        return ValidationError._deferred(self._format_error, args, {})
+
 
 class URL(Validator):
     """Validate a URL.
@@ -43,6 +145,12 @@ class URL(Validator):
     :param set schemes: Valid schemes. By default, ``http``, ``https``,
         ``ftp``, and ``ftps`` are allowed.
     :param bool require_tld: Whether to reject non-FQDN hostnames
+    :param int cache_size: If set, memoize the results of up to this many
+        distinct values, for inputs that are validated repeatedly.
+
+    .. versionchanged:: 3.0.0
+        Add ``cache_size`` parameter. URLs longer than ``max_length``
+        characters are rejected.
     """
 
     class RegexMemoizer(object):
@@ -81,15 +189,29 @@ class URL(Validator):
 
     _regex = RegexMemoizer()
 
+    # Absolute URLs with a plain ASCII domain name. Anything this accepts is
+    # also accepted by the full regex, which is only run on other values.
+    _fast_regex = re.compile(
+        r'[A-Za-z0-9.+-]*://'
+        r'(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+[A-Za-z]{2,63}\.?'
+        r'(?::[0-9]+)?'
+        r'(?:/|[/?]\S+)?\Z',
+    )
+
     default_message = 'Not a valid URL.'
     default_schemes = set(['http', 'https', 'ftp', 'ftps'])
+    max_length = 2048
 
     # TODO; Switch position of `error` and `schemes` in 3.0
-    def __init__(self, relative=False, error=None, schemes=None, require_tld=True):
+    def __init__(
+        self, relative=False, error=None, schemes=None, require_tld=True,
+        cache_size=None,
+    ):
         self.relative = relative
         self.error = error or self.default_message
         self.schemes = schemes or self.default_schemes
         self.require_tld = require_tld
+        self._init_cache(cache_size)
 
     def _repr_args(self):
         return 'relative={0!r}'.format(self.relative)
@@ -97,23 +219,24 @@ class URL(Validator):
     def _format_error(self, value):
         return self.error.format(input=value)
 
-    def __call__(self, value):
-        message = self._format_error(value)
-        if not value:
-            raise ValidationError(message)
+    def _check(self, value):
+        # Bound the length of the input the regexes have to scan
+        if not value or len(value) > self.max_length:
+            return self._make_error(value)
 
         # Check first if the scheme is valid
         if '://' in value:
             scheme = value.split('://')[0].lower()
             if scheme not in self.schemes:
-                raise ValidationError(message)
+                return self._make_error(value)
+
+        if self._fast_regex.match(value):
+            return None
 
         regex = self._regex(self.relative, self.require_tld)
 
         if not regex.search(value):
-            raise ValidationError(message)
-
-        return value
+            return self._make_error(value)
 
 
 class Email(Validator):
@@ -121,6 +244,12 @@ class Email(Validator):
 
     :param str error: Error message to raise in case of a validation error. Can be
         interpolated with `{input}`.
+    :param int cache_size: If set, memoize the results of up to this many
+        distinct values, for inputs that are validated repeatedly.
+
+    .. versionchanged:: 3.0.0
+        Add ``cache_size`` parameter. Addresses longer than ``max_length``
+        characters are rejected.
     """
 
     USER_REGEX = re.compile(
@@ -141,24 +270,35 @@ class Email(Validator):
 
     DOMAIN_WHITELIST = ('localhost',)
 
+    # Dot-atom local parts at a plain ASCII domain name. Anything this accepts
+    # is also accepted by the full regexes, which are only run on other values.
+    _fast_regex = re.compile(
+        r"[-!#$%&'*+/=?^`{}|~A-Za-z0-9_]+(?:\.[-!#$%&'*+/=?^`{}|~A-Za-z0-9_]+)*"
+        r'@(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+[A-Za-z]{2,63}\Z',
+    )
+
     default_message = 'Not a valid email address.'
+    max_length = 320
 
-    def __init__(self, error=None):
+    def __init__(self, error=None, cache_size=None):
         self.error = error or self.default_message
+        self._init_cache(cache_size)
 
     def _format_error(self, value):
         return self.error.format(input=value)
 
-    def __call__(self, value):
-        message = self._format_error(value)
+    def _check(self, value):
+        # Bound the length of the input the regexes have to scan
+        if not value or len(value) > self.max_length or '@' not in value:
+            return self._make_error(value)
 
-        if not value or '@' not in value:
-            raise ValidationError(message)
+        if self._fast_regex.match(value):
+            return None
 
         user_part, domain_part = value.rsplit('@', 1)
 
         if not self.USER_REGEX.match(user_part):
-            raise ValidationError(message)
+            return self._make_error(value)
 
         if domain_part not in self.DOMAIN_WHITELIST:
             if not self.DOMAIN_REGEX.match(domain_part):
@@ -168,10 +308,8 @@ class Email(Validator):
                     pass
                 else:
                     if self.DOMAIN_REGEX.match(domain_part):
-                        return value
-                raise ValidationError(message)
-
-        return value
+                        return None
+                return self._make_error(value)
 
 
 class Range(Validator):
@@ -204,16 +342,27 @@ class Range(Validator):
     def _format_error(self, value, message):
         return (self.error or message).format(input=value, min=self.min, max=self.max)
 
-    def __call__(self, value):
+    def _check(self, value):
         if self.min is not None and value < self.min:
             message = self.message_min if self.max is None else self.message_all
-            raise ValidationError(self._format_error(value, message))
+            return self._make_error(value, message)
 
         if self.max is not None and value > self.max:
             message = self.message_max if self.min is None else self.message_all
-            raise ValidationError(self._format_error(value, message))
+            return self._make_error(value, message)
 
-        return value
+    def _compile_check(self):
+        min_, max_, range_error = self.min, self.max, self._make_error
+        message_min = self.message_min if max_ is None else self.message_all
+        message_max = self.message_max if min_ is None else self.message_all
+
+        def check(value):
+            if min_ is not None and value < min_:
+                return range_error(value, message_min)
+            if max_ is not None and value > max_:
+                return range_error(value, message_max)
+            return None
+        return check
 
 
 class Length(Validator):
@@ -257,23 +406,44 @@ class Length(Validator):
             equal=self.equal,
         )
 
-    def __call__(self, value):
+    def _check(self, value):
         length = len(value)
 
         if self.equal is not None:
             if length != self.equal:
-                raise ValidationError(self._format_error(value, self.message_equal))
-            return value
+                return self._make_error(value, self.message_equal)
+            return None
 
         if self.min is not None and length < self.min:
             message = self.message_min if self.max is None else self.message_all
-            raise ValidationError(self._format_error(value, message))
+            return self._make_error(value, message)
 
         if self.max is not None and length > self.max:
             message = self.message_max if self.min is None else self.message_all
-            raise ValidationError(self._format_error(value, message))
+            return self._make_error(value, message)
 
-        return value
+    def _compile_check(self):
+        min_, max_, equal, length_error = self.min, self.max, self.equal, self._make_error
+        if equal is not None:
+            message_equal = self.message_equal
+
+            def check(value):
+                if len(value) != equal:
+                    return length_error(value, message_equal)
+                return None
+            return check
+
+        message_min = self.message_min if max_ is None else self.message_all
+        message_max = self.message_max if min_ is None else self.message_all
+
+        def check(value):
+            length = len(value)
+            if min_ is not None and length < min_:
+                return length_error(value, message_min)
+            if max_ is not None and length > max_:
+                return length_error(value, message_max)
+            return None
+        return check
 
 
 class Equal(Validator):
@@ -297,10 +467,9 @@ class Equal(Validator):
     def _format_error(self, value):
         return self.error.format(input=value, other=self.comparable)
 
-    def __call__(self, value):
+    def _check(self, value):
         if value != self.comparable:
-            raise ValidationError(self._format_error(value))
-        return value
+            return self._make_error(value)
 
 
 class Regexp(Validator):
@@ -312,13 +481,19 @@ class Regexp(Validator):
         if ``regex`` is not a string.
     :param str error: Error message to raise in case of a validation error.
         Can be interpolated with `{input}` and `{regex}`.
+    :param int cache_size: If set, memoize the results of up to this many
+        distinct values, for inputs that are validated repeatedly.
+
+    .. versionchanged:: 3.0.0
+        Add ``cache_size`` parameter.
     """
 
     default_message = 'String does not match expected pattern.'
 
-    def __init__(self, regex, flags=0, error=None):
+    def __init__(self, regex, flags=0, error=None, cache_size=None):
         self.regex = re.compile(regex, flags) if isinstance(regex, basestring) else regex
         self.error = error or self.default_message
+        self._init_cache(cache_size)
 
     def _repr_args(self):
         return 'regex={0!r}'.format(self.regex)
@@ -326,11 +501,20 @@ class Regexp(Validator):
     def _format_error(self, value):
         return self.error.format(input=value, regex=self.regex.pattern)
 
-    def __call__(self, value):
+    def _check(self, value):
         if self.regex.match(value) is None:
-            raise ValidationError(self._format_error(value))
+            return self._make_error(value)
 
-        return value
+    def _compile_check(self):
+        if self._cache is not None:
+            return self._check
+        match, make_error = self.regex.match, self._make_error
+
+        def check(value):
+            if match(value) is None:
+                return make_error(value)
+            return None
+        return check
 
 
 class Predicate(Validator):
@@ -358,13 +542,11 @@ class Predicate(Validator):
     def _format_error(self, value):
         return self.error.format(input=value, method=self.method)
 
-    def __call__(self, value):
+    def _check(self, value):
         method = getattr(value, self.method)
 
         if not method(**self.kwargs):
-            raise ValidationError(self._format_error(value))
-
-        return value
+            return self._make_error(value)
 
 
 class NoneOf(Validator):
@@ -373,14 +555,26 @@ class NoneOf(Validator):
     :param iterable iterable: A sequence of invalid values.
     :param str error: Error message to raise in case of a validation error. Can be
         interpolated using `{input}` and `{values}`.
+    :param int cache_size: If set, memoize the results of up to this many
+        distinct values, for inputs that are validated repeatedly.
+
+    .. versionchanged:: 3.0.0
+        Hashable values are indexed when the validator is created, and
+        ``values_text`` is built when it is first read. Changes made to
+        ``iterable`` in place afterwards are not tracked; assign a new
+        sequence instead.
+    .. versionchanged:: 3.0.0
+        Add ``cache_size`` parameter.
     """
 
     default_message = 'Invalid input.'
+    values_text = _JoinedText('iterable', 'values_text')
 
-    def __init__(self, iterable, error=None):
+    def __init__(self, iterable, error=None, cache_size=None):
         self.iterable = iterable
-        self.values_text = ', '.join(text_type(each) for each in self.iterable)
+        self._index = _hash_index(iterable)
         self.error = error or self.default_message
+        self._init_cache(cache_size)
 
     def _repr_args(self):
         return 'iterable={0!r}'.format(self.iterable)
@@ -391,15 +585,24 @@ class NoneOf(Validator):
             values=self.values_text,
         )
 
-    def __call__(self, value):
+    def _check(self, value):
+        indexed, index = self._index
+        if indexed is not self.iterable:
+            # The values were replaced since they were indexed
+            indexed, index = self._index = _hash_index(self.iterable)
+        if index is not None:
+            try:
+                if value in index:
+                    return self._make_error(value)
+            except TypeError:
+                pass
+        # Values that are not indexed are compared with each item
         try:
-            if value in self.iterable:
-                raise ValidationError(self._format_error(value))
+            if value in indexed:
+                return self._make_error(value)
         except TypeError:
             pass
 
-        return value
-
 
 class OneOf(Validator):
     """Validator which succeeds if ``value`` is a member of ``choices``.
@@ -408,16 +611,28 @@ class OneOf(Validator):
     :param iterable labels: Optional sequence of labels to pair with the choices.
     :param str error: Error message to raise in case of a validation error. Can be
         interpolated with `{input}`, `{choices}` and `{labels}`.
+    :param int cache_size: If set, memoize the results of up to this many
+        distinct values, for inputs that are validated repeatedly.
+
+    .. versionchanged:: 3.0.0
+        Hashable choices are indexed when the validator is created, and
+        ``choices_text`` and ``labels_text`` are built when they are first read.
+        Changes made to ``choices`` in place afterwards are not tracked; assign
+        a new sequence instead.
+    .. versionchanged:: 3.0.0
+        Add ``cache_size`` parameter.
     """
 
     default_message = 'Not a valid choice.'
+    choices_text = _JoinedText('choices', 'choices_text')
+    labels_text = _JoinedText('labels', 'labels_text')
 
-    def __init__(self, choices, labels=None, error=None):
+    def __init__(self, choices, labels=None, error=None, cache_size=None):
         self.choices = choices
-        self.choices_text = ', '.join(text_type(choice) for choice in self.choices)
+        self._index = _hash_index(choices)
         self.labels = labels if labels is not None else []
-        self.labels_text = ', '.join(text_type(label) for label in self.labels)
         self.error = error or self.default_message
+        self._init_cache(cache_size)
 
     def _repr_args(self):
         return 'choices={0!r}, labels={1!r}'.format(self.choices, self.labels)
@@ -429,14 +644,27 @@ class OneOf(Validator):
             labels=self.labels_text,
         )
 
-    def __call__(self, value):
+    def _choices_index(self):
+        """Return the index of `choices`, rebuilt if they were replaced."""
+        indexed, index = self._index
+        if indexed is not self.choices:
+            indexed, index = self._index = _hash_index(self.choices)
+        return index
+
+    def _check(self, value):
+        index = self._choices_index()
+        if index is not None:
+            try:
+                if value in index:
+                    return None
+            except TypeError:
+                pass
+        # Values that are not indexed are compared with each choice
         try:
             if value not in self.choices:
-                raise ValidationError(self._format_error(value))
+                return self._make_error(value)
         except TypeError:
-            raise ValidationError(self._format_error(value))
-
-        return value
+            return self._make_error(value)
 
     def options(self, valuegetter=text_type):
         """Return a generator over the (value, label) pairs, where value
@@ -463,6 +691,8 @@ class ContainsOnly(OneOf):
     :param iterable choices: Same as :class:`OneOf`.
     :param iterable labels: Same as :class:`OneOf`.
     :param str error: Same as :class:`OneOf`.
+    :param int cache_size: Same as :class:`OneOf`. Inputs that are not
+        hashable, such as lists, are not cached.
 
     .. versionchanged:: 3.0.0b2
         Duplicate values are considered valid.
@@ -477,9 +707,18 @@ class ContainsOnly(OneOf):
         value_text = ', '.join(text_type(val) for val in value)
         return super(ContainsOnly, self)._format_error(value_text)
 
-    def __call__(self, value):
-        # We can't use set.issubset because does not handle unhashable types
+    def _check(self, value):
+        if not isinstance(value, (list, tuple)):
+            # Iterated up to twice below, e.g. a generator
+            value = list(value)
+        index = self._choices_index()
+        if index is not None:
+            try:
+                if index.issuperset(value):
+                    return None
+            except TypeError:
+                pass
+        # Items that are not indexed are compared with each choice
         for val in value:
             if val not in self.choices:
-                raise ValidationError(self._format_error(value))
-        return value
+                return self._make_error(value)
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from marshmallow import missing
+from marshmallow.cache import LRUCache
+
+
+class TestLRUCache:
+
+    def test_get_missing_key_returns_default(self):
+        cache = LRUCache(2)
+        assert cache.get('foo') is missing
+        assert cache.get('foo', 42) == 42
+
+    def test_set_and_get(self):
+        cache = LRUCache(2)
+        cache.set('foo', 1)
+        assert 'foo' in cache
+        assert cache.get('foo') == 1
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.set('foo', 1)
+        cache.set('bar', 2)
+        cache.get('foo')
+        cache.set('baz', 3)
+        assert 'foo' in cache
+        assert 'bar' not in cache
+        assert 'baz' in cache
+
+    def test_cache_info(self):
+        cache = LRUCache(1)
+        cache.get('foo')
+        cache.set('foo', 1)
+        cache.get('foo')
+        cache.get('foo')
+        cache.set('bar', 2)
+        info = cache.cache_info()
+        assert info.hits == 2
+        assert info.misses == 1
+        assert info.evictions == 1
+        assert info.maxsize == 1
+        assert info.currsize == 1
+        assert info.hit_rate == pytest.approx(2 / 3.0)
+
+    def test_hit_rate_without_lookups(self):
+        assert LRUCache(1).cache_info().hit_rate == 0.0
+
+    def test_clear(self):
+        cache = LRUCache(1)
+        cache.set('foo', 1)
+        cache.get('foo')
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.cache_info().hits == 0
+
+    @pytest.mark.parametrize('maxsize', [None, 0, -1])
+    def test_invalid_maxsize(self, maxsize):
+        with pytest.raises(ValueError):
+            LRUCache(maxsize)
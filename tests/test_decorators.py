@@ -256,6 +256,27 @@ def test_pre_dump_is_invoked_before_implicit_field_generation():
     assert Foo().dump({'field': 5}) == {'field': 5, 'generated_field': 7}
 
 
+def test_hooks_are_resolved_when_schema_is_created():
+    class MySchema(Schema):
+        foo = fields.Int()
+
+        @validates('foo')
+        def validate_foo(self, value):
+            if value < 0:
+                raise ValidationError('Must be positive.')
+
+        @post_load
+        def double(self, data):
+            data['foo'] *= 2
+            return data
+
+    schema = MySchema()
+    del MySchema.validate_foo
+    del MySchema.double
+    assert schema.load({'foo': 1}) == {'foo': 2}
+    assert schema.validate({'foo': -1}) == {'foo': ['Must be positive.']}
+
+
 class ValidatesSchema(Schema):
     foo = fields.Int()
 
@@ -339,10 +360,8 @@ class TestValidatesDecorator:
             def validate_bar(self, value):
                 raise ValidationError('Never raised.')
 
-        schema = BadSchema()
-
         with pytest.raises(ValueError) as excinfo:
-            schema.validate({'foo': 42})
+            BadSchema()
         assert '"bar" field does not exist.' in str(excinfo)
 
     def test_precedence(self):
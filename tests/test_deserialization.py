@@ -3,6 +3,7 @@ import datetime as dt
 import uuid
 import decimal
 import math
+from collections import OrderedDict
 
 import pytest
 
@@ -456,6 +457,16 @@ class TestFieldDeserialization:
         field = fields.DateTime()
         assert msg in str(excinfo)
 
+    def test_compact_custom_format_date_and_datetime_deserialization(self):
+        field = fields.DateTime(format='%Y%m%d%H%M%S')
+        assert field.deserialize('20131110012345') == dt.datetime(2013, 11, 10, 1, 23, 45)
+        with pytest.raises(ValidationError):
+            field.deserialize('2013111001234x')
+        date_field = fields.Date(format='%d/%m/%Y')
+        result = date_field.deserialize('21/08/2014')
+        assert type(result) is dt.date
+        assert result == dt.date(2014, 8, 21)
+
     @pytest.mark.parametrize('fmt', ['rfc', 'rfc822'])
     def test_rfc_datetime_field_deserialization(self, fmt):
         dtime = dt.datetime.now()
@@ -480,6 +491,26 @@ class TestFieldDeserialization:
         if utils.dateutil_available:
             assert result.tzinfo is not None
 
+    @pytest.mark.parametrize(
+        ('value', 'expected'), [
+            (
+                '2013-11-10T01:23:45.123456Z',
+                dt.datetime(2013, 11, 10, 1, 23, 45, 123456, tzinfo=utils.UTC),
+            ),
+            (
+                '2013-11-10T01:23:45.5-06:00',
+                central.localize(dt.datetime(2013, 11, 10, 1, 23, 45, 500000)),
+            ),
+        ],
+    )
+    def test_iso_datetime_field_deserialization_keeps_offset_and_fraction(
+        self, value, expected,
+    ):
+        result = fields.DateTime().deserialize(value)
+        assert result == expected
+        assert result.microsecond == expected.microsecond
+        assert result.utcoffset() == expected.utcoffset()
+
     def test_time_field_deserialization(self):
         field = fields.Time()
         t = dt.time(1, 23, 45)
@@ -676,6 +707,22 @@ class TestFieldDeserialization:
         }}
         assert excinfo.value.valid_data == {}
 
+    def test_structured_mapping_deserialization_preserves_order(self):
+        class OrderedMapping(fields.Mapping):
+            mapping_type = OrderedDict
+
+        field = OrderedMapping(values=fields.Int(validate=validate.Range(min=0)))
+        value = OrderedDict([('c', 3), ('a', '1'), ('b', 2)])
+        result = field.deserialize(value)
+        assert isinstance(result, OrderedDict)
+        assert list(result.items()) == [('c', 3), ('a', 1), ('b', 2)]
+        value['d'] = -1
+        value['e'] = 5
+        with pytest.raises(ValidationError) as excinfo:
+            field.deserialize(value)
+        assert excinfo.value.args[0] == {'d': {'value': ['Must be at least 0.']}}
+        assert list(excinfo.value.valid_data.items()) == [('c', 3), ('a', 1), ('b', 2), ('e', 5)]
+
     def test_url_field_deserialization(self):
         field = fields.Url()
         assert field.deserialize('https://duckduckgo.com') == 'https://duckduckgo.com'
@@ -806,9 +853,8 @@ class TestFieldDeserialization:
         class BadSchema(Schema):
             uppername = fields.Method('uppercase_name', deserialize='lowercase_name')
 
-        s = BadSchema()
         with pytest.raises(ValueError):
-            s.fields['uppername'].deserialize('STEVE')
+            BadSchema()
 
     def test_method_field_deserialize_only(self):
         class MethodDeserializeOnly(Schema):
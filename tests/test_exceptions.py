@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import pickle
+
 from marshmallow.exceptions import ValidationError
 
 
@@ -27,3 +29,33 @@ class TestValidationError:
 
         err2 = ValidationError('invalid email', 'email')
         assert str(err2) == 'invalid email'
+
+    def test_message_from_template_is_rendered_when_read(self):
+        rendered = []
+
+        def render(value):
+            rendered.append(value)
+            return '{} is invalid.'.format(value)
+
+        err = ValidationError._deferred(render, ('bad input',), {})
+        assert rendered == []
+        assert err.messages == ['bad input is invalid.']
+        assert err.args == ('bad input is invalid.',)
+        assert str(err) == 'bad input is invalid.'
+        assert err.normalized_messages() == {'_schema': ['bad input is invalid.']}
+        assert rendered == ['bad input']
+
+    def test_message_from_mutable_input_is_rendered_when_raised(self):
+        value = [1]
+        err = ValidationError._from_template('{input} is invalid.', {'input': value})
+        value.append(2)
+        assert err.messages == ['[1] is invalid.']
+
+    def test_message_from_template_can_be_pickled(self):
+        err = ValidationError._from_template('{input} is invalid.', {'input': 42})
+        assert pickle.loads(pickle.dumps(err)).messages == ['42 is invalid.']
+
+    def test_messages_can_be_replaced(self):
+        err = ValidationError._from_template('{input} is invalid.', {'input': 42})
+        err.messages = ['other']
+        assert err.messages == ['other']
@@ -1,10 +1,15 @@
 # -*- coding: utf-8 -*-
+import datetime as dt
+
 import pytest
 
-from marshmallow import fields, Schema, ValidationError, EXCLUDE, INCLUDE, RAISE, missing
+from marshmallow import (
+    fields, utils, validate, Schema, ValidationError, EXCLUDE, INCLUDE, RAISE, missing,
+)
+from marshmallow.error_store import Failure
 from marshmallow.exceptions import StringNotCollectionError
 
-from tests.base import ALL_FIELDS
+from tests.base import ALL_FIELDS, central
 
 
 @pytest.mark.parametrize(
@@ -251,3 +256,246 @@ class TestNestedField:
         elif field_unknown == RAISE or (schema_unknown == RAISE and not field_unknown):
             with pytest.raises(ValidationError):
                 MySchema().load({'nested': {'x': 1}})
+
+
+class TestTemporalFieldCache:
+
+    def test_cache_disabled_by_default(self):
+        assert fields.DateTime().cache_info() is None
+        assert fields.Time().cache_info() is None
+
+    def test_datetime_load_cache(self):
+        field = fields.DateTime(cache_size=2)
+        first = field.deserialize('2013-11-10T01:23:45Z')
+        second = field.deserialize('2013-11-10T01:23:45Z')
+        assert first is second
+        info = field.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
+    def test_datetime_load_cache_does_not_store_errors(self):
+        field = fields.DateTime(cache_size=2)
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                field.deserialize('not a datetime')
+        assert field.cache_info().currsize == 0
+
+    def test_datetime_dump_cache_distinguishes_timezones(self):
+        field = fields.LocalDateTime(format='iso', cache_size=4)
+        utc_value = dt.datetime(2013, 11, 10, 7, 23, 45, tzinfo=utils.UTC)
+        central_value = central.localize(dt.datetime(2013, 11, 10, 1, 23, 45))
+        # Same instant, different timezones
+        assert utc_value == central_value
+        assert field.serialize('d', {'d': utc_value}) == '2013-11-10T07:23:45+00:00'
+        assert field.serialize('d', {'d': central_value}) == '2013-11-10T01:23:45-06:00'
+        assert field.serialize('d', {'d': central_value}) == '2013-11-10T01:23:45-06:00'
+        assert field.cache_info().hits == 1
+
+    def test_date_and_time_caches(self):
+        date_field = fields.Date(cache_size=2)
+        time_field = fields.Time(cache_size=2)
+        for _ in range(2):
+            assert date_field.deserialize('2014-08-21') == dt.date(2014, 8, 21)
+            assert date_field.serialize('d', {'d': dt.date(2014, 8, 21)}) == '2014-08-21'
+            assert time_field.deserialize('01:23:45') == dt.time(1, 23, 45)
+            assert time_field.serialize('t', {'t': dt.time(1, 23, 45)}) == '01:23:45'
+        assert date_field.cache_info().hits == 2
+        assert time_field.cache_info().hits == 2
+
+    def test_cache_size_meta_option(self):
+        class MySchema(Schema):
+            created = fields.DateTime()
+            updated = fields.DateTime(cache_size=1)
+            at = fields.Time()
+
+            class Meta:
+                datetime_cache_size = 10
+
+        schema = MySchema()
+        assert schema.fields['created'].cache_info().maxsize == 10
+        assert schema.fields['updated'].cache_info().maxsize == 1
+        assert schema.fields['at'].cache_info().maxsize == 10
+        data = {'created': '2013-11-10T01:23:45', 'at': '01:23:45'}
+        assert schema.load([data, data], many=True)[0] == {
+            'created': dt.datetime(2013, 11, 10, 1, 23, 45),
+            'at': dt.time(1, 23, 45),
+        }
+        assert schema.fields['created'].cache_info().hits == 1
+
+
+class TestContainerPrimitives:
+
+    class ContainerSchema(Schema):
+        ints = fields.List(fields.Int())
+        floats = fields.List(fields.Float())
+        strings = fields.List(fields.Str())
+        validated = fields.List(fields.Int(validate=lambda n: n > 0))
+        row = fields.Tuple((fields.Str(), fields.Int(), fields.Float()))
+        mapping = fields.Dict(keys=fields.Str(), values=fields.Float())
+        keys_only = fields.Dict(keys=fields.Str())
+
+    class FloatSubclass(float):
+        pass
+
+    @pytest.mark.parametrize(
+        'data', [
+            {'ints': [1, 2, 3], 'floats': [1.5, 2.5], 'strings': ['a', 'b']},
+            {'ints': [1, 2.0, '3'], 'floats': [1, 2.5, '3.5'], 'strings': [b'a', 'b']},
+            {'floats': [FloatSubclass(1.5)], 'validated': [1, 2]},
+            {'row': ('a', 1, 2.5)},
+            {'row': ['a', '1', 2]},
+            {'mapping': {'a': 1.5, 'b': 2.5}, 'keys_only': {'a': [1]}},
+            {'mapping': {'a': 1, b'b': '2.5'}, 'keys_only': {b'a': 1}},
+            {'ints': [], 'floats': [], 'mapping': {}},
+        ],
+    )
+    def test_matches_field_by_field_results(self, data):
+        schema = self.ContainerSchema()
+        loaded = schema.load(data)
+        dumped = schema.dump(data)
+        for name, value in data.items():
+            field = schema.fields[name]
+            assert loaded[name] == field.deserialize(value)
+            assert dumped[name] == field._serialize(value, name, data)
+            # Mutable containers are copied
+            if not isinstance(value, tuple):
+                assert loaded[name] is not value
+
+    def test_errors_after_first_failure(self):
+        with pytest.raises(ValidationError) as excinfo:
+            self.ContainerSchema().load({
+                'ints': [1, 'a', 3, 'b'],
+                'floats': [1.5, float('nan')],
+                'validated': [1, -1],
+                'mapping': {'a': 1.5, 'b': float('inf')},
+            })
+        assert excinfo.value.messages == {
+            'ints': {1: ['Not a valid integer.'], 3: ['Not a valid integer.']},
+            'floats': {1: ['Special numeric values (nan or infinity) are not permitted.']},
+            'validated': {1: ['Invalid value.']},
+            'mapping': {
+                'b': {'value': ['Special numeric values (nan or infinity) are not permitted.']},
+            },
+        }
+
+    def test_allow_nan(self):
+        field = fields.List(fields.Float(allow_nan=True))
+        field._bind_to_schema('floats', Schema())
+        result = field.deserialize([1.5, float('inf')])
+        assert result == [1.5, float('inf')]
+
+
+class TestErrorResults:
+
+    def test_deserialize_result(self):
+        field = fields.List(fields.Int(validate=validate.Range(min=0)), required=True)
+        assert field._deserialize_result(['1', 2]) == [1, 2]
+        for value, messages in (
+            (missing, ['Missing data for required field.']),
+            ('a', ['Not a valid list.']),
+            ([1, 'a', -1], {1: ['Not a valid integer.'], 2: ['Must be at least 0.']}),
+        ):
+            result = field._deserialize_result(value)
+            assert isinstance(result, Failure)
+            assert result.error.messages == messages
+            with pytest.raises(ValidationError) as excinfo:
+                field.deserialize(value)
+            assert excinfo.value.messages == messages
+
+    def test_overridden_methods_are_called(self):
+
+        class CustomValidator(validate.Validator):
+            def __call__(self, value):
+                raise ValidationError('Invalid by validator.')
+
+        class CustomFail(fields.Int):
+            def fail(self, key, **kwargs):
+                raise ValidationError('Custom {0}.'.format(key))
+
+        class CustomValidate(fields.Int):
+            def _validate(self, value):
+                raise ValidationError('Custom validate.')
+
+        class CustomList(fields.List):
+            def _deserialize(self, value, attr, data, **kwargs):
+                raise ValidationError('Custom list.')
+
+        class CustomNested(fields.Nested):
+            def _load(self, value, data, partial=None):
+                raise ValidationError('Custom nested.')
+
+        class MySchema(Schema):
+            validated = fields.Str(validate=CustomValidator())
+            fail = CustomFail(required=True)
+            validate = CustomValidate()
+            list = CustomList(fields.Int())
+            nested = CustomNested(Schema)
+
+        with pytest.raises(ValidationError) as excinfo:
+            MySchema().load({'validated': 'a', 'validate': 1, 'list': [1], 'nested': {}})
+        assert excinfo.value.messages == {
+            'validated': ['Invalid by validator.'],
+            'fail': ['Custom required.'],
+            'validate': ['Custom validate.'],
+            'list': ['Custom list.'],
+            'nested': ['Custom nested.'],
+        }
+
+
+class TestValidatorFusion:
+
+    def test_errors_match_unfused_validators(self):
+
+        def user_validator(value):
+            if value != 'ok':
+                raise ValidationError('Not ok.')
+
+        def returns_false(value):
+            return False
+
+        validators = [
+            validate.Length(min=3),
+            validate.Regexp('[a-z]+$'),
+            user_validator,
+            validate.OneOf(['abc']),
+            returns_false,
+            validate.Length(max=1),
+        ]
+        bound = fields.Str(validate=validators)
+        bound._bind_to_schema('name', Schema())
+        assert bound._compiled_validators is not None
+        unbound = fields.Str(validate=validators)
+        for value in ('ok', 'A', 'abc', 'abcd'):
+            with pytest.raises(ValidationError) as expected:
+                unbound.deserialize(value)
+            with pytest.raises(ValidationError) as excinfo:
+                bound.deserialize(value)
+            assert excinfo.value.messages == expected.value.messages
+
+    def test_container_validators_are_fused(self):
+        field = fields.List(fields.Int(validate=[validate.Range(min=0), validate.OneOf([1, 2])]))
+        field._bind_to_schema('nums', Schema())
+        assert field.container._compiled_validators is not None
+        with pytest.raises(ValidationError) as excinfo:
+            field.deserialize([1, -1, 3])
+        assert excinfo.value.messages == {
+            1: ['Must be at least 0.', 'Not a valid choice.'],
+            2: ['Not a valid choice.'],
+        }
+
+    def test_validators_added_after_binding_are_run(self):
+        class MySchema(Schema):
+            name = fields.Str(validate=validate.Length(min=1))
+            age = fields.Int(validate=validate.Range(min=0))
+
+            def on_bind_field(self, field_name, field_obj):
+                if field_name == 'name':
+                    field_obj.validators.append(validate.OneOf(['a']))
+
+        schema = MySchema()
+        assert schema.validate({'name': 'b', 'age': -1}) == {
+            'name': ['Not a valid choice.'],
+            'age': ['Must be at least 0.'],
+        }
+        schema.fields['age'].validators.append(lambda value: value != 1)
+        assert schema.validate({'name': 'a', 'age': 1}) == {'age': ['Invalid value.']}
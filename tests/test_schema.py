@@ -4,18 +4,22 @@
 import datetime as dt
 import decimal
 import random
+import threading
+import uuid
 from collections import namedtuple, OrderedDict
 
+import pytz
 import simplejson as json
 
 import pytest
 
-from marshmallow import Schema, fields, utils, validates, validates_schema, \
-    EXCLUDE, INCLUDE, RAISE
+from marshmallow import Schema, fields, utils, validates, validates_schema, post_dump, pre_dump, \
+    post_load, EXCLUDE, INCLUDE, RAISE
 from marshmallow.exceptions import ValidationError, StringNotCollectionError
 
 from tests.base import (
     assert_almost_equal,
+    central,
     UserSchema,
     UserMetaSchema,
     UserRelativeUrlSchema,
@@ -448,6 +452,43 @@ def test_nested_on_bind_field_hook():
     assert schema2.fields['foo'].schema.fields['bar'].metadata['fname'] == 'quxquux'
 
 
+def run_interleaved(first, second):
+    """Run the calls ``first`` and ``second`` in two threads, so that ``first``
+    runs to the end while ``second`` is paused in the middle. Each call is
+    passed a ``gate`` function that pauses it, and returns a result or the
+    messages of the :exc:`ValidationError` raised.
+    """
+    first_paused, second_paused, first_done = (threading.Event() for _ in range(3))
+    results = {}
+
+    def first_gate():
+        first_paused.set()
+        second_paused.wait(5)
+
+    def second_gate():
+        second_paused.set()
+        first_done.wait(5)
+
+    def run(call, gate, done):
+        try:
+            results[call] = call(gate)
+        except ValidationError as error:
+            results[call] = error.messages
+        finally:
+            done.set()
+
+    threads = [
+        threading.Thread(target=run, args=(first, first_gate, first_done)),
+        threading.Thread(target=run, args=(second, second_gate, threading.Event())),
+    ]
+    threads[0].start()
+    first_paused.wait(5)
+    threads[1].start()
+    for thread in threads:
+        thread.join(10)
+    return results[first], results[second]
+
+
 class TestValidate:
 
     def test_validate_raises_with_errors_dict(self):
@@ -500,6 +541,139 @@ class TestValidate:
         assert 'foo' in errors
         assert 'required' in errors['foo'][0]
 
+    def test_validate_does_not_assemble_unneeded_data(self):
+        loaded = []
+
+        class ChildSchema(Schema):
+            num = fields.Int()
+
+            @post_load
+            def make_child(self, data):
+                loaded.append(data)
+                return data
+
+        class PlainSchema(Schema):
+            child = fields.Nested(ChildSchema)
+
+        class ParentSchema(Schema):
+            children = fields.Nested(ChildSchema, many=True, validate=lambda c: len(c) < 2)
+
+            @validates_schema
+            def validate_children(self, data):
+                if 'num' not in data['children'][0]:
+                    raise ValidationError('Missing num.')
+
+        s = PlainSchema()
+        assert s.validate({'child': {'num': 1}}) == {}
+        assert s.validate({'child': {'num': 'x'}}) == {'child': {'num': ['Not a valid integer.']}}
+        assert loaded == []
+        # The data needed by validation methods and validators is assembled
+        s = ParentSchema()
+        assert s.validate({'children': [{}]}) == {'_schema': ['Missing num.']}
+        assert s.validate({'children': [{}, {}]}) == {'children': ['Invalid value.']}
+        assert loaded == [{}, {}, {}]
+
+    def test_validate_and_load_can_run_concurrently(self):
+        class ChildSchema(Schema):
+            num = fields.Int()
+
+        class ParentSchema(Schema):
+            gate = fields.Function(deserialize=lambda gate: gate())
+            child = fields.Nested(ChildSchema)
+
+            class Meta:
+                ordered = True
+
+        s = ParentSchema()
+        loaded, errors = run_interleaved(
+            lambda gate: s.load({'gate': gate, 'child': {'num': 1}}),
+            lambda gate: s.validate({'gate': gate, 'child': {'num': 2}}),
+        )
+        assert loaded == {'gate': None, 'child': {'num': 1}}
+        assert errors == {}
+
+
+class TestLoadWithoutValidation:
+
+    @pytest.fixture
+    def schema(self):
+        class ItemSchema(Schema):
+            price = fields.Decimal(validate=lambda n: n > 0)
+
+            @validates_schema
+            def validate_item(self, data):
+                raise ValidationError('Invalid item.')
+
+        class OrderSchema(Schema):
+            id = fields.UUID(required=True)
+            email = fields.Email()
+            created = fields.DateTime()
+            tags = fields.List(fields.Str(validate=lambda s: s.islower()))
+            items = fields.Nested(ItemSchema, many=True)
+
+            @validates('email')
+            def validate_email(self, value):
+                raise ValidationError('Invalid email.')
+
+        return OrderSchema()
+
+    @pytest.fixture
+    def data(self):
+        return {
+            'id': '8b9d2d85-6a84-43c9-b4e9-bf4b6b7ab4ae',
+            'email': 'not-an-email',
+            'created': '2019-02-08T12:00:00',
+            'tags': ['NEW'],
+            'items': [{'price': '-1.5'}],
+        }
+
+    def test_load_without_validation(self, schema, data):
+        with pytest.raises(ValidationError):
+            schema.load(data)
+        result = schema.load(data, validate=False)
+        assert result['id'] == uuid.UUID(data['id'])
+        assert result['email'] == 'not-an-email'
+        assert result['created'] == dt.datetime(2019, 2, 8, 12)
+        assert result['tags'] == ['NEW']
+        assert result['items'] == [{'price': decimal.Decimal('-1.5')}]
+        assert schema.loads(json.dumps(data), validate=False) == result
+
+    def test_coercion_required_and_unknown_are_checked(self, schema, data):
+        data['created'] = 'yesterday'
+        del data['id']
+        data['spam'] = 42
+        with pytest.raises(ValidationError) as excinfo:
+            schema.load(data, validate=False)
+        assert set(excinfo.value.messages) == {'created', 'id', 'spam'}
+        del data['created']
+        result = schema.load(data, validate=False, partial=True, unknown=EXCLUDE)
+        assert 'spam' not in result
+        # The next loads are validated
+        with pytest.raises(ValidationError):
+            schema.load(data, partial=True, unknown=EXCLUDE)
+
+    @pytest.mark.parametrize('first_validates', [True, False])
+    def test_loads_with_and_without_validation_can_run_concurrently(self, first_validates):
+        class MySchema(Schema):
+            gate = fields.Function(deserialize=lambda gate: gate())
+            age = fields.Int(validate=lambda n: n >= 0)
+
+            class Meta:
+                ordered = True
+
+        s = MySchema()
+        results = run_interleaved(
+            lambda gate: s.load({'gate': gate, 'age': -1}, validate=first_validates),
+            lambda gate: s.load({'gate': gate, 'age': -1}, validate=not first_validates),
+        )
+        if not first_validates:
+            results = results[::-1]
+        assert results == (
+            {'age': ['Invalid value.']},
+            {'gate': None, 'age': -1},
+        )
+
+
 @pytest.mark.parametrize(
     'SchemaClass',
     [UserSchema, UserMetaSchema],
@@ -1249,6 +1423,32 @@ def test_attribute_collision(attribute):
         with pytest.raises(ValueError, match=attribute):
             MySchema()
 
+@pytest.mark.parametrize('attribute', ('f1.x', 'f3.x.y', 'f5', None))
+def test_nested_attribute_conflict(attribute):
+
+    class MySchema(Schema):
+        f1 = fields.Field()
+        f2 = fields.Field(attribute=attribute)
+        f3 = fields.Field(attribute='f3.x')
+        f4 = fields.Field(attribute='f1.y', dump_only=True)
+
+    if attribute in (None, 'f5'):
+        MySchema()
+    else:
+        with pytest.raises(ValueError, match=attribute):
+            MySchema()
+
+def test_load_nested_attributes():
+
+    class MySchema(Schema):
+        f1 = fields.Int()
+        f2 = fields.Int(attribute='a.b.c')
+        f3 = fields.Int(attribute='a.b.d')
+        f4 = fields.Int(attribute='a.e')
+
+    result = MySchema().load({'f1': 1, 'f2': 2, 'f3': 3, 'f4': 4})
+    assert result == {'f1': 1, 'a': {'b': {'c': 2, 'd': 3}, 'e': 4}}
+
 class TestDeeplyNestedLoadOnly:
 
     @pytest.fixture()
@@ -1521,6 +1721,78 @@ def test_only_and_exclude_as_string(param):
     with pytest.raises(StringNotCollectionError):
         MySchema(**{param: 'foo'})
 
+
+class TestProjectionPerCall:
+
+    @pytest.fixture
+    def schema_class(self):
+        class ChildSchema(Schema):
+            foo = fields.Field()
+            bar = fields.Field()
+
+        class ParentSchema(Schema):
+            bla = fields.Field()
+            bli = fields.Field()
+            blubb = fields.Nested(ChildSchema)
+
+        return ParentSchema
+
+    @pytest.fixture
+    def data(self):
+        return {'bla': 1, 'bli': 2, 'blubb': {'foo': 3, 'bar': 4}}
+
+    @pytest.mark.parametrize(
+        ('only', 'exclude'), [
+            (('bla', 'blubb.foo'), ()),
+            (None, ('bli', 'blubb.bar')),
+            (('bla', 'blubb'), ('blubb.foo',)),
+        ],
+    )
+    def test_only_and_exclude(self, schema_class, data, only, exclude):
+        sch = schema_class()
+        expected = schema_class(only=only, exclude=exclude)
+        dumped = expected.dump(data)
+        assert sch.dump(data, only=only, exclude=exclude) == dumped
+        assert sch.load(dumped, only=only, exclude=exclude) == expected.load(dumped)
+        assert sch.dump(data) == data
+
+    def test_combined_with_schema_options(self, schema_class, data):
+        sch = schema_class(only=('bla', 'blubb'), exclude=('blubb.bar',))
+        assert sch.dump(data, only=('blubb',)) == {'blubb': {'foo': 3}}
+        assert sch.dump(data, exclude=('blubb.foo',)) == {'bla': 1, 'blubb': {}}
+        with pytest.raises(ValueError):
+            sch.dump(data, only=('bli',))
+
+    def test_projections_are_cached(self, schema_class, data):
+        sch = schema_class(context={'foo': 'bar'})
+        projection = sch._get_projection(('bla', 'blubb.foo'), None)
+        assert sch._get_projection(['blubb.foo', 'bla'], ()) is projection
+        sch.context = {'foo': 'baz'}
+        assert sch._get_projection(('bla', 'blubb.foo'), None).context is sch.context
+
+    def test_many_is_passed_to_projections(self, schema_class, data):
+        sch = schema_class(many=True)
+        assert sch.dump([data], only=('bla',)) == [{'bla': 1}]
+        assert sch.dump(data, many=False, only=('bla',)) == {'bla': 1}
+        assert sch.load([{'bla': 1}], only=('bla',)) == [{'bla': 1}]
+        sch.many = False
+        assert sch.dump(data, only=('bla',)) == {'bla': 1}
+        assert sch.load({'bla': 1}, only=('bla',)) == {'bla': 1}
+
+    def test_changes_to_instance_are_not_projected(self, schema_class, data):
+        # Projections are built from the declared fields and the options
+        # passed to the constructor
+        sch = schema_class(exclude=('bli',))
+        del sch.fields['bla']
+        sch.exclude = set()
+        assert sch.dump(data) == {'blubb': {'foo': 3, 'bar': 4}}
+        assert sch.dump(data, exclude=('blubb.bar',)) == {'bla': 1, 'blubb': {'foo': 3}}
+
+    @pytest.mark.parametrize('param', ('only', 'exclude'))
+    def test_only_and_exclude_as_string(self, schema_class, data, param):
+        with pytest.raises(StringNotCollectionError):
+            schema_class().dump(data, **{param: 'bla'})
+
 def test_nested_with_sets():
     class Inner(Schema):
         foo = fields.Field()
@@ -1732,6 +2004,21 @@ class TestHandleError:
         with pytest.raises(CustomError):
             MySchema().load(in_data)
 
+    def test_nested_schema_error_handler(self):
+
+        class InnerSchema(Schema):
+            num = fields.Int()
+
+            def handle_error(self, error, data):
+                raise ValidationError({'num': ['Handled.']})
+
+        class OuterSchema(Schema):
+            inner = fields.Nested(InnerSchema)
+
+        with pytest.raises(ValidationError) as excinfo:
+            OuterSchema().load({'inner': {'num': 'a'}})
+        assert excinfo.value.messages == {'inner': {'num': ['Handled.']}}
+
     def test_custom_error_handler_with_validates_decorator(self):
         in_data = {'num': -1}
 
@@ -2130,6 +2417,230 @@ class TestNestedSchema:
             }[unknown]
             assert ParentSchema().load(data) == output
 
+    @pytest.mark.parametrize('dedupe', ('share', 'copy'))
+    def test_nested_dedupe(self, user, dedupe):
+        dumped = []
+
+        class CountingUserSchema(Schema):
+            name = fields.Str()
+
+            @pre_dump
+            def count(self, obj):
+                dumped.append(obj)
+                return obj
+
+        class BlogSchema(Schema):
+            title = fields.Str()
+            user = fields.Nested(CountingUserSchema, dedupe=dedupe)
+
+        blogs = [Blog('Blog {0}'.format(i), user=user) for i in range(3)]
+        blogs.append(Blog('Other blog', user=User('Mick')))
+        schema = BlogSchema(many=True)
+        result = schema.dump(blogs)
+        assert [each['user']['name'] for each in result] == ['Monty'] * 3 + ['Mick']
+        assert len(dumped) == 2
+        assert (result[0]['user'] is result[1]['user']) is (dedupe == 'share')
+
+        # Results are only reused within a single call
+        user.name = 'Keith'
+        assert schema.dump(blogs)[0]['user'] == {'name': 'Keith'}
+        assert len(dumped) == 4
+
+    def test_nested_dedupe_spans_nested_schemas(self, user):
+        class UserNameSchema(Schema):
+            name = fields.Str()
+            calls = fields.Method('count_call')
+
+            def count_call(self, obj):
+                self.context['calls'] += 1
+                return self.context['calls']
+
+        class BlogSchema(Schema):
+            user = fields.Nested(UserNameSchema, dedupe='share')
+            collaborators = fields.List(fields.Nested(UserNameSchema, dedupe='share'))
+
+        class PostSchema(Schema):
+            blog = fields.Nested(BlogSchema)
+
+        blog = Blog('Blog', user=user, collaborators=[user, user])
+        posts = [{'blog': blog}, {'blog': Blog('Copy', user=user, collaborators=[user])}]
+        schema = PostSchema(many=True, context={'calls': 0})
+        result = schema.dump(posts)
+        user_result = result[0]['blog']['user']
+        assert result[1]['blog']['user'] is user_result
+        collaborators = result[0]['blog']['collaborators']
+        assert collaborators[0] is collaborators[1]
+        assert result[1]['blog']['collaborators'][0] is collaborators[0]
+        # Nested fields of the same schema share their results
+        assert collaborators[0] is user_result
+        assert schema.context['calls'] == 1
+
+    def test_nested_dedupe_is_shared_by_fields_nesting_the_same_schema(self, user):
+        class PostSchema(Schema):
+            author = fields.Nested(UserSchema, only=('name', 'age'), dedupe='share')
+            editor = fields.Nested(UserSchema, only=('name', 'age'), dedupe='share')
+            reviewer = fields.Nested(UserSchema, only=('name',), dedupe='share')
+            readers = fields.Nested(UserSchema, only=('name', 'age'), many=True, dedupe='share')
+
+        result = PostSchema().dump({
+            'author': user, 'editor': user, 'reviewer': user, 'readers': [user],
+        })
+        assert result['editor'] is result['author']
+        # Objects serialized differently are not shared
+        assert result['reviewer'] == {'name': 'Monty'}
+        assert result['readers'] == [result['author']]
+
+    def test_nested_dedupe_does_not_reuse_errors(self):
+        class ChildSchema(Schema):
+            num = fields.Int()
+
+        class ParentSchema(Schema):
+            child = fields.Nested(ChildSchema, dedupe='share')
+
+        child = {'num': 'invalid'}
+        with pytest.raises(ValidationError) as excinfo:
+            ParentSchema(many=True).dump([{'child': child}, {'child': child}])
+        assert excinfo.value.messages == {
+            0: {'child': {'num': ['Not a valid integer.']}},
+            1: {'child': {'num': ['Not a valid integer.']}},
+        }
+
+    def test_nested_dedupe_is_scoped_to_concurrent_calls(self, user):
+        class BlogSchema(Schema):
+            gate = fields.Function(lambda obj: obj['gate']())
+            user = fields.Nested(UserSchema, only=('name',), dedupe='share')
+
+            class Meta:
+                ordered = True
+
+        schema = BlogSchema(many=True)
+        first, second = run_interleaved(
+            lambda gate: schema.dump([{'gate': gate, 'user': user}]),
+            lambda gate: schema.dump([
+                {'gate': gate, 'user': user}, {'gate': lambda: None, 'user': user},
+            ]),
+        )
+        assert first == [{'gate': None, 'user': {'name': 'Monty'}}]
+        assert second[0]['user'] is second[1]['user']
+
+    def test_nested_dedupe_invalid_value(self):
+        with pytest.raises(ValueError):
+            fields.Nested(UserSchema, dedupe=True)
+
+    def test_nested_reference(self):
+        class VendorSchema(Schema):
+            id = fields.Int(data_key='vendorId')
+            name = fields.Str()
+
+        class OrderSchema(Schema):
+            suppliers = fields.Nested(VendorSchema, reference='id', many=True)
+            vendor = fields.Nested(VendorSchema, reference='id')
+
+            class Meta:
+                ordered = True
+
+        acme = {'id': 1, 'name': 'Acme'}
+        other = {'id': 2, 'name': 'Other'}
+        orders = [
+            {'vendor': acme, 'suppliers': [other, acme, other]},
+            {'vendor': acme, 'suppliers': [acme]},
+        ]
+        schema = OrderSchema(many=True)
+        result = schema.dump(orders)
+        # Fields are (de)serialized in declaration order and share references
+        assert result == [
+            {
+                'vendor': 1,
+                'suppliers': [{'vendorId': 2, 'name': 'Other'}, {'vendorId': 1, 'name': 'Acme'}, 2],
+            },
+            {'vendor': 1, 'suppliers': [1]},
+        ]
+
+        loaded = schema.load(result)
+        assert loaded == orders
+        assert loaded[0]['vendor'] is loaded[0]['suppliers'][1]
+        assert loaded[1]['vendor'] is loaded[0]['suppliers'][1]
+        assert loaded[0]['suppliers'][2] is loaded[0]['suppliers'][0]
+
+    def test_nested_reference_is_shared_by_fields_nesting_the_same_schema(self):
+        class PostSchema(Schema):
+            author = fields.Nested(UserSchema, only=('name', 'age'), reference='name')
+            editor = fields.Nested(UserSchema, only=('name', 'age'), reference='name')
+            reviewer = fields.Nested(UserSchema, only=('name',), reference='name')
+
+            class Meta:
+                ordered = True
+
+        user = User('Monty', age=42)
+        schema = PostSchema()
+        result = schema.dump({'author': user, 'editor': user, 'reviewer': user})
+        assert result == {
+            'author': {'name': 'Monty', 'age': 42},
+            'editor': 'Monty',
+            # Objects serialized differently are not shared
+            'reviewer': {'name': 'Monty'},
+        }
+        loaded = schema.load(result)
+        assert loaded['editor'] is loaded['author']
+        assert loaded['reviewer'] is not loaded['author']
+
+    def test_nested_reference_is_scoped_to_a_call(self):
+        class OrderSchema(Schema):
+            user = fields.Nested(UserSchema, only=('name', 'age'), reference='name')
+
+        user = User('Monty', age=42)
+        schema = OrderSchema()
+        assert schema.dump({'user': user}) == {'user': {'name': 'Monty', 'age': 42}}
+        assert schema.dump({'user': user}) == {'user': {'name': 'Monty', 'age': 42}}
+
+        with pytest.raises(ValidationError) as excinfo:
+            schema.load({'user': 'Monty'})
+        assert excinfo.value.messages == {'user': ['Unknown reference.']}
+
+    def test_nested_reference_is_scoped_to_concurrent_calls(self):
+        class OrderSchema(Schema):
+            gate = fields.Function(lambda obj: obj['gate'](), lambda gate: gate())
+            user = fields.Nested(UserSchema, only=('name', 'age'), reference='name')
+
+            class Meta:
+                ordered = True
+
+        user = User('Monty', age=42)
+        schema = OrderSchema()
+        dumped = run_interleaved(
+            lambda gate: schema.dump({'gate': gate, 'user': user}),
+            lambda gate: schema.dump({'gate': gate, 'user': user}),
+        )
+        assert [each['user'] for each in dumped] == [{'name': 'Monty', 'age': 42}] * 2
+
+        loaded, errors = run_interleaved(
+            lambda gate: schema.load({'gate': gate, 'user': {'name': 'Monty', 'age': 42}}),
+            lambda gate: schema.load({'gate': gate, 'user': 'Monty'}),
+        )
+        assert loaded['user'].name == 'Monty'
+        assert errors == {'user': ['Unknown reference.']}
+
+    def test_nested_reference_errors(self):
+        class ChildSchema(Schema):
+            id = fields.Int()
+
+        class ParentSchema(Schema):
+            children = fields.Nested(ChildSchema, reference='id', many=True)
+
+        with pytest.raises(ValidationError) as excinfo:
+            ParentSchema().load({'children': [{'id': 1}, 1, 2, {'id': 'x'}, [1]]})
+        assert excinfo.value.messages == {
+            'children': {
+                2: ['Unknown reference.'],
+                3: {'id': ['Not a valid integer.']},
+                4: ['Unknown reference.'],
+            },
+        }
+
+    def test_nested_reference_and_dedupe(self):
+        with pytest.raises(ValueError):
+            fields.Nested(UserSchema, dedupe='share', reference='id')
+
 
 class TestPluckSchema:
 
@@ -2175,6 +2686,76 @@ class TestPluckSchema:
             'collaborators': [{'name': 'Mick'}, {'name': 'Keith'}],
         }
 
+    def test_pluck_serializes_only_plucked_field(self, blog, monkeypatch):
+        class FlatBlogSchema(Schema):
+            user = fields.Pluck(UserSchema, 'name')
+            collaborators = fields.Pluck(UserSchema, 'name', many=True)
+        s = FlatBlogSchema()
+        for field_name in ('user', 'collaborators'):
+            nested_schema = s.fields[field_name].schema
+            monkeypatch.setattr(nested_schema, 'dump', None)
+        data = s.dump(blog)
+        assert data['user'] == blog.user.name
+        assert data['collaborators'] == [each.name for each in blog.collaborators]
+
+    def test_pluck_with_dump_hooks(self, blog):
+        class UpperUserSchema(Schema):
+            name = fields.Str()
+
+            @post_dump
+            def upper(self, data):
+                data['name'] = data['name'].upper()
+                return data
+
+        class FlatBlogSchema(Schema):
+            user = fields.Pluck(UpperUserSchema, 'name')
+            collaborators = fields.Pluck(UpperUserSchema, 'name', many=True)
+        data = FlatBlogSchema().dump(blog)
+        assert data['user'] == blog.user.name.upper()
+        assert data['collaborators'] == [each.name.upper() for each in blog.collaborators]
+
+    def test_pluck_errors(self, blog):
+        class CheckedUserSchema(Schema):
+            name = fields.Method('get_name')
+
+            def get_name(self, obj):
+                if obj.name == 'Mick':
+                    raise ValidationError('Invalid name.')
+                return obj.name
+
+        class FlatBlogSchema(Schema):
+            user = fields.Pluck(CheckedUserSchema, 'name')
+            collaborators = fields.Pluck(CheckedUserSchema, 'name', many=True)
+        with pytest.raises(ValidationError) as excinfo:
+            FlatBlogSchema().dump(blog)
+        assert excinfo.value.messages == {
+            'collaborators': {0: {'name': ['Invalid name.']}},
+        }
+
+    def test_pluck_with_many_schema_instance(self, blog):
+        class FlatBlogSchema(Schema):
+            collaborators = fields.Pluck(UserSchema(many=True), 'name')
+        data = FlatBlogSchema().dump(blog)
+        assert data['collaborators'] == [each.name for each in blog.collaborators]
+
+    def test_pluck_generator_errors(self, blog):
+        class CheckedUserSchema(Schema):
+            name = fields.Method('get_name')
+
+            def get_name(self, obj):
+                if obj.name == 'Keith':
+                    raise ValidationError('Invalid name.')
+                return obj.name
+
+        class FlatBlogSchema(Schema):
+            collaborators = fields.Pluck(CheckedUserSchema, 'name', many=True)
+        blog.collaborators = (each for each in blog.collaborators)
+        with pytest.raises(ValidationError) as excinfo:
+            FlatBlogSchema().dump(blog)
+        assert excinfo.value.messages == {
+            'collaborators': {1: {'name': ['Invalid name.']}},
+        }
+
 
 class TestSelfReference:
 
@@ -2548,6 +3129,498 @@ class TestGetAttribute:
         with pytest.raises(AttributeError):
             schema.dump(users)
 
+    def test_get_attribute_from_mixin_is_used(self):
+        class DictGetterMixin(object):
+            def get_attribute(self, obj, attr, default):
+                return get_from_dict(self, obj, attr, default)
+
+        class UserDictSchema(DictGetterMixin, Schema):
+            name = fields.Str()
+
+        assert UserDictSchema().dump({'_name': 'joe', 'name': 'jane'}) == {'name': 'joe'}
+
+    def test_get_attribute_is_inherited(self):
+        class BaseUserDictSchema(Schema):
+            def get_attribute(self, obj, attr, default):
+                return get_from_dict(self, obj, attr, default)
+
+        class UserDictSchema(BaseUserDictSchema):
+            name = fields.Str()
+
+        assert UserDictSchema().dump({'_name': 'joe', 'name': 'jane'}) == {'name': 'joe'}
+
+    def test_get_attribute_set_on_instance_is_used(self):
+        class UserDictSchema(Schema):
+            name = fields.Str()
+
+        schema = UserDictSchema()
+        schema.get_attribute = lambda obj, attr, default: get_from_dict(schema, obj, attr, default)
+        assert schema.dump({'_name': 'joe', 'name': 'jane'}) == {'name': 'joe'}
+        assert UserDictSchema().dump({'_name': 'joe', 'name': 'jane'}) == {'name': 'jane'}
+
+    def test_fields_receive_a_callable_accessor(self):
+        class UpperField(fields.Field):
+            def get_value(self, obj, attr, accessor=None, default=utils.missing):
+                return accessor(obj, attr, default).upper()
+
+        class UserDictSchema(Schema):
+            name = UpperField()
+
+        assert UserDictSchema().dump({'name': 'joe'}) == {'name': 'JOE'}
+        assert UserDictSchema(many=True).dump([{'name': 'joe'}]) == [{'name': 'JOE'}]
+
+
+class TestSourceAdapters:
+
+    class PointSchema(Schema):
+        x = fields.Int()
+        y = fields.Int(default=0)
+        label = fields.Str(attribute='name')
+        double_x = fields.Function(lambda obj: obj.x * 2)
+
+    def test_dump_namedtuple(self):
+        Point = namedtuple('Point', ['x', 'y', 'name'])
+        result = self.PointSchema().dump([Point(1, 2, 'a'), Point(3, 4, 'b')], many=True)
+        assert result == [
+            {'x': 1, 'y': 2, 'label': 'a', 'double_x': 2},
+            {'x': 3, 'y': 4, 'label': 'b', 'double_x': 6},
+        ]
+
+    def test_dump_namedtuple_with_overridden_property(self):
+        class Point(namedtuple('Point', ['x', 'y'])):
+            @property
+            def name(self):
+                return 'p{}'.format(self.x)
+
+            @property
+            def y(self):
+                return -1
+
+        assert self.PointSchema().dump(Point(1, 2)) == {
+            'x': 1, 'y': -1, 'label': 'p1', 'double_x': 2,
+        }
+
+    def test_dump_slots_with_missing_attributes(self):
+        class Point(object):
+            __slots__ = ('x', 'y', 'name')
+
+            def __init__(self, x, y=None):
+                self.x = x
+                if y is not None:
+                    self.y = y
+
+        schema = self.PointSchema()
+        assert schema.dump(Point(1, 2)) == {'x': 1, 'y': 2, 'double_x': 2}
+        assert schema.dump(Point(3)) == {'x': 3, 'y': 0, 'double_x': 6}
+
+    def test_errors_raised_by_properties_are_stored_per_field(self):
+        class Point(namedtuple('Point', ['x', 'y'])):
+            @property
+            def name(self):
+                if self.x < 0:
+                    raise ValidationError('No name.')
+                return 'p'
+
+        schema = self.PointSchema()
+        with pytest.raises(ValidationError) as excinfo:
+            schema.dump(Point(-1, 2))
+        assert excinfo.value.messages == {'label': ['No name.']}
+        assert excinfo.value.valid_data == {'x': -1, 'y': 2, 'double_x': -2}
+        # Once values of this type were fetched in bulk
+        with pytest.raises(ValidationError) as excinfo:
+            schema.dump([Point(1, 2), Point(-1, 2)], many=True)
+        assert excinfo.value.messages == {1: {'label': ['No name.']}}
+
+    def test_registered_source_adapter_is_used(self):
+        class Row(dict):
+            pass
+
+        calls = []
+
+        def row_fetcher(obj, keys):
+            fetch = utils.item_fetcher(obj, keys)
+
+            def wrapped(obj):
+                calls.append(obj)
+                return fetch(obj)
+            return wrapped
+
+        utils.register_source_adapter(Row, row_fetcher)
+        try:
+            row = Row(x=1, name='a')
+            assert self.PointSchema(exclude=('double_x',)).dump(row) == {
+                'x': 1, 'y': 0, 'label': 'a',
+            }
+            assert calls == [row]
+        finally:
+            utils._source_adapters.pop(Row)
+
+    def test_fields_with_custom_getters_are_not_fetched(self):
+        Point = namedtuple('Point', ['x', 'y', 'name'])
+
+        class Doubled(fields.Int):
+            def get_value(self, obj, attr, accessor=None, default=utils.missing):
+                return 2 * super(Doubled, self).get_value(obj, attr, accessor, default)
+
+        class PointSchema(Schema):
+            x = Doubled()
+            y = fields.Int()
+            first = fields.Str(attribute='name.first')
+
+        assert PointSchema().dump(Point(1, 2, {'first': 'a'})) == {'x': 2, 'y': 2, 'first': 'a'}
+
+
+class TestDumpCache:
+
+    class Item(object):
+        def __init__(self, id, name, version=1):
+            self.id = id
+            self.name = name
+            self.version = version
+
+    class ItemSchema(Schema):
+        id = fields.Int()
+        name = fields.Str()
+        price = fields.Float()
+
+        class Meta:
+            dump_cache_size = 2
+
+        def get_dump_cache_key(self, obj):
+            return (obj.id, obj.version) if obj.id is not None else None
+
+    @pytest.fixture
+    def schema_class(self):
+        # A new cache for each test
+        class ItemSchema(self.ItemSchema):
+            pass
+        return ItemSchema
+
+    def test_dump_is_cached(self, schema_class):
+        item = self.Item(1, 'Hammer')
+        first = schema_class().dump(item)
+        item.name = 'Saw'
+        assert schema_class().dump(item) == first == {'id': 1, 'name': 'Hammer'}
+        item.version = 2
+        assert schema_class().dump(item) == {'id': 1, 'name': 'Saw'}
+        info = schema_class().dump_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+    def test_dump_many_is_cached_per_object(self, schema_class):
+        items = [self.Item(1, 'Hammer'), self.Item(2, 'Saw'), self.Item(None, 'Nail')]
+        schema = schema_class(many=True)
+        result = schema.dump(items)
+        assert result == [
+            {'id': 1, 'name': 'Hammer'}, {'id': 2, 'name': 'Saw'}, {'id': None, 'name': 'Nail'},
+        ]
+        assert schema.dump(items[1:]) == result[1:]
+        assert schema.dump(items[1:])[0] is not result[1]
+        info = schema.dump_cache_info()
+        assert (info.hits, info.misses, info.evictions) == (2, 2, 0)
+
+    def test_variants_do_not_share_results(self, schema_class):
+        item = self.Item(1, 'Hammer')
+        assert schema_class().dump(item) == {'id': 1, 'name': 'Hammer'}
+        assert schema_class(only=('name',)).dump(item) == {'name': 'Hammer'}
+        assert schema_class(exclude=('name',)).dump(item) == {'id': 1}
+        assert schema_class(load_only=('id',)).dump(item) == {'name': 'Hammer'}
+        assert schema_class().dump_cache_info().misses == 4
+
+    def test_errors_are_not_cached(self, schema_class):
+        items = [self.Item(1, 'Hammer'), self.Item('invalid', 'Saw')]
+        for _ in range(2):
+            with pytest.raises(ValidationError) as excinfo:
+                schema_class(many=True).dump(items)
+            assert excinfo.value.messages == {1: {'id': ['Not a valid integer.']}}
+            assert excinfo.value.valid_data == [{'id': 1, 'name': 'Hammer'}, {'name': 'Saw'}]
+        assert schema_class().dump_cache_info().currsize == 1
+
+    def test_changing_a_cached_result_does_not_change_the_cache(self, schema_class):
+        item = self.Item(1, 'Hammer')
+        first = schema_class().dump(item)
+        first['envelope'] = True
+        del first['name']
+        assert schema_class().dump(item) == {'id': 1, 'name': 'Hammer'}
+        second = schema_class(many=True).dump([item])
+        second[0].pop('id')
+        assert schema_class(many=True).dump([item]) == [{'id': 1, 'name': 'Hammer'}]
+        assert schema_class().dump_cache_info().hits == 3
+
+    def test_pass_many_hooks_receive_the_collection(self, schema_class):
+        class EnvelopeSchema(schema_class):
+            @post_dump(pass_many=True)
+            def wrap(self, data, many):
+                return {'items': data} if many else {'item': data}
+
+        items = [self.Item(1, 'Hammer'), self.Item(2, 'Saw')]
+        assert EnvelopeSchema(many=True).dump(items) == {
+            'items': [{'id': 1, 'name': 'Hammer'}, {'id': 2, 'name': 'Saw'}],
+        }
+        assert EnvelopeSchema().dump(items[0]) == {'item': {'id': 1, 'name': 'Hammer'}}
+
+    def test_dump_with_context_is_not_cached(self, schema_class):
+        class ContextSchema(schema_class):
+            name = fields.Method('get_name')
+
+            def get_name(self, obj):
+                return self.context.get('prefix', '') + obj.name
+
+        item = self.Item(1, 'Hammer')
+        assert ContextSchema().dump(item)['name'] == 'Hammer'
+        assert ContextSchema(context={'prefix': 'A '}).dump(item)['name'] == 'A Hammer'
+        assert ContextSchema(context={'prefix': 'B '}).dump(item)['name'] == 'B Hammer'
+        assert ContextSchema().dump_cache_info().misses == 1
+
+    def test_clear_dump_cache(self, schema_class):
+        schema = schema_class()
+        schema.dump(self.Item(1, 'Hammer'))
+        schema.clear_dump_cache()
+        assert schema.dump_cache_info().currsize == 0
+
+    def test_dump_cache_is_disabled_by_default(self):
+        schema = UserSchema()
+        assert schema.dump_cache_info() is None
+        schema.clear_dump_cache()
+
+
+class TestDumpDelta:
+
+    formatted = []
+
+    class CountingStr(fields.Str):
+        def _serialize(self, value, attr, obj, **kwargs):
+            TestDumpDelta.formatted.append(attr)
+            return super(TestDumpDelta.CountingStr, self)._serialize(value, attr, obj, **kwargs)
+
+    @pytest.fixture
+    def schema(self):
+        class AuthorSchema(Schema):
+            name = fields.Str()
+            email = fields.Email()
+
+        class BookSchema(Schema):
+            title = fields.Str()
+            isbn = fields.Str(data_key='ISBN')
+            tags = fields.List(fields.Str())
+            author = fields.Nested(AuthorSchema)
+            reviewers = fields.Nested(AuthorSchema, many=True)
+            label = fields.Method('get_label')
+
+            def get_label(self, obj):
+                return obj['title'].upper()
+
+        return BookSchema()
+
+    @pytest.fixture
+    def book(self):
+        return {
+            'title': 'Holy Grail',
+            'isbn': '1234',
+            'tags': ['comedy'],
+            'author': {'name': 'Monty', 'email': 'monty@python.org'},
+            'reviewers': [{'name': 'Mick', 'email': 'mick@stones.org'}],
+        }
+
+    @pytest.mark.parametrize('use_snapshot', (True, False))
+    def test_dump_delta(self, schema, book, use_snapshot):
+        previous = schema.snapshot(book) if use_snapshot else schema.dump(book)
+        assert schema.dump_delta(book, previous) == {}
+
+        book['isbn'] = '5678'
+        book['tags'].append('fantasy')
+        book['author']['email'] = 'monty@spam.org'
+        assert schema.dump_delta(book, previous) == {
+            'ISBN': '5678',
+            'tags': ['comedy', 'fantasy'],
+            'author': {'email': 'monty@spam.org'},
+        }
+
+        book['title'] = 'Life of Brian'
+        book['reviewers'][0]['name'] = 'Keith'
+        delta = schema.dump_delta(book, previous)
+        assert delta['title'] == 'Life of Brian'
+        assert delta['label'] == 'LIFE OF BRIAN'
+        assert delta['reviewers'] == [{'name': 'Keith', 'email': 'mick@stones.org'}]
+
+    def test_unchanged_values_are_not_formatted(self):
+        class BookSchema(Schema):
+            title = self.CountingStr()
+            isbn = self.CountingStr()
+
+        schema = BookSchema()
+        book = {'title': 'Holy Grail', 'isbn': '1234'}
+        snapshot = schema.snapshot(book)
+        del self.formatted[:]
+        book['isbn'] = '5678'
+        assert schema.dump_delta(book, snapshot) == {'isbn': '5678'}
+        # The old value of a changed field is formatted to compare with
+        assert self.formatted == ['isbn', 'isbn']
+
+    def test_nested_objects_added_and_removed(self, schema, book):
+        book['author'] = None
+        snapshot = schema.snapshot(book)
+        book['author'] = {'name': 'Monty'}
+        assert schema.dump_delta(book, snapshot) == {'author': {'name': 'Monty'}}
+        snapshot = schema.snapshot(book)
+        del book['reviewers'][0]
+        assert schema.dump_delta(book, snapshot) == {'reviewers': []}
+
+    def test_dump_delta_errors(self):
+        class ChildSchema(Schema):
+            num = fields.Int()
+
+        class ParentSchema(Schema):
+            num = fields.Int()
+            child = fields.Nested(ChildSchema)
+
+        schema = ParentSchema()
+        parent = {'num': 1, 'child': {'num': 2}}
+        snapshot = schema.snapshot(parent)
+        parent['num'] = 'invalid'
+        parent['child']['num'] = 'invalid'
+        with pytest.raises(ValidationError) as excinfo:
+            schema.dump_delta(parent, snapshot)
+        assert excinfo.value.messages == {
+            'num': ['Not a valid integer.'],
+            'child': {'num': ['Not a valid integer.']},
+        }
+
+    def test_dump_delta_reports_equal_values_serialized_differently(self):
+        class EventSchema(Schema):
+            start = fields.LocalDateTime()
+            price = fields.Decimal(as_string=True)
+
+        schema = EventSchema()
+        event = {
+            'start': pytz.utc.localize(dt.datetime(2019, 1, 1, 12)),
+            'price': decimal.Decimal('1.5'),
+        }
+        snapshot = schema.snapshot(event)
+        event['start'] = event['start'].astimezone(central)
+        event['price'] = decimal.Decimal('1.50')
+        assert schema.dump_delta(event, snapshot) == {
+            'start': '2019-01-01T06:00:00-06:00',
+            'price': '1.50',
+        }
+
+    def test_dump_delta_ignores_different_values_serialized_equally(self):
+        class EventSchema(Schema):
+            start = fields.DateTime()
+            price = fields.Float()
+
+        schema = EventSchema()
+        event = {'start': dt.datetime(2019, 1, 1, 12), 'price': 1}
+        snapshot = schema.snapshot(event)
+        previous = schema.dump(event)
+        event['start'] = pytz.utc.localize(event['start'])
+        event['price'] = 1.0
+        assert schema.dump_delta(event, snapshot) == {}
+        assert schema.dump_delta(event, previous) == {}
+
+
+class TestLoadPatch:
+
+    @pytest.fixture
+    def schema(self):
+        class AuthorSchema(Schema):
+            name = fields.Str(required=True)
+            email = fields.Email()
+
+        class EventSchema(Schema):
+            title = fields.Str(required=True)
+            start = fields.Int()
+            end = fields.Int()
+            seats = fields.Int(validate=lambda n: n > 0)
+            author = fields.Nested(AuthorSchema)
+            calls = []
+
+            @validates('title')
+            def validate_title(self, value):
+                self.calls.append('title')
+
+            @validates_schema(fields=('start', 'end'))
+            def validate_dates(self, data):
+                self.calls.append('dates')
+                if data.get('end', 0) < data.get('start', 0):
+                    raise ValidationError('Ends before it starts.', 'end')
+
+            @validates_schema
+            def validate_all(self, data):
+                self.calls.append('all')
+
+        return EventSchema()
+
+    @pytest.fixture
+    def base(self, schema):
+        base = schema.load({
+            'title': 'Meeting',
+            'start': 1,
+            'end': 3,
+            'seats': 10,
+            'author': {'name': 'Monty', 'email': 'monty@python.org'},
+        })
+        del schema.calls[:]
+        return base
+
+    def test_load_patch(self, schema, base):
+        original = dict(base)
+        result = schema.load_patch({'seats': '20', 'start': '2'}, base)
+        assert result == dict(original, seats=20, start=2)
+        assert base == original
+        assert sorted(schema.calls) == ['all', 'dates']
+
+    def test_unaffected_schema_validators_are_skipped(self, schema, base):
+        result = schema.load_patch({'title': 'Party'}, base)
+        assert result['title'] == 'Party'
+        assert sorted(schema.calls) == ['all', 'title']
+
+    def test_schema_validators_receive_merged_data(self, schema, base):
+        with pytest.raises(ValidationError) as excinfo:
+            schema.load_patch({'end': 0}, base)
+        assert excinfo.value.messages == {'end': ['Ends before it starts.']}
+
+    def test_load_patch_errors(self, schema, base):
+        with pytest.raises(ValidationError) as excinfo:
+            schema.load_patch({'seats': 0, 'start': 'invalid', 'spam': 1}, base)
+        assert excinfo.value.messages == {
+            'seats': ['Invalid value.'],
+            'start': ['Not a valid integer.'],
+            'spam': ['Unknown field.'],
+        }
+        assert schema.calls == []
+
+    def test_nested_objects_are_patched(self, schema, base):
+        result = schema.load_patch({'author': {'email': 'monty@spam.org'}}, base)
+        assert result['author'] == {'name': 'Monty', 'email': 'monty@spam.org'}
+        assert base['author']['email'] == 'monty@python.org'
+
+        with pytest.raises(ValidationError) as excinfo:
+            schema.load_patch({'author': {'email': 'invalid'}}, base)
+        assert excinfo.value.messages == {'author': {'email': ['Not a valid email address.']}}
+
+    def test_dotted_attributes_are_copied(self):
+        class UserSchema(Schema):
+            name = fields.Str(attribute='profile.name')
+            age = fields.Int(attribute='profile.age')
+
+        schema = UserSchema()
+        base = schema.load({'name': 'Monty', 'age': 42})
+        result = schema.load_patch({'age': 43}, base)
+        assert result == {'profile': {'name': 'Monty', 'age': 43}}
+        assert base == {'profile': {'name': 'Monty', 'age': 42}}
+
+    def test_dependencies_must_be_fields(self):
+        class BadSchema(Schema):
+            foo = fields.Int()
+
+            @validates_schema(fields=('bar',))
+            def validate_bar(self, data):
+                pass
+
+        with pytest.raises(ValueError) as excinfo:
+            BadSchema()
+        assert '"bar" field does not exist.' in str(excinfo)
+
 
 class TestRequiredFields:
 
@@ -96,6 +96,21 @@ class TestFieldSerialization:
         field.parent = Parent(context={'key': 'BAR'})
         assert 'FOOBAR' == field.serialize('key', user)
 
+    def test_function_field_resolves_arguments_once(self, user, monkeypatch):
+        class Parent(Schema):
+            pass
+        field = fields.Function(
+            serialize=lambda obj, context: obj.name.upper() + context['key'],
+            deserialize=lambda value: value.lower(),
+        )
+        field.parent = Parent(context={'key': 'BAR'})
+
+        def fail(func):
+            raise AssertionError('Arguments should not be resolved again')
+        monkeypatch.setattr(utils, 'get_func_args', fail)
+        assert 'FOOBAR' == field.serialize('key', user)
+        assert 'foo' == field.deserialize('FOO')
+
     def test_function_field_passed_uncallable_object(self):
         with pytest.raises(ValueError):
             fields.Function('uncallable')
@@ -435,9 +450,8 @@ class TestFieldSerialization:
     def test_method_field_with_method_missing(self):
         class BadSerializer(Schema):
             bad_field = fields.Method('invalid')
-        u = User('Foo')
         with pytest.raises(ValueError):
-            BadSerializer().dump(u)
+            BadSerializer()
 
     def test_method_field_passed_serialize_only_is_dump_only(self, user):
         field = fields.Method(serialize='method')
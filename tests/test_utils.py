@@ -106,6 +106,80 @@ def test_get_value():
     assert utils.get_value(lst, MyInt(1)) == 2
 
 
+@pytest.mark.parametrize(
+    'obj', [
+        PointNT(24, 42),
+        PointClass(24, 42),
+        PointDict(24, 42),
+        {'x': 24, 'y': 42},
+    ],
+)
+def test_compile_accessor(obj):
+    get_x = utils.compile_accessor('x')
+    get_y = utils.compile_accessor('y')
+    get_z = utils.compile_accessor('z')
+    # Run twice to use the cached strategy for the type
+    for _ in range(2):
+        assert get_x(obj) == 24
+        assert get_y(obj) == 42
+        assert get_z(obj) is utils.missing
+        assert get_z(obj, 123) == 123
+
+def test_compile_accessor_for_nested_object():
+    tri = Triangle(p1=PointClass(1, 2), p2=PointNT(3, 4), p3={'x': 5, 'y': 6})
+    assert utils.compile_accessor('p1.x')(tri) == 1
+    assert utils.compile_accessor('p2.x')(tri) == 3
+    assert utils.compile_accessor('p3.x')(tri) == 5
+    assert utils.compile_accessor('p4.x')(tri, 123) == 123
+
+def test_compile_accessor_matches_get_value_for_mixed_types():
+    get_items = utils.compile_accessor('items')
+    get_first = utils.compile_accessor(1)
+    for obj in [{'items': [1]}, {}, [1, 2, 3], 'abc', PointClass(1, 2)]:
+        assert get_items(obj, None) == utils.get_value(obj, 'items', None)
+    for obj in [[1, 2, 3], (4, 5), {1: 'one'}]:
+        assert get_first(obj, None) == utils.get_value(obj, 1, None)
+
+class PointSlots(object):
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+@pytest.mark.parametrize('obj', [PointNT(24, 42), PointSlots(24, 42)])
+def test_get_source_fetcher_for_supported_types(obj):
+    fetch = utils.get_source_fetcher(obj, ['x', 'y', 'z'])
+    assert fetch(obj) == {'x': 24, 'y': 42, 'z': utils.missing}
+
+@pytest.mark.parametrize('obj', [PointClass(24, 42), PointDict(24, 42), {'x': 24}, (24, 42)])
+def test_get_source_fetcher_for_unsupported_types(obj):
+    assert utils.get_source_fetcher(obj, ['x']) is None
+
+def test_attribute_fetcher_with_missing_attribute():
+    fetch = utils.attribute_fetcher(PointSlots(24, 42), ['x', 'y'])
+    partial = PointSlots(24, 42)
+    del partial.y
+    assert fetch(partial) == {'x': 24, 'y': utils.missing}
+
+def test_item_fetcher():
+    fetch = utils.item_fetcher({}, ['x', 'y'])
+    assert fetch({'x': 24, 'y': 42}) == {'x': 24, 'y': 42}
+    assert fetch({'x': 24}) == {'x': 24, 'y': utils.missing}
+    assert utils.item_fetcher({}, ['x'])({'x': 24}) == {'x': 24}
+
+def test_register_source_adapter():
+    utils.register_source_adapter(PointDict, utils.item_fetcher)
+    try:
+        fetch = utils.get_source_fetcher(PointDict(24, 42), ['x', 'y'])
+        assert fetch(PointDict(1, 2)) == {'x': 1, 'y': 2}
+        utils.register_source_adapter(PointSlots, None)
+        assert utils.get_source_fetcher(PointSlots(24, 42), ['x']) is None
+    finally:
+        utils._source_adapters.pop(PointDict)
+        utils._source_adapters.pop(PointSlots)
+
 def test_set_value():
     d = {}
     utils.set_value(d, 'foo', 42)
@@ -124,6 +198,22 @@ def test_set_value():
         utils.set_value(d, 'foo.bar', 42)
 
 
+@pytest.mark.parametrize('key', ['foo', 'foo.bar', 'foo.bar.baz'])
+def test_compile_setter_matches_set_value(key):
+    setter = utils.compile_setter(key)
+    for initial in [{}, {'foo': {}}, {'foo': {'bar': {}}, 'qux': 1}]:
+        expected, d = deepcopy(initial), deepcopy(initial)
+        utils.set_value(expected, key, 42)
+        setter(d, 42)
+        assert d == expected
+
+def test_compile_setter_existing_value():
+    setter = utils.compile_setter('foo.bar.baz')
+    with pytest.raises(ValueError, match='Cannot set foo.bar.baz in foo'):
+        setter({'foo': 42}, 42)
+    with pytest.raises(ValueError, match='Cannot set bar.baz in bar'):
+        setter({'foo': {'bar': 42}}, 42)
+
 def test_is_keyed_tuple():
     Point = namedtuple('Point', ['x', 'y'])
     p = Point(24, 42)
@@ -233,6 +323,202 @@ def test_from_iso_date(use_dateutil):
     assert type(result) == dt.date
     assert_date_equal(result, d)
 
+@pytest.fixture(params=[True, False], ids=['fromisoformat', 'regex'])
+def iso_fast_path(request, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(utils, '_datetime_fromisoformat', None)
+        monkeypatch.setattr(utils, '_date_fromisoformat', None)
+        monkeypatch.setattr(utils, '_time_fromisoformat', None)
+    return request.param
+
+@pytest.mark.parametrize(
+    ('value', 'expected'), [
+        ('2013-11-10T01:23:45', dt.datetime(2013, 11, 10, 1, 23, 45)),
+        ('2013-11-10 01:23', dt.datetime(2013, 11, 10, 1, 23)),
+        ('2013-11-10T01:23:45.123', dt.datetime(2013, 11, 10, 1, 23, 45, 123000)),
+        ('2013-11-10T01:23:45.123456', dt.datetime(2013, 11, 10, 1, 23, 45, 123456)),
+        ('2013-11-10T01:23:45.1234567', dt.datetime(2013, 11, 10, 1, 23, 45, 123456)),
+        ('2013-1-9T1:23:45.12', dt.datetime(2013, 1, 9, 1, 23, 45, 120000)),
+    ],
+)
+def test_from_iso_datetime_naive(iso_fast_path, value, expected):
+    result = utils.from_iso_datetime(value)
+    assert result == expected
+    assert result.tzinfo is None
+
+@pytest.mark.parametrize(
+    ('value', 'offset'), [
+        ('2013-11-10T01:23:45Z', dt.timedelta(0)),
+        ('2013-11-10T01:23:45.123456+00:00', dt.timedelta(0)),
+        ('2013-11-10T01:23:45-06:00', dt.timedelta(hours=-6)),
+        ('2013-11-10T01:23:45+0530', dt.timedelta(hours=5, minutes=30)),
+        ('2013-11-10T01:23:45.5+02', dt.timedelta(hours=2)),
+    ],
+)
+def test_from_iso_datetime_with_offset(iso_fast_path, value, offset):
+    result = utils.from_iso_datetime(value)
+    assert result.utcoffset() == offset
+    if not offset:
+        assert result.tzinfo is utils.UTC
+    assert result.replace(tzinfo=None) == dt.datetime(
+        2013, 11, 10, 1, 23, 45, result.microsecond,
+    )
+
+@pytest.mark.parametrize(
+    'value', [
+        '2013-11-10',
+        '2013-11-10T01',
+        '20131110T012345',
+        '2013-W01-1T01:23:45',
+        '2013-11-10T01:23:45+',
+        '2013-13-10T01:23:45',
+        'not a datetime',
+    ],
+)
+def test_from_iso_datetime_invalid(iso_fast_path, value):
+    with pytest.raises(ValueError):
+        utils.from_iso_datetime(value)
+
+@pytest.mark.parametrize(
+    ('value', 'expected'), [
+        ('01:23', dt.time(1, 23)),
+        ('01:23:45', dt.time(1, 23, 45)),
+        ('1:23:45.12', dt.time(1, 23, 45, 120000)),
+        ('01:23:45.123456', dt.time(1, 23, 45, 123456)),
+    ],
+)
+def test_from_iso_time_native(iso_fast_path, value, expected):
+    result = utils.from_iso_time(value)
+    assert result == expected
+    assert result.tzinfo is None
+
+@pytest.mark.parametrize(
+    ('value', 'offset'), [
+        ('01:23:45Z', dt.timedelta(0)),
+        ('01:23:45.123456+00:00', dt.timedelta(0)),
+        ('01:23:45+06:00', dt.timedelta(hours=6)),
+        ('01:23:45-0530', dt.timedelta(hours=-5, minutes=-30)),
+    ],
+)
+def test_from_iso_time_with_offset(iso_fast_path, value, offset):
+    result = utils.from_iso_time(value)
+    assert result.utcoffset() == offset
+    if not offset:
+        assert result.tzinfo is utils.UTC
+    assert result.replace(tzinfo=None) == dt.time(1, 23, 45, result.microsecond)
+
+def test_from_iso_with_native_str_fraction(iso_fast_path):
+    # Native strings are bytes on Python 2
+    value = str('2013-11-10T01:23:45.5')
+    assert utils.from_iso_datetime(value) == dt.datetime(2013, 11, 10, 1, 23, 45, 500000)
+    assert utils.from_iso_time(value[11:]) == dt.time(1, 23, 45, 500000)
+    assert utils.from_iso_time(str('1:23:45.000123')) == dt.time(1, 23, 45, 123)
+
+@pytest.mark.parametrize('value', ['01:23:45 garbage', '25:00:00', '2013-11-10'])
+def test_from_iso_time_invalid(iso_fast_path, value):
+    with pytest.raises(ValueError):
+        utils.from_iso_time(value)
+
+@pytest.mark.parametrize(
+    ('value', 'expected'), [
+        ('2014-08-21', dt.date(2014, 8, 21)),
+        ('2014-8-1', dt.date(2014, 8, 1)),
+    ],
+)
+def test_from_iso_date_native(iso_fast_path, value, expected):
+    assert utils.from_iso_date(value) == expected
+
+@pytest.mark.parametrize('value', ['2014-W34-4', '2014-02-30', '20140821'])
+def test_from_iso_date_invalid(iso_fast_path, value):
+    with pytest.raises(ValueError):
+        utils.from_iso_date(value)
+
+def test_get_fixed_timezone():
+    tz = utils.get_fixed_timezone(-330)
+    assert tz.utcoffset(None) == dt.timedelta(hours=-5, minutes=-30)
+    assert tz.tzname(None) == '-0530'
+    assert utils.get_fixed_timezone(dt.timedelta(hours=2)).tzname(None) == '+0200'
+
+
+STRFTIME_FORMATS = [
+    '%Y%m%d%H%M%S',
+    '%Y-%m-%d %H:%M:%S.%f%z',
+    '%Y-%m-%dT%H:%M:%S%z',
+    '%d/%m/%Y',
+    '%H:%M',
+    '100%% at %Y',
+]
+
+@pytest.mark.parametrize('fmt', STRFTIME_FORMATS)
+@pytest.mark.parametrize(
+    'value', [
+        dt.datetime(2013, 11, 10, 1, 2, 3, 4567),
+        dt.datetime(2013, 1, 1, tzinfo=utils.get_fixed_timezone(-330)),
+        central.localize(dt.datetime(2013, 6, 1, 12)),
+        dt.datetime(999, 1, 1),
+        dt.date(2014, 8, 21),
+    ],
+)
+def test_compile_strftime_matches_strftime(fmt, value):
+    assert utils.compile_strftime(fmt)(value) == value.strftime(fmt)
+
+@pytest.mark.parametrize('fmt', STRFTIME_FORMATS)
+def test_compile_strptime_roundtrip(fmt):
+    value = central.localize(dt.datetime(2013, 11, 10, 1, 2, 3, 4567))
+    formatted = value.strftime(fmt)
+    result = utils.compile_strptime(fmt)(formatted)
+    expected = dt.datetime.strptime(formatted, fmt)
+    assert result == expected
+    assert result.utcoffset() == expected.utcoffset()
+
+@pytest.mark.parametrize(
+    ('value', 'fmt'), [
+        ('2013-11-10t01:02:03', '%Y-%m-%dT%H:%M:%S'),
+        ('2013  11', '%Y %m'),
+        ('20131', '%Y%m'),
+        ('2013-11-10T01:02:03Z', '%Y-%m-%dT%H:%M:%S%z'),
+        ('2013-11-10T01:02:03-05:30', '%Y-%m-%dT%H:%M:%S%z'),
+        ('2013-11-10T01:02:03+0530', '%Y-%m-%dT%H:%M:%S%z'),
+    ],
+)
+def test_compile_strptime_matches_strptime(value, fmt):
+    result = utils.compile_strptime(fmt)(value)
+    expected = dt.datetime.strptime(value, fmt)
+    assert result == expected
+    assert result.utcoffset() == expected.utcoffset()
+
+@pytest.mark.parametrize(
+    ('value', 'fmt'), [
+        ('2013 11x', '%Y %m'),
+        (' 2013', '%Y'),
+        ('2013-2-29', '%Y-%m-%d'),
+        ('2013-11-10T01:02:03z', '%Y-%m-%dT%H:%M:%S%z'),
+        ('2013-13-10', '%Y-%m-%d'),
+    ],
+)
+def test_compile_strptime_invalid(value, fmt):
+    with pytest.raises(ValueError):
+        utils.compile_strptime(fmt)(value)
+
+@pytest.mark.parametrize('fmt', ['%Y %b', '%c', '%Y%'])
+def test_compile_unsupported_formats(fmt):
+    assert utils.compile_strftime(fmt) is None
+    assert utils.compile_strptime(fmt) is None
+
+def test_compile_strptime_repeated_directive():
+    assert utils.compile_strptime('%Y %Y') is None
+
+def test_compile_strptime_native_str_fraction():
+    # Native strings are bytes on Python 2
+    strptime = utils.compile_strptime('%Y-%m-%d %H:%M:%S.%f')
+    result = strptime(str('2019-01-01 10:00:00.5'))
+    assert result == dt.datetime(2019, 1, 1, 10, 0, 0, 500000)
+
+def test_compile_strptime_offset_on_py2(monkeypatch):
+    monkeypatch.setattr(utils, 'PY2', True)
+    assert utils.compile_strptime('%Y-%m-%dT%H:%M:%S%z') is None
+    assert utils.compile_strptime('%Y-%m-%dT%H:%M:%S') is not None
+
 def test_get_func_args():
     def f1(foo, bar):
         pass
@@ -246,3 +532,24 @@ def test_get_func_args():
 
     for func in [f1, f2, f3]:
         assert utils.get_func_args(func) == ['foo', 'bar']
+
+def test_get_func_args_is_cached(monkeypatch):
+    class F(object):
+        def method(self, foo, bar):
+            pass
+
+    def f(foo):
+        pass
+
+    calls = []
+    inspect_signature = utils._inspect_signature
+    monkeypatch.setattr(
+        utils, '_inspect_signature', lambda func: calls.append(func) or inspect_signature(func),
+    )
+    for _ in range(3):
+        assert utils.get_func_args(F().method) == ['foo', 'bar']
+        assert utils.get_func_args(f) == ['foo']
+    assert len(calls) == 2
+    # Callers can't modify cached results
+    utils.get_func_args(f).append('bar')
+    assert utils.get_func_args(f) == ['foo']
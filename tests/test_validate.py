@@ -5,8 +5,8 @@ from __future__ import unicode_literals
 import re
 import pytest
 
-from marshmallow.compat import PY2
-from marshmallow import validate, ValidationError
+from marshmallow.compat import PY2, basestring, text_type
+from marshmallow import fields, validate, Schema, ValidationError
 
 @pytest.mark.parametrize(
     'valid_url', [
@@ -152,6 +152,29 @@ def test_url_custom_message():
         validator('invalid')
     assert "invalid ain't an URL" in str(excinfo)
 
+@pytest.mark.parametrize(
+    'url', [
+        'HTTP://EXAMPLE.ORG/',
+        'http://example.org/\n',
+        'http://localhost:8000/',
+        'http://example.org?',
+        'http://example.org#fragment',
+        'http://user@example.org/',
+    ],
+)
+def test_url_matches_full_regex(url):
+    validator = validate.URL(relative=True, require_tld=False)
+    regex = validator._regex(validator.relative, validator.require_tld)
+    assert (validator._check(url) is None) is bool(regex.search(url))
+
+def test_url_max_length():
+    url = 'http://example.org/'
+    validator = validate.URL()
+    path = 'a' * (validator.max_length - len(url))
+    assert validator(url + path) == url + path
+    with pytest.raises(ValidationError):
+        validator(url + path + 'a')
+
 def test_url_repr():
     assert (
         repr(validate.URL(relative=False, error=None)) ==
@@ -206,6 +229,14 @@ def test_email_invalid(invalid_email):
     with pytest.raises(ValidationError):
         validator(invalid_email)
 
+def test_email_max_length():
+    domain = '@' + '.'.join(['a' * 63] * 4)
+    validator = validate.Email()
+    user = 'u' * (validator.max_length - len(domain))
+    assert validator(user + domain) == user + domain
+    with pytest.raises(ValidationError):
+        validator('u' + user + domain)
+
 def test_email_custom_message():
     validator = validate.Email(error='{input} is not an email addy.')
     with pytest.raises(ValidationError) as excinfo:
@@ -612,6 +643,76 @@ def test_oneof_text():
     assert ', '.join(sorted(oneof.choices_text.split(', '))) == 'a, b'
     assert oneof.labels_text == ''
 
+def test_choices_text_is_built_when_read():
+    oneof = validate.OneOf([1, 2], ['one', 'two'])
+    none_of = validate.NoneOf([1, 2])
+    assert 'choices_text' not in vars(oneof)
+    assert 'values_text' not in vars(none_of)
+    with pytest.raises(ValidationError) as excinfo:
+        validate.OneOf([1, 2], error='{choices}')(3)
+    assert excinfo.value.messages == ['1, 2']
+    oneof.choices_text = 'custom'
+    assert oneof.choices_text == 'custom'
+
+def test_choices_with_unhashable_values():
+    # Unhashable values fall back to comparing with each choice
+    with pytest.raises(ValidationError):
+        validate.OneOf([1, 2])([1])
+    assert validate.NoneOf([1, 2])([1]) == [1]
+    with pytest.raises(ValidationError):
+        validate.NoneOf([[1], 2])([1])
+    assert validate.OneOf([[1], 2])(2) == 2
+    assert validate.OneOf([[1], 2])([1]) == [1]
+    assert validate.ContainsOnly([1, 2])([1, 2, 1]) == [1, 2, 1]
+    with pytest.raises(ValidationError):
+        validate.ContainsOnly([1, 2])([1, [2]])
+    assert validate.ContainsOnly([[1], 2])([[1], 2]) == [[1], 2]
+
+def test_changed_choices_are_used():
+    oneof = validate.OneOf(['a'])
+    assert oneof._index[1] == frozenset(['a'])
+    oneof.choices = ['b']
+    assert oneof('b') == 'b'
+    with pytest.raises(ValidationError):
+        oneof('a')
+    oneof = validate.OneOf(('a',))
+    assert oneof('a') == 'a'
+    oneof.choices = ('b',)
+    assert oneof('b') == 'b'
+    with pytest.raises(ValidationError):
+        oneof('a')
+    none_of = validate.NoneOf(('a',))
+    none_of.iterable = ('b',)
+    assert none_of('a') == 'a'
+
+def test_choices_are_compared_like_a_sequence():
+    class AnyText(object):
+        def __eq__(self, other):
+            return isinstance(other, basestring)
+
+        def __hash__(self):
+            return 0
+
+    assert validate.OneOf((AnyText(),))('a') == 'a'
+    assert validate.OneOf([AnyText()])('a') == 'a'
+    assert validate.ContainsOnly((AnyText(),))(['a', 'b']) == ['a', 'b']
+    with pytest.raises(ValidationError):
+        validate.NoneOf([AnyText()])('a')
+    assert validate.NoneOf([AnyText()])(1) == 1
+
+def test_choices_from_iterator_are_not_indexed():
+    oneof = validate.OneOf(iter(['a']))
+    assert oneof._index[1] is None
+    assert oneof('a') == 'a'
+
+def test_containsonly_iterates_input_once():
+    validator = validate.ContainsOnly((1, 2))
+    with pytest.raises(ValidationError) as excinfo:
+        validator(each for each in [1, [3]])
+    assert excinfo.value.messages == ['One or more of the choices you made was not acceptable.']
+    with pytest.raises(ValidationError):
+        validator(each for each in [1, 3])
+
 def test_oneof_custom_message():
     oneof = validate.OneOf([1, 2, 3], error='{input} is not one of {choices}')
     expected = '4 is not one of 1, 2, 3'
@@ -738,3 +839,159 @@ def test_containsonly_repr():
         '<ContainsOnly(choices=[1, 2, 3], labels={0!r}, error={1!r})>'
         .format(['a', 'b', 'c'], 'foo')
     )
+
+
+class NoFormatText(text_type):
+    """Text that fails the test if it is formatted."""
+
+    def __format__(self, spec):
+        pytest.fail('Value should not be formatted')
+
+
+@pytest.mark.parametrize(
+    ('validator', 'value'), [
+        (validate.URL(error='{input}'), 'http://example.org'),
+        (validate.Email(error='{input}'), 'user@example.com'),
+        (validate.Length(min=1, error='{input}'), 'a'),
+        (validate.Regexp('a', error='{input}'), 'a'),
+        (validate.Equal('a', error='{input}'), 'a'),
+        (validate.OneOf(['a'], error='{input}'), 'a'),
+        (validate.NoneOf(['b'], error='{input}'), 'a'),
+        (validate.Predicate('islower', error='{input}'), 'a'),
+    ],
+)
+def test_valid_input_is_not_formatted(validator, value):
+    value = NoFormatText(value)
+    assert validator(value) == value
+
+
+LENGTHS = ('', 'a', 'ab', 'abc', 'abcd')
+
+
+@pytest.mark.parametrize(
+    ('validator', 'values'), [
+        (validate.Range(min=1), range(5)),
+        (validate.Range(max=3), range(5)),
+        (validate.Range(min=1, max=3, error='{input} not in {min}..{max}'), range(5)),
+        (validate.Length(min=1), LENGTHS),
+        (validate.Length(max=3), LENGTHS),
+        (validate.Length(min=1, max=3), LENGTHS),
+        (validate.Length(equal=2, error='{input} is not {equal} long'), LENGTHS),
+        (validate.Regexp('[ab]'), ('a', 'b', 'c')),
+    ],
+)
+def test_compiled_check_matches_check(validator, values):
+    check = validator._compile_check()
+    for value in values:
+        expected, result = validator._check(value), check(value)
+        if expected is None:
+            assert result is None
+        else:
+            assert result.messages == expected.messages
+
+
+def test_check_calls_validators_implementing_call():
+    class Even(validate.Validator):
+        def __call__(self, value):
+            if value % 2:
+                raise ValidationError('Odd.')
+            return value
+
+    validator = Even()
+    assert validator._check(2) is None
+    assert validator._check(3).messages == ['Odd.']
+    assert validator._compile_check()(3).messages == ['Odd.']
+    with pytest.raises(NotImplementedError):
+        validate.Validator()(1)
+
+
+def test_format_error_can_be_overridden():
+    class MyLength(validate.Length):
+        def _format_error(self, value, message):
+            return 'Got {} items.'.format(len(value))
+
+    class MyOneOf(validate.OneOf):
+        def _format_error(self, value):
+            return '{} is not an option.'.format(value)
+
+    with pytest.raises(ValidationError) as excinfo:
+        MyLength(max=1)('abc')
+    assert excinfo.value.messages == ['Got 3 items.']
+    assert MyOneOf(['a'])._compile_check()('b').messages == ['b is not an option.']
+
+
+def test_error_messages_do_not_change_with_input():
+    value = [1, 2]
+    error = validate.Length(max=1, error='{input} is too long.')._check(value)
+    value.append(3)
+    assert error.messages == ['[1, 2] is too long.']
+
+
+class TestValidatorCache:
+
+    def test_caching_is_disabled_by_default(self):
+        assert validate.URL().cache_info() is None
+        assert validate.Range(min=1).cache_info() is None
+
+    @pytest.mark.parametrize(
+        ('validator', 'valid', 'invalid'), [
+            (validate.URL(cache_size=8), 'http://example.org', 'example'),
+            (validate.Email(cache_size=8), 'user@example.org', 'user'),
+            (validate.Regexp('a', cache_size=8), 'a', 'b'),
+            (validate.OneOf(['a'], cache_size=8), 'a', 'b'),
+            (validate.NoneOf(['b'], cache_size=8), 'a', 'b'),
+        ],
+    )
+    def test_results_are_cached(self, validator, valid, invalid):
+        for _ in range(3):
+            assert validator(valid) == valid
+            with pytest.raises(ValidationError) as excinfo:
+                validator(invalid)
+        uncached = type(validator).__new__(type(validator))
+        uncached.__dict__.update(
+            (key, value) for key, value in vars(validator).items()
+            if key not in ('_cache', '_check')
+        )
+        with pytest.raises(ValidationError) as expected:
+            uncached(invalid)
+        assert excinfo.value.messages == expected.value.messages
+        info = validator.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (4, 2, 2)
+
+    def test_cached_errors_are_not_shared(self):
+        validator = validate.OneOf(['a'], cache_size=8)
+        errors = [validator._check('b') for _ in range(2)]
+        assert errors[0] is not errors[1]
+        errors[0].messages.append('Changed.')
+        assert validator._check('b').messages == ['Not a valid choice.']
+
+    def test_values_are_keyed_by_type(self):
+        validator = validate.OneOf([1], error='{input}', cache_size=8)
+        assert validator(1) == 1
+        assert validator(True) is True
+        with pytest.raises(ValidationError) as excinfo:
+            validator(2.0)
+        assert excinfo.value.messages == ['2.0']
+        assert validator.cache_info().misses == 3
+
+    def test_unhashable_values_are_not_cached(self):
+        validator = validate.ContainsOnly(['a', 'b'], cache_size=8)
+        assert validator(['a', 'b']) == ['a', 'b']
+        assert validator(('a', 'b')) == ('a', 'b')
+        info = validator.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (0, 1, 1)
+
+    def test_cache_is_bounded(self):
+        validator = validate.Email(cache_size=2)
+        for value in ('a@example.org', 'b@example.org', 'c@example.org'):
+            validator(value)
+        info = validator.cache_info()
+        assert (info.evictions, info.currsize) == (1, 2)
+
+    def test_cache_is_used_by_fields(self):
+        validator = validate.URL(cache_size=8)
+        field = fields.Str(validate=validator)
+        field._bind_to_schema('url', Schema())
+        for _ in range(2):
+            field.deserialize('http://example.org')
+        assert validator.cache_info().hits == 1